@@ -9,6 +9,8 @@ from sentry_sdk.integrations.flask import FlaskIntegration
 
 from application.routes.router import router, limiter
 from config import Settings
+from quyca.application.json_provider import OrjsonProvider
+from quyca.infrastructure import mongo
 
 
 def create_app() -> Flask:
@@ -23,6 +25,7 @@ def create_app() -> Flask:
     project_dir = os.path.dirname(os.path.abspath(__file__))
     static_dir = os.path.join(project_dir, "application", "static")
     app_factory = Flask(__name__, static_folder=static_dir)
+    app_factory.json = OrjsonProvider(app_factory)
 
     app_factory.config["JWT_SECRET_KEY"] = app_settings.JWT_SECRET_KEY
     app_factory.config["JWT_ACCESS_TOKEN_EXPIRES"] = app_settings.JWT_ACCESS_TOKEN_EXPIRES
@@ -35,6 +38,8 @@ def create_app() -> Flask:
     CORS(app_factory)
     app_factory.register_blueprint(router)
     Compress(app_factory)
+
+    mongo.warm_up()
     return app_factory
 
 
@@ -0,0 +1,116 @@
+import dataclasses
+import decimal
+import uuid
+from datetime import date
+from typing import Any, Generator
+
+import orjson
+from bson import ObjectId
+from flask import Response, current_app, stream_with_context
+from flask.json.provider import DefaultJSONProvider
+from werkzeug.http import http_date
+
+STREAM_CHUNK_SIZE = 50
+INT64_MIN = -(2**63)
+UINT64_MAX = 2**64 - 1
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, date):
+        return http_date(value)
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    if dataclasses.is_dataclass(value):
+        return dataclasses.asdict(value)  # type: ignore
+    if hasattr(value, "__html__"):
+        return str(value.__html__())
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def encode_big_ints(value: Any) -> Any:
+    """Copy of the value where the integers orjson can not encode, the ones over 64 bits, are raw JSON numbers."""
+    if isinstance(value, dict):
+        return {key: encode_big_ints(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [encode_big_ints(item) for item in value]
+    if isinstance(value, int) and not isinstance(value, bool) and not INT64_MIN <= value <= UINT64_MAX:
+        return orjson.Fragment(str(value))
+    return value
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that encodes the responses with orjson.
+
+    The output matches the default provider: sorted keys, dates in HTTP format and ObjectIds as strings.
+    NaN is encoded as null, as clean_nan already does for the models. The integers bigger than 64 bits,
+    which orjson rejects without calling default, are encoded as raw numbers on a second pass.
+    """
+
+    default = staticmethod(default)  # type: ignore
+
+    def get_options(self, pretty: bool = False) -> int:
+        options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SERIALIZE_NUMPY
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        if pretty:
+            options |= orjson.OPT_INDENT_2
+        return options
+
+    def is_pretty(self) -> bool:
+        return (self.compact is None and self._app.debug) or self.compact is False
+
+    def dumps_bytes(self, obj: Any, pretty: bool = False) -> bytes:
+        options = self.get_options(pretty)
+        try:
+            return orjson.dumps(obj, default=self.default, option=options)
+        except orjson.JSONEncodeError:
+            return orjson.dumps(encode_big_ints(obj), default=self.default, option=options)
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return self.dumps_bytes(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.dumps_bytes(obj, self.is_pretty()) + b"\n", mimetype=self.mimetype)
+
+    def generate(self, obj: Any) -> Generator:
+        """
+        Encodes the object by parts, the lists of a top level dict are yielded in chunks of STREAM_CHUNK_SIZE items.
+        """
+        if not isinstance(obj, dict):
+            yield self.dumps_bytes(obj) + b"\n"
+            return
+        yield b"{"
+        keys = sorted(obj) if self.sort_keys else list(obj)
+        for index, key in enumerate(keys):
+            yield (b"," if index else b"") + self.dumps_bytes(str(key)) + b":"
+            value = obj[key]
+            if not isinstance(value, list):
+                yield self.dumps_bytes(value)
+                continue
+            yield b"["
+            for start in range(0, len(value), STREAM_CHUNK_SIZE):
+                chunk = self.dumps_bytes(value[start : start + STREAM_CHUNK_SIZE])[1:-1]
+                yield (b"," if start else b"") + chunk
+            yield b"]"
+        yield b"}\n"
+
+
+def stream_jsonify(data: Any) -> Response:
+    provider = current_app.json
+    if not isinstance(provider, OrjsonProvider) or provider.is_pretty():
+        return current_app.json.response(data)
+    return Response(stream_with_context(provider.generate(data)), mimetype=provider.mimetype)
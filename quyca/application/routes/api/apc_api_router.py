@@ -6,7 +6,7 @@ from flask import Blueprint, request, jsonify, Response
 from sentry_sdk import capture_exception
 
 from domain.models.base_model import QueryParams
-from infrastructure.mongo import database
+from quyca.infrastructure.mongo import database
 
 apc_api_router = Blueprint("apc_api_router", __name__)
 
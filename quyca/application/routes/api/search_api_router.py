@@ -5,6 +5,7 @@ from sentry_sdk import capture_exception
 
 from domain.models.base_model import QueryParams
 from domain.services import api_expert_service
+from quyca.application.json_provider import stream_jsonify
 
 search_api_router = Blueprint("search_api_router", __name__)
 
@@ -19,7 +20,7 @@ def search_works() -> Response | Tuple[Response, int]:
     try:
         query_params = QueryParams(**request.args)
         data = api_expert_service.search_works(query_params)
-        return jsonify(data)
+        return stream_jsonify(data)
     except Exception as e:
         capture_exception(e)
         return jsonify({"error": str(e)}), 400
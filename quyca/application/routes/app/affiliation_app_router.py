@@ -1,7 +1,7 @@
 import json
 from typing import Tuple
 
-from flask import Blueprint, request, Response, jsonify
+from flask import Blueprint, request, Response, jsonify, stream_with_context
 from sentry_sdk import capture_exception
 
 from domain.models.base_model import QueryParams
@@ -71,6 +71,9 @@ def get_affiliation_affiliations(affiliation_type: str, affiliation_id: str) ->
 
 @apiParam {String} affiliation_type Tipo de afiliación (ej. "institution", "department").
 @apiParam {String} affiliation_id ID de la afiliación.
+@apiParam {String} [cursor] Cursor de paginación, "*" para la primera página y luego el valor de next_cursor de la respuesta anterior. Reemplaza a page.
+@apiParam {String} [plots] Lista de gráficos separados por coma, se devuelven todos en una sola respuesta.
+@apiParam {String} [map_format] "counts" para que los gráficos de mapa devuelvan solo los conteos por id de feature y la url versionada de la geometría.
 """
 
 
@@ -81,6 +84,9 @@ def get_affiliation_research_products(affiliation_id: str, affiliation_type: str
         if query_params.plot:
             data = affiliation_plot_service.get_affiliation_plot(affiliation_id, affiliation_type, query_params)
             return jsonify(data)
+        if query_params.plots:
+            data = affiliation_plot_service.get_affiliation_plots(affiliation_id, affiliation_type, query_params)
+            return jsonify(data)
         data = work_service.get_works_by_affiliation(affiliation_id, query_params)
         return jsonify(data)
     except Exception as e:
@@ -97,6 +103,7 @@ def get_affiliation_research_products(affiliation_id: str, affiliation_type: str
 
 @apiParam {String} affiliation_type Tipo de afiliación (ej. "institution", "department").
 @apiParam {String} affiliation_id ID de la afiliación.
+@apiParam {Boolean} [counts] Si es true, cada valor de los filtros incluye el número de productos que lo tienen.
 """
 
 
@@ -130,7 +137,7 @@ def get_works_csv_by_affiliation(affiliation_type: str, affiliation_id: str) ->
     try:
         query_params = QueryParams(**request.args)
         data = csv_service.get_works_csv_by_affiliation(affiliation_id, query_params, affiliation_type)
-        response = Response(data, content_type="text/csv")
+        response = Response(stream_with_context(data), content_type="text/csv")
         response.headers["Content-Disposition"] = "attachment; filename=affiliation.csv"
         return response
     except Exception as e:
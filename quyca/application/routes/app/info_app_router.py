@@ -1,6 +1,6 @@
 from typing import Tuple
 
-from flask import Blueprint, jsonify, Response
+from flask import Blueprint, jsonify, request, Response
 from sentry_sdk import capture_exception
 
 from domain.services import (
@@ -18,3 +18,50 @@ def get_info() -> Response | Tuple[Response, int]:
     except Exception as e:
         capture_exception(e)
         return jsonify({"error": str(e)}), 400
+
+
+"""
+@api {get} /app/info/metrics Get worker metrics
+@apiName GetMetrics
+@apiGroup Info
+@apiVersion 1.0.0
+@apiDescription Aciertos y fallos de las cachés y uso del pool de consultas del worker que atiende la petición.
+"""
+
+
+@info_app_router.route("/info/metrics", methods=["GET"])
+def get_metrics() -> Response | Tuple[Response, int]:
+    try:
+        data = info_service.get_metrics()
+        return jsonify(data)
+    except Exception as e:
+        capture_exception(e)
+        return jsonify({"error": str(e)}), 400
+
+
+"""
+@api {get} /app/maps/:map_name Get map geometry
+@apiName GetMapGeometry
+@apiGroup Info
+@apiVersion 1.0.0
+@apiDescription Geometría GeoJSON de los gráficos de mapa pedidos con map_format=counts. Cada feature trae el id con el que se cruzan los conteos.
+
+@apiParam {String} map_name Nombre del mapa ("countries" o "colombian_departments").
+@apiParam {String} [v] Versión de la geometría, la respuesta se puede cachear indefinidamente mientras no cambie.
+"""
+
+
+@info_app_router.route("/maps/<map_name>", methods=["GET"])
+def get_map_geometry(map_name: str) -> Response | Tuple[Response, int]:
+    try:
+        geometry, version = info_service.get_map_geometry(map_name)
+        response = Response(geometry, content_type="application/json")
+        response.set_etag(version)
+        if request.args.get("v") == version:
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        else:
+            response.headers["Cache-Control"] = "public, no-cache"
+        return response.make_conditional(request)
+    except Exception as e:
+        capture_exception(e)
+        return jsonify({"error": str(e)}), 400
@@ -1,6 +1,6 @@
 from typing import Tuple
 
-from flask import Blueprint, request, Response, jsonify
+from flask import Blueprint, request, Response, jsonify, stream_with_context
 from sentry_sdk import capture_exception
 
 from quyca.domain.models.base_model import QueryParams
@@ -45,6 +45,9 @@ def get_person_by_id(person_id: str, pipeline_params: dict = {}) -> Response | T
 @apiDescription Obtiene los productos bibliográficos de un autor.
 
 @apiParam {String} person_id ID del autor.
+@apiParam {String} [cursor] Cursor de paginación, "*" para la primera página y luego el valor de next_cursor de la respuesta anterior. Reemplaza a page.
+@apiParam {String} [plots] Lista de gráficos separados por coma, se devuelven todos en una sola respuesta.
+@apiParam {String} [map_format] "counts" para que los gráficos de mapa devuelvan solo los conteos por id de feature y la url versionada de la geometría.
 """
 
 
@@ -55,6 +58,9 @@ def get_person_research_products(person_id: str) -> Response | Tuple[Response, i
         if query_params.plot:
             data = person_plot_service.get_person_plot(person_id, query_params)
             return jsonify(data)
+        if query_params.plots:
+            data = person_plot_service.get_person_plots(person_id, query_params)
+            return jsonify(data)
         data = work_service.get_works_by_person(person_id, query_params)
         return jsonify(data)
     except Exception as e:
@@ -70,6 +76,7 @@ def get_person_research_products(person_id: str) -> Response | Tuple[Response, i
 @apiDescription Obtiene los filtros disponibles en los productos bibliográficos de un autor.
 
 @apiParam {String} person_id ID del autor.
+@apiParam {Boolean} [counts] Si es true, cada valor de los filtros incluye el número de productos que lo tienen.
 """
 
 
@@ -100,7 +107,7 @@ def get_works_csv_by_person(person_id: str) -> Response | Tuple[Response, int]:
     try:
         query_params = QueryParams(**request.args)
         data = csv_service.get_works_csv_by_person(person_id, query_params)
-        response = Response(data, content_type="text/csv")
+        response = Response(stream_with_context(data), content_type="text/csv")
         response.headers["Content-Disposition"] = "attachment; filename=affiliation.csv"
         return response
     except Exception as e:
@@ -43,6 +43,8 @@ def search_persons() -> Response | Tuple[Response, int]:
 @apiVersion 1.0.0
 
 @apiDescription Búsqueda de productos bibliográficos por palabra clave.
+
+@apiParam {String} [cursor] Cursor de paginación, "*" para la primera página y luego el valor de next_cursor de la respuesta anterior. Reemplaza a page.
 """
 
 
@@ -64,6 +66,8 @@ def search_works() -> Response | Tuple[Response, int]:
 @apiVersion 1.0.0
 
 @apiDescription Filtros disponibles en la búsqueda de productos bibliográficos por palabra clave.
+
+@apiParam {Boolean} [counts] Si es true, cada valor de los filtros incluye el número de productos que lo tienen.
 """
 
 
@@ -7,30 +7,30 @@ from domain.services.staff_service import StaffService
 
 staff_app_router = Blueprint("staff_app_router", __name__)
 """
-@api {post} /app/staff
+@api {post} /app/submit/staff
 @apiName PostStaffFile
 @apiGroup Staff
 @apiVersion 1.0.0
 @apiDescription Permite subir un archivo Excel con la información de personal (staff).  
-El sistema valida el archivo, genera un reporte PDF (en base64) y, si no hay errores, lo guarda en Google Drive.
+El archivo se procesa en segundo plano: el sistema lo valida, genera un reporte PDF (en base64), lo envía por correo y, si no hay errores, lo guarda en Google Drive.
+La respuesta devuelve el id del trabajo, su resultado se consulta en /app/submit/staff/:job_id.
 
 @apiHeader {String} Authorization Token JWT en el header con el formato: "Bearer <token>".
 
-@apiBody {File} file Archivo Excel (.xlsx) con la información del staff.  
+@apiBody {File} file Archivo Excel (.xlsx) con la información del staff, de máximo 15 MB.  
 Debe incluir las columnas requeridas: tipo_documento, identificación, primer_apellido, nombres, tipo_contrato, jornada_laboral, fecha_nacimiento, fecha_inicial_vinculación, código_unidad_académica, unidad_académica.
 
-@apiSuccess {Boolean} success Indica si la validación fue exitosa (no hay errores).
-@apiSuccess {Number} errores Número de errores encontrados en el archivo.
-@apiSuccess {Number} duplicados Número de registros duplicados detectados.
-@apiSuccess {String} pdf_base64 Reporte en formato PDF codificado en Base64.
+@apiSuccess {Boolean} success Indica si el archivo fue recibido.
+@apiSuccess {String} job_id Id del trabajo que procesa el archivo.
+@apiSuccess {String} status Estado del trabajo.
 
 @apiSuccessExample {json} Respuesta exitosa:
-HTTP/1.1 200 OK
+HTTP/1.1 202 Accepted
 {
     "success": true,
-    "errores": 0,
-    "duplicados": 2,
-    "pdf_base64": "JVBERi0xLjQKJ..."
+    "job_id": "6710c2f5e4b0a1a2b3c4d5e6",
+    "status": "pending",
+    "msg": "Archivo recibido"
 }
 
 @apiError {Boolean} success Indica si la validación falló.
@@ -50,13 +50,11 @@ HTTP/1.1 400 Bad Request
     "msg": "Archivo requerido"
 }
 
-@apiErrorExample {json} Respuesta error por errores en el archivo:
-HTTP/1.1 400 Bad Request
+@apiErrorExample {json} Respuesta error por archivo de más de 15 MB:
+HTTP/1.1 413 Payload Too Large
 {
     "success": false,
-    "errores": 3,
-    "duplicados": 1,
-    "pdf_base64": "JVBERi0xLjQKJ..."
+    "msg": "El archivo supera el tamaño máximo permitido de 15 MB"
 }
 """
 
@@ -77,8 +75,73 @@ def submit_staff():
     file = request.files.get("file")
     upload_date = datetime.now(ZoneInfo("America/Bogota")).strftime("%d/%m/%Y %H:%M")
 
-    process_usecase, save_usecase, user_repo = build_staff_service()
-    service = StaffService(process_usecase, save_usecase, user_repo)
+    service = StaffService(*build_staff_service())
 
     result, status = service.handle_staff_upload(file, claims, token_from_header, upload_date)
     return jsonify(result), status
+
+
+"""
+@api {get} /app/submit/staff/:job_id
+@apiName GetStaffJob
+@apiGroup Staff
+@apiVersion 1.0.0
+@apiDescription Obtiene el estado del procesamiento de un archivo de staff. Responde 202 mientras el trabajo está en curso y 200 cuando terminó.
+El resultado de la validación y el PDF están disponibles en result apenas termina la validación, aunque el correo o la subida a Google Drive sigan en curso.
+
+@apiHeader {String} Authorization Token JWT en el header con el formato: "Bearer <token>".
+
+@apiParam {String} job_id Id del trabajo devuelto al subir el archivo.
+
+@apiSuccess {String} status Estado del trabajo: pending, processing, done o error.
+@apiSuccess {Number} status_code Código con el que se habría respondido la validación (200, 400 o 422).
+@apiSuccess {Object} result Resultado de la validación: success, errores, duplicados, pdf_base64 y file_msg.
+@apiSuccess {Object} delivery Estado, intentos y último error del envío del correo (email) y de la subida a Google Drive (drive).
+
+@apiSuccessExample {json} Respuesta exitosa:
+HTTP/1.1 200 OK
+{
+    "success": true,
+    "job_id": "6710c2f5e4b0a1a2b3c4d5e6",
+    "status": "done",
+    "status_code": 200,
+    "result": {
+        "success": true,
+        "errores": 0,
+        "duplicados": 2,
+        "pdf_base64": "JVBERi0xLjQKJ...",
+        "file_msg": "Archivo staff_xxx.xlsx guardado correctamente."
+    },
+    "delivery": {
+        "email": {"status": "done", "attempts": 1, "error": null},
+        "drive": {"status": "done", "attempts": 1, "error": null, "msg": "Archivo staff_xxx.xlsx guardado correctamente."}
+    },
+    "error": null
+}
+
+@apiErrorExample {json} Respuesta error por trabajo inexistente:
+HTTP/1.1 404 Not Found
+{
+    "success": false,
+    "msg": "Trabajo no encontrado"
+}
+"""
+
+
+@staff_app_router.route("/staff/<job_id>", methods=["GET"])
+def get_staff_job(job_id: str):
+    try:
+        verify_jwt_in_request()
+        claims = get_jwt()
+    except Exception:
+        return jsonify({"success": False, "msg": "Token inválido o expirado"}), 401
+
+    auth_header = request.headers.get("Authorization", None)
+    if not auth_header or not auth_header.startswith("Bearer "):
+        return jsonify({"success": False, "msg": "Token no encontrado en headers"}), 401
+
+    token_from_header = auth_header.split(" ")[1]
+    service = StaffService(*build_staff_service())
+
+    result, status = service.get_job_status(job_id, claims, token_from_header)
+    return jsonify(result), status
@@ -1,6 +1,7 @@
 import io
 import base64
 import pandas as pd
+from domain.models.staff_report_model import StaffReport
 from domain.validators.staff_validator import StaffValidator
 from domain.services.staff_report_service import StaffReportService
 from infrastructure.notifications.staff_notification import StaffNotification
@@ -18,37 +19,62 @@ class ProcessStaffFileUseCase:
     def execute(
         self, file: io.BytesIO, institution: str, filename: str, upload_date: str, user: str, email: str
     ) -> dict:
+        result, staff_report, attachments = self.build_report(file, institution, filename, upload_date, user)
+
+        if staff_report:
+            self.notification_service.send_report(
+                staff_report, institution, filename, upload_date, user, email, attachments
+            )
+
+        return result
+
+    """
+    Validates the file and generates its report, without sending it. The staff report is None when the file
+    was rejected before validating its rows.
+    """
+
+    def build_report(
+        self, file: io.BytesIO, institution: str, filename: str, upload_date: str, user: str
+    ) -> tuple[dict, StaffReport | None, list[dict]]:
         df = pd.read_excel(file)
 
         valid, errores_columnas, _ = StaffValidator.validate_columns(df)
 
         if not valid:
-            return {
-                "success": False,
-                "errores": len(errores_columnas),
-                "duplicados": 0,
-                "msg": "El archivo enviado no cumple con el formato requerido de columnas",
-                "detalles": errores_columnas,
-            }
+            return (
+                {
+                    "success": False,
+                    "errores": len(errores_columnas),
+                    "duplicados": 0,
+                    "msg": "El archivo enviado no cumple con el formato requerido de columnas",
+                    "detalles": errores_columnas,
+                },
+                None,
+                [],
+            )
 
         if df.empty or df.dropna(how="all").empty:
-            return {"success": False, "msg": "El archivo cargado está vacío. Verifique que contenga información."}
+            return (
+                {"success": False, "msg": "El archivo cargado está vacío. Verifique que contenga información."},
+                None,
+                [],
+            )
 
         staff_report, attachments = self.report_service.generate_report(df, institution, filename, upload_date, user)
 
-        self.notification_service.send_report(
-            staff_report, institution, filename, upload_date, user, email, attachments
-        )
-
         pdf_base64 = None
         for att in attachments:
             if att["filename"].endswith(".pdf"):
-                pdf_base64 = base64.b64encode(att["bytes"].read()).decode()
+                pdf_base64 = base64.b64encode(att["bytes"].getvalue()).decode()
                 break
 
-        return {
-            "success": staff_report.total_errores == 0,
-            "errores": staff_report.total_errores,
-            "duplicados": staff_report.total_duplicados,
-            "pdf_base64": pdf_base64,
-        }
+        return (
+            {
+                "success": staff_report.total_errores == 0,
+                "errores": staff_report.total_errores,
+                "duplicados": staff_report.total_duplicados,
+                "pdf_base64": pdf_base64,
+            },
+            staff_report,
+            attachments,
+        )
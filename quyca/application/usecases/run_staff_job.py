@@ -0,0 +1,123 @@
+import io
+import time
+from typing import Any, Callable, Dict
+
+from sentry_sdk import capture_exception
+from werkzeug.datastructures import FileStorage
+
+from application.usecases.process_staff_file import ProcessStaffFileUseCase
+from application.usecases.save_staff_file import SaveStaffFileUseCase
+from domain.repositories.staff_job_repository_interface import IStaffJobRepository
+
+
+class RunStaffJobUseCase:
+    def __init__(
+        self,
+        process_usecase: ProcessStaffFileUseCase,
+        save_usecase: SaveStaffFileUseCase,
+        job_repo: IStaffJobRepository,
+        max_attempts: int = 3,
+        retry_delay: float = 5,
+        lease: int = 900,
+    ):
+        self.process_usecase = process_usecase
+        self.save_usecase = save_usecase
+        self.job_repo = job_repo
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.lease = lease
+
+    """
+    Use case: process an uploaded staff file in the background. The result and the PDF are stored as soon as the
+    validation finishes, then the email and the Drive upload are retried until they succeed or run out of attempts.
+    A job taken over from another worker skips the deliveries that were already done. The lease of the job is
+    renewed before each step, so a slow job is not taken over while its worker is still running it.
+    """
+
+    def execute(self, job_id: str) -> None:
+        job = self.job_repo.claim_job(job_id, self.lease)
+        if not job:
+            return
+        try:
+            content = self.job_repo.get_file(job_id)
+            if content is None:
+                raise ValueError("El archivo del trabajo ya no está disponible")
+            file = FileStorage(stream=io.BytesIO(content), filename=job["filename"])
+            result, staff_report, attachments = self.process_usecase.build_report(
+                file, job["institution"], job["filename"], job["upload_date"], job["user"]
+            )
+            status_code = get_status_code(result)
+            self.job_repo.update_job(job_id, {"result": result, "status_code": status_code})
+
+            delivery = job["delivery"]
+            if staff_report and delivery["email"]["status"] != "done":
+                self.deliver(
+                    job_id,
+                    delivery,
+                    "email",
+                    lambda: self.process_usecase.notification_service.send_report(
+                        staff_report,
+                        job["institution"],
+                        job["filename"],
+                        job["upload_date"],
+                        job["user"],
+                        job["email"],
+                        attachments,
+                    ),
+                )
+
+            if result["success"]:
+                if delivery["drive"]["status"] != "done":
+                    save_result = self.deliver(
+                        job_id, delivery, "drive", lambda: self.save_file(file, job["ror_id"], job["institution"])
+                    )
+                    if not save_result:
+                        self.job_repo.renew_lease(job_id, self.lease)
+                        save_result = self.save_file(file, job["ror_id"], job["institution"], fallback=True)
+                    delivery["drive"]["msg"] = save_result.get("msg")
+                result.update({"file_msg": delivery["drive"].get("msg")})
+
+            self.job_repo.update_job(
+                job_id, {"status": "done", "result": result, "delivery": delivery}, unset=["locked_until"]
+            )
+        except Exception as e:
+            capture_exception(e)
+            self.job_repo.update_job(job_id, {"status": "error", "error": str(e)}, unset=["locked_until"])
+        try:
+            self.job_repo.delete_file(job_id)
+        except Exception as e:
+            capture_exception(e)
+
+    def save_file(self, file: FileStorage, ror_id: str, institution: str, fallback: bool = False) -> Dict[str, Any]:
+        file.stream.seek(0)
+        return self.save_usecase.execute(file, ror_id, institution, fallback=fallback)
+
+    """Runs the step until it returns success, waiting twice as long before each new attempt"""
+
+    def deliver(
+        self, job_id: str, delivery: Dict[str, Any], step: str, send: Callable[[], Dict[str, Any]]
+    ) -> Dict[str, Any] | None:
+        for attempt in range(1, self.max_attempts + 1):
+            self.job_repo.renew_lease(job_id, self.lease)
+            try:
+                response = send()
+                error = None if response.get("success") else response.get("error") or response.get("msg")
+            except Exception as e:
+                response, error = None, str(e)
+            done = error is None
+            status = "done" if done else ("failed" if attempt == self.max_attempts else "retrying")
+            delivery[step].update({"status": status, "attempts": attempt, "error": error})
+            self.job_repo.update_job(job_id, {f"delivery.{step}": delivery[step]})
+            if done:
+                return response
+            if attempt < self.max_attempts:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+        return None
+
+
+def get_status_code(result: dict) -> int:
+    if result["success"]:
+        return 200
+    if result.get("msg", "").startswith("El archivo enviado no cumple con el formato requerido de columnas"):
+        return 422
+    return 400
@@ -8,7 +8,9 @@ class SaveStaffFileUseCase:
 
     """Saves the uploaded file into Google Drive for the corresponding institution"""
 
-    def execute(self, file, ror_id: str, institution: str, file_type: str = "staff") -> Dict[str, str]:
+    def execute(
+        self, file, ror_id: str, institution: str, file_type: str = "staff", fallback: bool = True
+    ) -> Dict[str, str]:
         if not hasattr(file, "save"):
             raise TypeError("El objeto 'file' debe ser un FileStorage compatible.")
         if not ror_id:
@@ -24,4 +26,4 @@ class SaveStaffFileUseCase:
         except Exception:
             pass
 
-        return self.file_repo.save_file(file, ror_id, institution, file_type)
+        return self.file_repo.save_file(file, ror_id, institution, file_type, fallback)
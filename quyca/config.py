@@ -37,6 +37,10 @@ class Settings(BaseSettings):
     MONGO_CALCULATIONS_DATABASE: str
     MONGO_IMPACTU_DATABASE: str
     MONGO_URI: Optional[MongoDsn] = None
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_COMPRESSORS: str = ""
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = 30000
 
     ES_SERVER: str
     ES_USERNAME: str
@@ -49,6 +53,23 @@ class Settings(BaseSettings):
 
     API_LIMITS: str
 
+    SEARCH_COUNT_LIMIT: int = 0
+    SEARCH_FACET_MAX_LIMIT: int = 100
+
+    CACHE_ENABLED: bool = True
+    CACHE_LOCAL_SIZE: int = 512
+    CACHE_LOCAL_BYTES: int = 64 * 1024 * 1024
+    CACHE_SHARED_TTL: int = 604800
+    CACHE_VERSION_TTL: int = 60
+
+    QUERY_EXECUTOR_MAX_WORKERS: int = 8
+
+    STAFF_JOB_WORKERS: int = 2
+    STAFF_JOB_MAX_ATTEMPTS: int = 3
+    STAFF_JOB_RETRY_DELAY: int = 5
+    STAFF_JOB_LEASE: int = 900
+    STAFF_JOB_TTL: int = 604800
+
     SENTRY_DSN: str
 
     LOCAL_STORAGE_PATH: str
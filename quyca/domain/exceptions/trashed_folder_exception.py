@@ -0,0 +1,2 @@
+class TrashedFolderException(Exception):
+    pass
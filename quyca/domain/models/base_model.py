@@ -1,3 +1,4 @@
+import re
 from typing import Generator
 from datetime import datetime, timezone
 from pydantic import BaseModel, field_validator, Field, conint, model_validator
@@ -5,6 +6,8 @@ from bson import ObjectId
 
 from quyca.domain.constants.clean_source import clean_nan
 
+object_id_pattern = re.compile(r"[0-9a-fA-F]{24}")
+
 
 class PyObjectId(ObjectId):
     @classmethod
@@ -13,8 +16,10 @@ class PyObjectId(ObjectId):
 
     @classmethod
     def validate(cls, value: str | ObjectId, other: None) -> str:
-        if value == "":
+        if isinstance(value, ObjectId):
             return str(value)
+        if value == "" or (isinstance(value, str) and object_id_pattern.fullmatch(value)):
+            return value
         if not ObjectId.is_valid(value):
             raise ValueError(f"Invalid ObjectId '{str(value)}'")
         return str(value)
@@ -155,8 +160,11 @@ class APC(BaseModel):
 class QueryParams(BaseModel):
     limit: conint(ge=1, le=250) | None = Field(default=None, alias="max")  # type: ignore
     page: conint(ge=1) | None = None  # type: ignore
+    cursor: str | None = None
     keywords: str | None = None
     plot: str | None = None
+    plots: str | None = None
+    map_format: str | None = None
     sort: str | None = None
     product_types: str | None = None
     years: str | None = None
@@ -167,13 +175,16 @@ class QueryParams(BaseModel):
     groups_ranking: str | None = None
     authors_ranking: str | None = None
     source_types: str | None = None
+    counts: bool | None = None
 
     @model_validator(mode="after")
     def validate_pagination_and_sort(self) -> "QueryParams":
-        if not self.plot and not self.limit and not self.page and not self.sort:
+        if not self.plot and not self.plots and not self.limit and not self.page and not self.sort:
             self.limit = 10
             self.page = 1
             self.sort = "citations_desc"
+        if self.cursor and not self.limit:
+            self.limit = 10
         return self
 
 
@@ -260,7 +271,8 @@ class Author(BaseModel):
                 self.age = age
             except Exception:
                 self.age = None
-        self.birthdate = None
+        if self.birthdate is not None:
+            self.birthdate = None
         return self
 
     class Config:
@@ -1,3 +1,6 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+
 from bson import ObjectId
 from pydantic import BaseModel, Field
 from typing import Optional
@@ -66,3 +69,23 @@ class Source(BaseModel):
 
     class Config:
         json_encoders = {ObjectId: str}
+
+
+@dataclass(slots=True)
+class SourceMetadata:
+    """
+    Source fields needed to enrich a work, kept in the process wide source index.
+
+    The scimago quartile ranges are flattened into disjoint segments: segment k starts at quartile_starts[k] and
+    holds the quartile of the first ranking covering it, so a lookup is a binary search over the starts.
+    """
+
+    serials: dict
+    quartile_starts: list[int]
+    quartiles: list[str | None]
+
+    def get_scimago_quartile(self, date: int | None) -> str | None:
+        if not date or not isinstance(date, int):
+            return None
+        position = bisect_right(self.quartile_starts, date) - 1
+        return self.quartiles[position] if position >= 0 else None
@@ -142,6 +142,7 @@ class Work(BaseModel):
     topics: list[Topic] | None = None
     primary_topic: Topic | None = None
     primary_topic_csv: str | None = None
+    cursor_key: int | float | str | None = None
 
     class Config:
         json_encoders = {ObjectId: str}
@@ -1,24 +1,14 @@
 from collections import defaultdict
 from typing import Generator
 
-from currency_converter import CurrencyConverter
+import numpy as np
 from pymongo.command_cursor import CommandCursor
 from quyca.domain.constants.apc_currencies import available_currencies
+from quyca.domain.services import apc_service
 
 
-def parse_annual_evolution_by_scienti_classification(works: Generator) -> dict:
-    data: defaultdict = defaultdict(lambda: defaultdict(int))
-    for work in works:
-        if not work.year_published:
-            continue
-        for work_type in work.types:
-            if work_type.source == "scienti" and work_type.level == 2:
-                data[work.year_published][work_type.type] += 1
-    plot = [
-        {"x": year, "y": count, "type": work_type}
-        for year, work_types in data.items()
-        for work_type, count in work_types.items()
-    ]
+def parse_annual_evolution_by_scienti_classification(data: CommandCursor) -> dict:
+    plot = [{"x": item["_id"].get("year"), "y": item["count"], "type": item["_id"].get("type")} for item in data]
     return {"plot": sorted(plot, key=lambda x: (-x.get("x"), -x.get("y")))}
 
 
@@ -27,37 +17,35 @@ def parse_affiliations_by_product_type(data: CommandCursor) -> dict:
     return {"plot": sorted(plot, key=lambda x: x.get("y"), reverse=True)}
 
 
-def parse_annual_citation_count(works: Generator) -> dict:
+def parse_annual_citation_count(citations: CommandCursor) -> dict:
     data: dict = {}
     no_info = 0
-    for work in works:
-        if not work.citations_by_year:
-            no_info += 1
+    for item in citations:
+        if item["_id"].get("no_info"):
+            no_info = item["count"]
             continue
-        for citation in work.citations_by_year:
-            if citation.year in data.keys():
-                data[citation.year] += citation.cited_by_count
-            else:
-                data[citation.year] = citation.cited_by_count
+        data[item["_id"].get("year")] = item["count"]
     plot = [{"x": year, "y": count} for year, count in sorted(data.items(), reverse=True)]
     plot += [{"x": "Sin información", "y": no_info}]
     return {"plot": plot}
 
 
-def parse_annual_articles_open_access(works: Generator) -> dict:
+def parse_annual_articles_open_access(works_count: CommandCursor) -> dict:
     data: defaultdict = defaultdict(lambda: {"Abierto": 0, "Cerrado": 0, "Sin información": 0})
-    for work in works:
-        access_type = "Abierto" if work.open_access.is_open_access else "Cerrado"
-        if work.open_access.is_open_access is None and not work.year_published:
-            data["Sin año"]["Sin información"] += 1
+    for item in works_count:
+        year_published = item["_id"].get("year")
+        is_open_access = item["_id"].get("is_open_access")
+        access_type = "Abierto" if is_open_access else "Cerrado"
+        if is_open_access is None and not year_published:
+            data["Sin año"]["Sin información"] += item["count"]
             continue
-        if work.open_access.is_open_access is None:
-            data[work.year_published]["Sin información"] += 1
+        if is_open_access is None:
+            data[year_published]["Sin información"] += item["count"]
             continue
-        if work.year_published is None:
-            data["Sin año"][access_type] += 1
+        if year_published is None:
+            data["Sin año"][access_type] += item["count"]
             continue
-        data[work.year_published][access_type] += 1
+        data[year_published][access_type] += item["count"]
     plot = [
         {"x": year, "y": count, "type": access_type}
         for year, counts in data.items()
@@ -84,9 +72,8 @@ def parse_annual_articles_by_top_publishers(works: Generator) -> dict:
 
 def parse_annual_apc_expenses(works: Generator) -> dict:
     data: defaultdict = defaultdict(int)
-    total_apc = 0
     total_results = 0
-    currency_converter = CurrencyConverter()
+    years, charges, currencies = [], [], []
     for work in works:
         total_results += 1
         source_apc = getattr(work.source, "apc", None)
@@ -94,9 +81,14 @@ def parse_annual_apc_expenses(works: Generator) -> dict:
         apc_currency = getattr(source_apc, "currency", None)
         if not apc_charges or not apc_currency or apc_currency not in available_currencies:
             continue
-        usd_charges = currency_converter.convert(apc_charges, apc_currency, "USD")
-        data[work.year_published] += int(usd_charges)
-        total_apc += usd_charges
+        years.append(work.year_published)
+        charges.append(apc_charges)
+        currencies.append(apc_currency)
+    usd_charges = apc_service.convert_to_usd(charges, currencies)
+    converted = ~np.isnan(usd_charges)
+    for year, usd_charge in zip(np.array(years, dtype=object)[converted], usd_charges[converted].astype(np.int64)):
+        data[year] += int(usd_charge)
+    total_apc = usd_charges[converted].sum()
     plot = [{"x": year, "y": value} for year, value in data.items()]
     return {
         "plot": sorted(plot, key=lambda x: -x.get("x")),
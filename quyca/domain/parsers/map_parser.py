@@ -1,12 +1,23 @@
+import hashlib
 import json
 import os
 from collections import defaultdict
+from functools import lru_cache
 from math import log
 
 import pandas as pd
 
+from quyca.config import settings
 
-def parse_coauthorship_by_country_map(data: list) -> dict:
+map_files = {"countries": "worldmap.json", "colombian_departments": "colombiamap.json"}
+
+map_plots = {
+    "coauthorship_by_country_map": "countries",
+    "coauthorship_by_colombian_department_map": "colombian_departments",
+}
+
+
+def parse_coauthorship_by_country_map(data: list, map_format: str | None = None) -> dict:
     countries: defaultdict = defaultdict(lambda: {"count": 0, "name": ""})
     for item in data:
         addresses = item.get("affiliation", {}).get("addresses", {})
@@ -18,25 +29,11 @@ def parse_coauthorship_by_country_map(data: list) -> dict:
             country_data["name"] = country_name
     for country_data in countries.values():
         country_data["log_count"] = log(country_data["count"])  # type: ignore
-    worldmap_path = os.path.join(os.path.dirname(__file__), "concerns/worldmap.json")
-    with open(worldmap_path, "r") as worldmap_file:
-        plot = json.load(worldmap_file)
-    for feature in plot["features"]:
-        country_code = feature["properties"].get("country_code")
-        if country_code in countries:
-            country_data = countries[country_code]
-            feature["properties"]["count"] = country_data["count"]
-            feature["properties"]["log_count"] = country_data["log_count"]
-        else:
-            feature["properties"]["count"] = 0
-            feature["properties"]["log_count"] = 0
-    return {"plot": plot}
-
-
-def get_coauthorship_by_colombian_department_map(data: list) -> dict:
-    cities_by_state_path = os.path.join(os.path.dirname(__file__), "concerns/cities_by_state.csv")
-    cities_by_state = pd.read_csv(cities_by_state_path)
-    city_to_state = dict(zip(cities_by_state["MUNICIPIO"], cities_by_state["DEPARTAMENTO"]))
+    return get_map_plot("countries", countries, map_format)
+
+
+def get_coauthorship_by_colombian_department_map(data: list, map_format: str | None = None) -> dict:
+    city_to_state = get_city_to_state()
     states = {}
     for item in data:
         addresses = item.get("affiliation", {}).get("addresses", {})
@@ -49,14 +46,94 @@ def get_coauthorship_by_colombian_department_map(data: list) -> dict:
                 states[state]["count"] += item["count"]
     for state_data in states.values():
         state_data["log_count"] = log(state_data["count"])
-    colombiamap_path = os.path.join(os.path.dirname(__file__), "concerns/colombiamap.json")
-    with open(colombiamap_path, "r") as colombiamap_file:
-        plot = json.load(colombiamap_file)
-    for feature in plot["features"]:
+    return get_map_plot("colombian_departments", states, map_format)
+
+
+def get_map_plot(map_name: str, counts: dict, map_format: str | None = None) -> dict:
+    """
+    Map plot from the counts of its features, keyed by the feature id. It is also how the maps precomputed by
+    quyca_gen_plots.py, which only store the counts, get their geometry back.
+    """
+    if map_format:
+        return {"plot": get_map_counts(map_name, counts, map_format)}
+    return {"plot": get_map_with_counts(get_map_template(map_files[map_name]), get_feature_ids(map_name), counts)}
+
+
+def get_map_counts(map_name: str, counts: dict, map_format: str) -> dict:
+    """
+    Geometry free version of a map plot: the counts of the features that have any, keyed by the feature id,
+    and the url of the geometry, which clients can cache for as long as its version does not change.
+    """
+    if map_format != "counts":
+        raise ValueError(f"Map format {map_format} not supported, use counts.")
+    feature_counts = {}
+    for feature_id in get_feature_ids(map_name):
+        if feature_id in counts:
+            feature_counts[feature_id] = {
+                "count": counts[feature_id]["count"],
+                "log_count": counts[feature_id]["log_count"],
+            }
+    _, version = get_map_geometry(map_name)
+    return {
+        "counts": feature_counts,
+        "geometry_url": f"{settings.APP_URL_PREFIX}/maps/{map_name}?v={version}",
+    }
+
+
+def get_map_with_counts(template: dict, feature_keys: list | tuple, counts: dict) -> dict:
+    """
+    Overlays the counts on a map template without touching it: every feature gets new properties
+    while its geometry is shared with the template.
+    """
+    features = []
+    for feature, key in zip(template["features"], feature_keys):
+        count_data = counts.get(key)
+        properties = {
+            **feature["properties"],
+            "count": count_data["count"] if count_data else 0,
+            "log_count": count_data["log_count"] if count_data else 0,
+        }
+        features.append({**feature, "properties": properties})
+    return {**template, "features": features}
+
+
+@lru_cache(maxsize=None)
+def get_map_template(file_name: str) -> dict:
+    """Parses a map of the concerns folder once per process. The result is shared, so it must never be mutated."""
+    with open(os.path.join(os.path.dirname(__file__), "concerns", file_name), "r") as map_file:
+        return json.load(map_file)
+
+
+@lru_cache(maxsize=None)
+def get_feature_ids(map_name: str) -> tuple:
+    """Keys the counts of every feature of a map are matched with, in the order of its features."""
+    if map_name == "countries":
+        return tuple(
+            feature["properties"].get("country_code") for feature in get_map_template("worldmap.json")["features"]
+        )
+    feature_ids = []
+    for feature in get_map_template("colombiamap.json")["features"]:
         state = feature["properties"]["NOMBRE_DPT"].capitalize()
         if "bogota" in state.lower():
             state = "Bogotá D.C."
-        state_data = states.get(state, {"count": 0, "log_count": 0})
-        feature["properties"]["count"] = state_data["count"]
-        feature["properties"]["log_count"] = state_data["log_count"]
-    return {"plot": plot}
+        feature_ids.append(state)
+    return tuple(feature_ids)
+
+
+@lru_cache(maxsize=None)
+def get_map_geometry(map_name: str) -> tuple[bytes, str]:
+    """Serialized geometry of a map, each feature carrying the id used in the counts, and its version hash."""
+    if map_name not in map_files:
+        raise ValueError(f"Map {map_name} does not exist.")
+    template = get_map_template(map_files[map_name])
+    features = [
+        {**feature, "id": feature_id} for feature, feature_id in zip(template["features"], get_feature_ids(map_name))
+    ]
+    geometry = json.dumps({**template, "features": features}, separators=(",", ":"), ensure_ascii=False).encode()
+    return geometry, hashlib.sha1(geometry).hexdigest()[:16]
+
+
+@lru_cache(maxsize=None)
+def get_city_to_state() -> dict:
+    cities_by_state = pd.read_csv(os.path.join(os.path.dirname(__file__), "concerns/cities_by_state.csv"))
+    return dict(zip(cities_by_state["MUNICIPIO"], cities_by_state["DEPARTAMENTO"]))
@@ -4,7 +4,7 @@ from itertools import chain
 from typing import Callable, Iterable, Generator
 from collections import Counter, defaultdict
 
-from currency_converter import CurrencyConverter
+import numpy as np
 from pymongo.command_cursor import CommandCursor
 
 from quyca.domain.constants.apc_currencies import available_currencies
@@ -12,6 +12,7 @@ from quyca.domain.constants.open_access_status import open_access_status_dict
 from quyca.domain.models.affiliation_model import Affiliation
 from quyca.domain.helpers import get_works_h_index_by_scholar_citations
 from quyca.domain.models.calculations_model import Calculations
+from quyca.domain.services import apc_service
 
 
 def get_percentage(func: Callable[..., list]) -> Callable[..., dict]:
@@ -39,16 +40,20 @@ def parse_citations_by_affiliations(data: CommandCursor) -> list:
 @get_percentage
 def parse_apc_expenses_by_affiliations(data: CommandCursor) -> list:
     result: defaultdict[str, int] = defaultdict(int)
-    currency_converter = CurrencyConverter()
-
+    names, charges, currencies = [], [], []
     for item in data:
         apc = item.get("apc", {})
         apc_charges = apc.get("charges", 0)
         apc_currency = apc.get("currency", "USD")
-        if apc_currency not in available_currencies:
+        if apc_charges is None or apc_currency not in available_currencies:
             continue
-        usd_charges = currency_converter.convert(apc_charges, apc_currency, "USD")
-        result[item.get("names", [{"name": "No name"}])[0].get("name")] += int(usd_charges)
+        names.append(item.get("names", [{"name": "No name"}])[0].get("name"))
+        charges.append(apc_charges)
+        currencies.append(apc_currency)
+    usd_charges = apc_service.convert_to_usd(charges, currencies)
+    converted = ~np.isnan(usd_charges)
+    for name, usd_charge in zip(np.array(names, dtype=object)[converted], usd_charges[converted].astype(np.int64)):
+        result[name] += int(usd_charge)
 
     return sorted([{"name": n, "value": v} for n, v in result.items()], key=lambda x: x["value"], reverse=True)
 
@@ -67,16 +72,10 @@ def parse_h_index_by_affiliation(data: CommandCursor) -> list:
 
 
 @get_percentage
-def parse_articles_by_publisher(works: Generator) -> list:
-    data = map(
-        lambda x: (
-            x.source.publisher.name
-            if x.source.publisher and isinstance(x.source.publisher.name, str)
-            else "Sin información"
-        ),
-        works,
-    )
-    counter = Counter(data)
+def parse_articles_by_publisher(data: CommandCursor) -> list:
+    counter: Counter = Counter()
+    for item in data:
+        counter[item["_id"] if isinstance(item["_id"], str) else "Sin información"] += item["count"]
     plot = []
     for name, value in counter.items():
         plot += [{"name": name, "value": value}]
@@ -84,23 +83,16 @@ def parse_articles_by_publisher(works: Generator) -> list:
 
 
 @get_percentage
-def parse_products_by_subject(works: Generator) -> list:
-    names = [
-        work.primary_topic.display_name for work in works if work.primary_topic and work.primary_topic.display_name
-    ]
-
-    results = Counter(names)
-    plot = [{"name": name, "value": value} for name, value in results.items()]
+def parse_products_by_subject(data: CommandCursor) -> list:
+    plot = [{"name": item["_id"], "value": item["count"]} for item in data if item["_id"]]
     return sorted(plot, key=lambda x: x["value"], reverse=True)
 
 
 @get_percentage
-def parse_products_by_access_route(works: Generator) -> list:
-    data = map(
-        lambda x: (x.open_access.open_access_status if x.open_access.open_access_status else "no_info"),
-        works,
-    )
-    counter = Counter(data)
+def parse_products_by_access_route(data: CommandCursor) -> list:
+    counter: Counter = Counter()
+    for item in data:
+        counter[item["_id"] if item["_id"] else "no_info"] += item["count"]
     plot = []
     for name, value in counter.items():
         plot.append({"name": open_access_status_dict.get(name), "value": value})
@@ -1,13 +1,17 @@
 import csv
 import io
+from typing import Generator, Iterable
 
 from quyca.domain.constants import countries_iso
 from quyca.domain.constants.open_access_status import open_access_status_dict
 from quyca.domain.constants.product_types import source_titles
 from quyca.domain.models.work_model import Work
 
+CSV_CHUNK_SIZE = 64 * 1024
 
-def parse_csv(works: list) -> str:
+
+def parse_csv(works: Iterable[Work]) -> Generator[str, None, None]:
+    """Writes the works as csv, yielding the text in chunks of about CSV_CHUNK_SIZE characters."""
     include = [
         "title",
         "language",
@@ -41,13 +45,17 @@ def parse_csv(works: list) -> str:
         "source_apc",
         "source_urls",
     ]
-    works_dict = [work.model_dump(include=include) for work in works]
     output = io.StringIO()
     writer = csv.DictWriter(output, fieldnames=include, escapechar="\\", quoting=csv.QUOTE_MINIMAL)
     writer.writeheader()
-    writer.writerows(works_dict)
-    del works_dict
-    return output.getvalue()
+    include_fields = set(include)
+    for work in works:
+        writer.writerow(work.model_dump(include=include_fields))
+        if output.tell() >= CSV_CHUNK_SIZE:
+            yield output.getvalue()
+            output.seek(0)
+            output.truncate(0)
+    yield output.getvalue()
 
 
 def parse_search_results(works: list) -> list:
@@ -138,11 +146,11 @@ def parse_authors_ranking_filter(authors_ranking: list) -> list:
         if isinstance(_id, dict):
             label = (_id.get("rank") or "").strip()
             if label:
-                parsed_authors_ranking.append({"value": label, "label": label})
+                parsed_authors_ranking.append(set_count({"value": label, "label": label}, ranking))
         elif _id:
             label = str(_id).strip()
             if label:
-                parsed_authors_ranking.append({"value": label, "label": label})
+                parsed_authors_ranking.append(set_count({"value": label, "label": label}, ranking))
 
     parsed_authors_ranking.sort(key=lambda x: x.get("label") or "")
     return parsed_authors_ranking
@@ -152,7 +160,9 @@ def parse_groups_ranking_filter(groups_ranking: list) -> list:
     parsed_groups_ranking = []
     for ranking in groups_ranking:
         if ranking.get("_id"):
-            parsed_groups_ranking.append({"value": ranking.get("_id") or "", "label": ranking.get("_id") or ""})
+            parsed_groups_ranking.append(
+                set_count({"value": ranking.get("_id") or "", "label": ranking.get("_id") or ""}, ranking)
+            )
     parsed_groups_ranking.sort(key=lambda x: x.get("label") or "")  # type: ignore
     return parsed_groups_ranking
 
@@ -175,7 +185,13 @@ def parse_country_filter(countries: list) -> list:
     for country in countries:
         if country.get("_id"):
             parsed_countries.append(
-                {"value": country.get("_id"), "label": countries_iso.countries_dict.get(country.get("_id"), "Sin País")}
+                set_count(
+                    {
+                        "value": country.get("_id"),
+                        "label": countries_iso.countries_dict.get(country.get("_id"), "Sin País"),
+                    },
+                    country,
+                )
             )
     parsed_countries.sort(key=lambda x: x.get("label") or "")
     return parsed_countries
@@ -192,7 +208,7 @@ def parse_subject_filter(subjects: list) -> list:
             level = subject.get("level")
             name = subject.get("name")
             if level in groups and name:
-                groups[level]["children"].append({"value": f"{level}_{name}", "title": name})
+                groups[level]["children"].append(set_count({"value": f"{level}_{name}", "title": name}, subject))
 
     parsed_subjects = []
     for level, group in groups.items():
@@ -208,16 +224,22 @@ def parse_status_filter(status: list) -> list:
     open_children = []
     for oa_status in status:
         if not oa_status.get("_id"):
-            statuses.append({"value": "unknown", "title": "Sin información"})
+            statuses.append(set_count({"value": "unknown", "title": "Sin información"}, oa_status))
         elif oa_status.get("_id") != "closed":
             open_children.append(
-                {"value": oa_status.get("_id"), "title": open_access_status_dict.get(oa_status.get("_id"))}
+                set_count(
+                    {"value": oa_status.get("_id"), "title": open_access_status_dict.get(oa_status.get("_id"))},
+                    oa_status,
+                )
             )
         else:
-            statuses.append({"value": "closed", "title": "Cerrado"})
+            statuses.append(set_count({"value": "closed", "title": "Cerrado"}, oa_status))
     if len(open_children) > 0:
         open_children.sort(key=lambda x: x.get("title") or "")  # type: ignore
-        statuses.append({"value": "open", "title": "Abierto", "children": open_children})  # type: ignore
+        open_status = {"value": "open", "title": "Abierto", "children": open_children}
+        if all("count" in child for child in open_children):
+            open_status["count"] = sum(child["count"] for child in open_children)  # type: ignore
+        statuses.append(open_status)  # type: ignore
     statuses.sort(key=lambda x: x.get("title") or "")  # type: ignore
     return statuses
 
@@ -231,15 +253,18 @@ def parse_product_type_filter(product_types: list) -> list:
             continue
 
         elif product_type.get("_id") == "minciencias":
-            inner_types = list({element["type"]: element for element in product_type.get("types")}.values())
+            inner_types = get_unique_types(product_type.get("types"))
             for inner_type in inner_types:
                 if inner_type.get("level") == 0:
                     continue
                 children.append(
-                    {
-                        "value": product_type.get("_id") + "_" + inner_type.get("type"),
-                        "title": inner_type.get("type"),
-                    }
+                    set_count(
+                        {
+                            "value": product_type.get("_id") + "_" + inner_type.get("type"),
+                            "title": inner_type.get("type"),
+                        },
+                        inner_type,
+                    )
                 )
         elif product_type.get("_id") == "scienti":
             second_level_children = []
@@ -247,27 +272,36 @@ def parse_product_type_filter(product_types: list) -> list:
             for inner_type in product_type.get("types"):
                 if inner_type.get("level") == 0:
                     children.append(
-                        {
-                            "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
-                            "title": inner_type.get("code") + " " + inner_type.get("type"),
-                            "code": inner_type.get("code"),
-                        }
+                        set_count(
+                            {
+                                "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
+                                "title": inner_type.get("code") + " " + inner_type.get("type"),
+                                "code": inner_type.get("code"),
+                            },
+                            inner_type,
+                        )
                     )
                 elif inner_type.get("level") == 1:
                     second_level_children.append(
-                        {
-                            "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
-                            "title": inner_type.get("code") + " " + inner_type.get("type"),
-                            "code": inner_type.get("code"),
-                        }
+                        set_count(
+                            {
+                                "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
+                                "title": inner_type.get("code") + " " + inner_type.get("type"),
+                                "code": inner_type.get("code"),
+                            },
+                            inner_type,
+                        )
                     )
                 elif inner_type.get("level") == 2:
                     third_level_children.append(
-                        {
-                            "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
-                            "title": inner_type.get("code") + " " + inner_type.get("type"),
-                            "code": inner_type.get("code"),
-                        }
+                        set_count(
+                            {
+                                "value": "scienti_" + inner_type.get("type") + "_" + inner_type.get("code"),
+                                "title": inner_type.get("code") + " " + inner_type.get("type"),
+                                "code": inner_type.get("code"),
+                            },
+                            inner_type,
+                        )
                     )
             second_level_children.sort(key=lambda x: x.get("title") or "")
             third_level_children.sort(key=lambda x: x.get("title") or "")
@@ -282,10 +316,13 @@ def parse_product_type_filter(product_types: list) -> list:
         else:
             for inner_type in product_type.get("types"):
                 children.append(
-                    {
-                        "value": product_type.get("_id") + "_" + inner_type.get("type"),
-                        "title": inner_type.get("type"),
-                    }
+                    set_count(
+                        {
+                            "value": product_type.get("_id") + "_" + inner_type.get("type"),
+                            "title": inner_type.get("type"),
+                        },
+                        inner_type,
+                    )
                 )
         children.sort(key=lambda x: x.get("title") or "")
         types.append(
@@ -297,3 +334,18 @@ def parse_product_type_filter(product_types: list) -> list:
         )
     types.sort(key=lambda x: x["title"] != "Colav")
     return types
+
+
+def get_unique_types(inner_types: list) -> list:
+    unique_types: dict = {}
+    for inner_type in inner_types:
+        if "count" in inner_type and inner_type["type"] in unique_types:
+            inner_type = {**inner_type, "count": inner_type["count"] + unique_types[inner_type["type"]]["count"]}
+        unique_types[inner_type["type"]] = inner_type
+    return list(unique_types.values())
+
+
+def set_count(item: dict, entry: dict) -> dict:
+    if "count" in entry:
+        item["count"] = entry["count"]
+    return item
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict
+
+
+class IStaffJobRepository(ABC):
+    """Contract for the storage of the staff upload jobs."""
+
+    @abstractmethod
+    def create_job(self, job: Dict[str, Any], file: bytes) -> str:
+        pass
+
+    @abstractmethod
+    def get_job(self, job_id: str) -> Dict[str, Any] | None:
+        pass
+
+    @abstractmethod
+    def claim_job(self, job_id: str, lease: int) -> Dict[str, Any] | None:
+        pass
+
+    @abstractmethod
+    def renew_lease(self, job_id: str, lease: int) -> None:
+        pass
+
+    @abstractmethod
+    def update_job(self, job_id: str, values: Dict[str, Any], unset: list[str] | None = None) -> None:
+        pass
+
+    @abstractmethod
+    def get_file(self, job_id: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    def delete_file(self, job_id: str) -> None:
+        pass
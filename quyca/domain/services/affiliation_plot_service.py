@@ -2,6 +2,8 @@ from pymongo.command_cursor import CommandCursor
 
 from quyca.domain.constants.articles_types import articles_types_list
 from quyca.domain.models.base_model import QueryParams
+from quyca.domain.services import plot_service
+from quyca.infrastructure.cache import plot_cache
 from quyca.infrastructure.repositories import (
     work_repository,
     plot_repository,
@@ -18,6 +20,31 @@ from quyca.domain.parsers import (
 
 
 def get_affiliation_plot(affiliation_id: str, affiliation_type: str, query_params: QueryParams) -> dict | None:
+    key = plot_cache.build_key(
+        "affiliation", affiliation_type, affiliation_id, str(query_params.plot), query_params=query_params
+    )
+    return plot_cache.get_or_set(
+        key, lambda: get_materialized_or_live_plot(affiliation_id, affiliation_type, query_params)
+    )
+
+
+def get_affiliation_plots(affiliation_id: str, affiliation_type: str, query_params: QueryParams) -> dict:
+    return plot_service.get_plots(
+        ["affiliation", affiliation_type, affiliation_id],
+        query_params,
+        lambda plot_params: get_affiliation_plot(affiliation_id, affiliation_type, plot_params),
+        lambda plots: plot_repository.get_works_plots_by_affiliation(affiliation_id, plots, query_params),
+    )
+
+
+def get_materialized_or_live_plot(affiliation_id: str, affiliation_type: str, query_params: QueryParams) -> dict | None:
+    materialized = plot_service.get_materialized_plot(["affiliation", affiliation_type, affiliation_id], query_params)
+    if materialized is not None:
+        return materialized
+    return get_affiliation_plot_data(affiliation_id, affiliation_type, query_params)
+
+
+def get_affiliation_plot_data(affiliation_id: str, affiliation_type: str, query_params: QueryParams) -> dict | None:
     plot_type = query_params.plot
     plot_type_dict = {
         "faculties_by_product_type": "faculty",
@@ -106,24 +133,20 @@ def plot_h_index_by_affiliation(
 
 
 def plot_annual_evolution_by_scienti_classification(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {"project": ["year_published", "types"]}
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_evolution_by_scienti_classification(works)
+    data = plot_repository.get_works_plot_by_affiliation(
+        affiliation_id, "annual_evolution_by_scienti_classification", query_params
+    )
+    return bar_parser.parse_annual_evolution_by_scienti_classification(data)
 
 
 def plot_annual_citation_count(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {"project": ["citations_by_year"]}
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_citation_count(works)
+    data = plot_repository.get_works_plot_by_affiliation(affiliation_id, "annual_citation_count", query_params)
+    return bar_parser.parse_annual_citation_count(data)
 
 
 def plot_annual_articles_open_access(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "project": ["year_published", "open_access"],
-        "match": {"types.type": {"$in": articles_types_list}},
-    }
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_articles_open_access(works)
+    data = plot_repository.get_works_plot_by_affiliation(affiliation_id, "annual_articles_open_access", query_params)
+    return bar_parser.parse_annual_articles_open_access(data)
 
 
 def plot_annual_articles_by_top_publishers(affiliation_id: str, query_params: QueryParams) -> dict:
@@ -144,21 +167,13 @@ def plot_most_used_title_words(affiliation_id: str, query_params: QueryParams) -
 
 
 def plot_articles_by_publisher(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "work_project": ["source.id", "source.publisher.name", "source.name"],
-        "match": {"types.type": {"$in": articles_types_list}},
-    }
-    works = work_repository.get_works_with_source_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return pie_parser.parse_articles_by_publisher(works)
+    data = plot_repository.get_works_plot_by_affiliation(affiliation_id, "articles_by_publisher", query_params)
+    return pie_parser.parse_articles_by_publisher(data)
 
 
 def plot_products_by_subject(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "project": ["primary_topic.display_name"],
-        "match": {"primary_topic.display_name": {"$exists": True, "$ne": None}},
-    }
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return pie_parser.parse_products_by_subject(works)
+    data = plot_repository.get_works_plot_by_affiliation(affiliation_id, "products_by_subject", query_params)
+    return pie_parser.parse_products_by_subject(data)
 
 
 def plot_products_by_database(affiliation_id: str, query_params: QueryParams) -> dict:
@@ -167,12 +182,8 @@ def plot_products_by_database(affiliation_id: str, query_params: QueryParams) ->
 
 
 def plot_articles_by_access_route(affiliation_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "match": {"types.type": {"$in": articles_types_list}},
-        "project": ["open_access"],
-    }
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    return pie_parser.parse_products_by_access_route(works)
+    data = plot_repository.get_works_plot_by_affiliation(affiliation_id, "articles_by_access_route", query_params)
+    return pie_parser.parse_products_by_access_route(data)
 
 
 def plot_active_authors_by_sex(affiliation_id: str, query_params: QueryParams) -> dict:
@@ -215,12 +226,12 @@ def plot_articles_by_publishing_institution(affiliation_id: str, query_params: Q
 
 def plot_coauthorship_by_country_map(affiliation_id: str, query_params: QueryParams) -> dict:
     data = plot_repository.get_coauthorship_by_country_map_by_affiliation(affiliation_id, query_params)
-    return map_parser.parse_coauthorship_by_country_map(data)
+    return map_parser.parse_coauthorship_by_country_map(data, query_params.map_format)
 
 
 def plot_coauthorship_by_colombian_department_map(affiliation_id: str, query_params: QueryParams) -> dict:
     data = plot_repository.get_coauthorship_by_colombian_department_map_by_affiliation(affiliation_id, query_params)
-    return map_parser.get_coauthorship_by_colombian_department_map(data)
+    return map_parser.get_coauthorship_by_colombian_department_map(data, query_params.map_format)
 
 
 def plot_institutional_coauthorship_network(affiliation_id: str, query_params: QueryParams) -> dict:
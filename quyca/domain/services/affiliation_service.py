@@ -2,6 +2,8 @@ from quyca.domain.models.base_model import QueryParams
 from quyca.domain.constants.institutions import institutions_list
 from quyca.domain.parsers import affiliation_parser
 from quyca.domain.models.affiliation_model import Affiliation, Relation
+from quyca.domain.services.base_service import get_total_results, check_cursor_not_supported
+from quyca.infrastructure.executor import run_concurrently
 from quyca.infrastructure.repositories import (
     person_repository,
     affiliation_repository,
@@ -10,7 +12,7 @@ from quyca.infrastructure.repositories import (
 
 def get_affiliation_by_id(affiliation_id: str, affiliation_type: str) -> dict:
     affiliation = affiliation_repository.get_affiliation_by_id(affiliation_id)
-    set_relation_external_urls(affiliation)
+    set_relations_external_urls([affiliation])
     set_upper_affiliations_and_logo(affiliation, affiliation_type)
     return {"data": affiliation.model_dump(by_alias=True)}
 
@@ -18,9 +20,11 @@ def get_affiliation_by_id(affiliation_id: str, affiliation_type: str) -> dict:
 def get_related_affiliations_by_affiliation(affiliation_id: str, affiliation_type: str) -> dict:
     data = {}
     if affiliation_type == "institution":
-        faculties = affiliation_repository.get_affiliations_by_institution(affiliation_id, "faculty")
-        departments = affiliation_repository.get_affiliations_by_institution(affiliation_id, "department")
-        groups = affiliation_repository.get_affiliations_by_institution(affiliation_id, "group")
+        faculties, departments, groups = run_concurrently(
+            lambda: list(affiliation_repository.get_affiliations_by_institution(affiliation_id, "faculty")),
+            lambda: list(affiliation_repository.get_affiliations_by_institution(affiliation_id, "department")),
+            lambda: list(affiliation_repository.get_affiliations_by_institution(affiliation_id, "group")),
+        )
         data["faculties"] = [faculty.model_dump(include={"id", "name"}) for faculty in faculties]
         data["departments"] = [department.model_dump(include={"id", "name"}) for department in departments]
         data["groups"] = [group.model_dump(include={"id", "name"}) for group in groups]
@@ -29,15 +33,19 @@ def get_related_affiliations_by_affiliation(affiliation_id: str, affiliation_typ
             data["authors"] = [author.model_dump(include={"id", "full_name"}) for author in authors]
 
     elif affiliation_type == "faculty":
-        departments = affiliation_repository.get_departments_by_faculty(affiliation_id)
-        groups = affiliation_repository.get_groups_by_faculty_or_department(affiliation_id)
-        authors = person_repository.get_persons_by_affiliation(affiliation_id)
+        departments, groups, authors = run_concurrently(
+            lambda: list(affiliation_repository.get_departments_by_faculty(affiliation_id)),
+            lambda: list(affiliation_repository.get_groups_by_faculty_or_department(affiliation_id)),
+            lambda: list(person_repository.get_persons_by_affiliation(affiliation_id)),
+        )
         data["departments"] = [department.model_dump(include={"id", "name"}) for department in departments]
         data["groups"] = [group.model_dump(include={"id", "name"}) for group in groups]
         data["authors"] = [author.model_dump(include={"id", "full_name"}) for author in authors]
     elif affiliation_type == "department":
-        groups = affiliation_repository.get_groups_by_faculty_or_department(affiliation_id)
-        authors = person_repository.get_persons_by_affiliation(affiliation_id)
+        groups, authors = run_concurrently(
+            lambda: list(affiliation_repository.get_groups_by_faculty_or_department(affiliation_id)),
+            lambda: list(person_repository.get_persons_by_affiliation(affiliation_id)),
+        )
         data["groups"] = [group.model_dump(include={"id", "name"}) for group in groups]
         data["authors"] = [author.model_dump(include={"id", "full_name"}) for author in authors]
     elif affiliation_type == "group":
@@ -47,6 +55,7 @@ def get_related_affiliations_by_affiliation(affiliation_id: str, affiliation_typ
 
 
 def search_affiliations(affiliation_type: str, query_params: QueryParams) -> dict:
+    check_cursor_not_supported(query_params)
     pipeline_params = {
         "project": [
             "_id",
@@ -65,43 +74,42 @@ def search_affiliations(affiliation_type: str, query_params: QueryParams) -> dic
     affiliations, total_results = affiliation_repository.search_affiliations(
         affiliation_type, query_params, pipeline_params
     )
-    affiliations_list = []
-    for affiliation in affiliations:
-        set_relation_external_urls(affiliation)
+    affiliations_list = list(affiliations)
+    set_relations_external_urls(affiliations_list)
+    for affiliation in affiliations_list:
         set_upper_affiliations_and_logo(affiliation, affiliation_type)
-        affiliations_list.append(affiliation)
     data = affiliation_parser.parse_search_result(affiliations_list)
-    return {"data": data, "total_results": total_results}
-
-
-def set_relation_external_urls(affiliation: Affiliation) -> None:
-    if not affiliation.relations:
-        return
-
-    for relation in affiliation.relations:
-        if getattr(relation, "external_urls", None):
-            continue
+    return {"data": data, **get_total_results(total_results)}
 
-        relation_external_urls = None
 
-        if getattr(affiliation, "relations_data", None):
-            relation_data = next(
-                (x for x in affiliation.relations_data if x.id == relation.id),
-                None,
-            )
+def set_relations_external_urls(affiliations: list[Affiliation]) -> None:
+    """
+    Sets the external urls of the relations from the relations_data of the search, or else from their affiliation.
+    The affiliations that are still missing are fetched in a single query for the whole page.
+    """
+    pending_relations = []
+    for affiliation in affiliations:
+        relations_data = {relation.id: relation for relation in getattr(affiliation, "relations_data", None) or []}
+        for relation in affiliation.relations or []:
+            if getattr(relation, "external_urls", None):
+                continue
+            relation_data = relations_data.get(relation.id)
             if relation_data and getattr(relation_data, "external_urls", None):
-                relation_external_urls = relation_data.external_urls
-
-        if not relation_external_urls and getattr(relation, "id", None):
-            try:
-                # In this case use the logo from the related affiliation
-                related_aff = affiliation_repository.get_affiliation_by_id(str(relation.id))
-                if getattr(related_aff, "external_urls", None):
-                    relation_external_urls = related_aff.external_urls
-            except Exception:
-                relation_external_urls = None
-
-        relation.external_urls = relation_external_urls or []
+                relation.external_urls = relation_data.external_urls
+            elif getattr(relation, "id", None):
+                pending_relations.append(relation)
+            else:
+                relation.external_urls = []
+    if not pending_relations:
+        return
+    try:
+        external_urls = affiliation_repository.get_affiliations_external_urls(
+            list({str(relation.id) for relation in pending_relations})
+        )
+    except Exception:
+        external_urls = {}
+    for relation in pending_relations:
+        relation.external_urls = external_urls.get(str(relation.id)) or []
 
 
 def set_upper_affiliations_and_logo(affiliation: Affiliation, affiliation_type: str) -> None:
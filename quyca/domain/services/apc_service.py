@@ -0,0 +1,33 @@
+from functools import lru_cache
+from typing import Sequence
+
+import numpy as np
+from currency_converter import CurrencyConverter, RateNotFoundError
+
+from quyca.domain.constants.apc_currencies import available_currencies
+
+
+@lru_cache(maxsize=None)
+def get_usd_factors() -> dict[str, float]:
+    """
+    Factor that turns one unit of every available currency into USD at its latest ECB rate.
+
+    The rate file is parsed once per process, instead of once per plot.
+    """
+    currency_converter = CurrencyConverter()
+    usd_factors = {"USD": 1.0}
+    for currency in available_currencies:
+        if currency in usd_factors:
+            continue
+        try:
+            usd_factors[currency] = currency_converter.convert(1, currency, "USD")
+        except (ValueError, RateNotFoundError):
+            continue
+    return usd_factors
+
+
+def convert_to_usd(charges: Sequence, currencies: Sequence[str]) -> np.ndarray:
+    """Converts a batch of charges to USD. Charges in currencies without a rate come back as NaN."""
+    usd_factors = get_usd_factors()
+    factors = np.array([usd_factors.get(currency, np.nan) for currency in currencies], dtype=float)
+    return np.asarray(charges, dtype=float) * factors
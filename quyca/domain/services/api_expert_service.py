@@ -1,6 +1,9 @@
 import time
+from itertools import islice
 from typing import Generator
 
+from bson import ObjectId
+
 from quyca.domain.models.base_model import QueryParams
 from quyca.infrastructure.repositories import api_expert_repository
 from quyca.domain.parsers import work_parser
@@ -56,3 +59,12 @@ def process_works(works: Generator) -> list:
     works_list = list(works)
     data = work_parser.parse_api_expert(works_list)
     return data
+
+
+def get_works_for_export(after_id: ObjectId | None, upper_id: ObjectId | None, batch_size: int = 1000) -> Generator:
+    """
+    Yields the works of the _id range with the same shape as the API expert responses, for the bulk export.
+    """
+    works = api_expert_repository.get_works_for_export(after_id, upper_id, batch_size)
+    while batch := list(islice(works, batch_size)):
+        yield from work_parser.parse_api_expert(batch)
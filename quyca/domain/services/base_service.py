@@ -1,11 +1,11 @@
 from urllib.parse import urlparse
 
 from quyca.domain.constants.external_urls import external_urls_dict
-from quyca.domain.models.base_model import Title, ProductType, ExternalUrl
+from quyca.domain.models.base_model import Title, ProductType, ExternalUrl, QueryParams
 from quyca.domain.models.patent_model import Patent
 from quyca.domain.models.project_model import Project
 from quyca.domain.models.work_model import Work
-from quyca.infrastructure.repositories import person_repository
+from quyca.infrastructure.repositories import person_repository, base_repository
 
 
 def set_title_and_language(workable: Work | Patent | Project) -> None:
@@ -49,9 +49,13 @@ def set_product_types(workable: Work | Patent | Project) -> None:
 def set_authors_external_ids(workable: Work | Patent | Project) -> None:
     if not workable.authors:
         return
+    author_ids = list({str(author.id) for author in workable.authors if author.id})
+    if not author_ids:
+        return
+    external_ids = person_repository.get_persons_external_ids(author_ids)
     for author in workable.authors:
-        if author.id:
-            author.external_ids = person_repository.get_person_by_id(str(author.id)).external_ids
+        if author.id and str(author.id) in external_ids:
+            author.external_ids = external_ids[str(author.id)]
 
 
 def limit_authors(workable: Work | Patent | Project, limit: int = 10) -> None:
@@ -90,3 +94,21 @@ def set_external_urls(workable: Work | Patent | Project) -> None:
                     )
                 )
     workable.external_urls = list(set(new_external_urls))
+
+
+def get_next_cursor(works: list[Work], query_params: QueryParams) -> str | None:
+    if not works or len(works) < query_params.limit:  # type: ignore
+        return None
+    return base_repository.encode_cursor(works[-1].cursor_key, works[-1].id)
+
+
+def check_cursor_not_supported(query_params: QueryParams) -> None:
+    """Only the works listings return next_cursor, the other searches paginate by page."""
+    if query_params.cursor:
+        raise ValueError("Cursor pagination is only supported for works, use page instead")
+
+
+def get_total_results(total_results: int) -> dict:
+    if base_repository.is_count_capped(total_results):
+        return {"total_results": total_results, "total_results_capped": True}
+    return {"total_results": total_results}
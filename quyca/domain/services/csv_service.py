@@ -11,22 +11,21 @@ from quyca.domain.services import work_service
 from quyca.domain.parsers import work_parser
 
 
-def get_works_csv_by_affiliation(affiliation_id: str, query_params: QueryParams, affiliation_type: str) -> str:
+def get_works_csv_by_affiliation(
+    affiliation_id: str, query_params: QueryParams, affiliation_type: str
+) -> Generator[str, None, None]:
     if affiliation_type == "institution":
         affiliation_type = "education"
     works = csv_repository.get_works_csv_by_affiliation(affiliation_id, query_params, affiliation_type)
-    data = get_csv_data(works)
-    return work_parser.parse_csv(data)
+    return work_parser.parse_csv(get_csv_data(works))
 
 
-def get_works_csv_by_person(person_id: str, query_params: QueryParams) -> str:
+def get_works_csv_by_person(person_id: str, query_params: QueryParams) -> Generator[str, None, None]:
     works = csv_repository.get_works_csv_by_person(person_id, query_params)
-    data = get_csv_data(works)
-    return work_parser.parse_csv(data)
+    return work_parser.parse_csv(get_csv_data(works))
 
 
-def get_csv_data(works: Generator) -> list:
-    data = []
+def get_csv_data(works: Generator) -> Generator[Work, None, None]:
     for work in works:
         set_open_access_status(work)
         set_doi(work)
@@ -40,8 +39,7 @@ def get_csv_data(works: Generator) -> list:
         set_csv_types(work)
         set_primary_topic(work)
         source_service.update_csv_work_source(work)
-        data.append(work)
-    return data
+        yield work
 
 
 def set_primary_topic(work: Work) -> None:
@@ -1,3 +1,5 @@
+from quyca.domain.parsers import map_parser
+from quyca.infrastructure import cache, executor
 from quyca.infrastructure.repositories import (
     info_repository,
 )
@@ -18,3 +20,11 @@ def get_info() -> dict:
         "total_open_access": info_repository.get_open_access_count(),
         "total_sources": info_repository.get_entity_count("sources"),
     }
+
+
+def get_metrics() -> dict:
+    return {"caches": cache.get_stats(), "query_executor": executor.get_stats()}
+
+
+def get_map_geometry(map_name: str) -> tuple[bytes, str]:
+    return map_parser.get_map_geometry(map_name)
@@ -1,5 +1,7 @@
 from quyca.domain.constants.articles_types import articles_types_list
 from quyca.domain.models.base_model import QueryParams
+from quyca.domain.services import plot_service
+from quyca.infrastructure.cache import plot_cache
 from quyca.infrastructure.repositories import (
     plot_repository,
     work_repository,
@@ -17,19 +19,40 @@ from quyca.domain.parsers import (
 
 
 def get_person_plot(person_id: str, query_params: QueryParams) -> dict:
+    key = plot_cache.build_key("person", person_id, str(query_params.plot), query_params=query_params)
+    return plot_cache.get_or_set(key, lambda: get_materialized_or_live_plot(person_id, query_params))
+
+
+def get_person_plots(person_id: str, query_params: QueryParams) -> dict:
+    return plot_service.get_plots(
+        ["person", person_id],
+        query_params,
+        lambda plot_params: get_person_plot(person_id, plot_params),
+        lambda plots: plot_repository.get_works_plots_by_person(person_id, plots, query_params),
+    )
+
+
+def get_materialized_or_live_plot(person_id: str, query_params: QueryParams) -> dict:
+    materialized = plot_service.get_materialized_plot(["person", person_id], query_params)
+    if materialized is not None:
+        return materialized
+    return get_person_plot_data(person_id, query_params)
+
+
+def get_person_plot_data(person_id: str, query_params: QueryParams) -> dict:
     return globals()["plot_" + query_params.plot](person_id, query_params)
 
 
 def plot_annual_evolution_by_scienti_classification(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {"project": ["year_published", "types"]}
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_evolution_by_scienti_classification(works)
+    data = plot_repository.get_works_plot_by_person(
+        person_id, "annual_evolution_by_scienti_classification", query_params
+    )
+    return bar_parser.parse_annual_evolution_by_scienti_classification(data)
 
 
 def plot_annual_citation_count(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {"project": ["citations_by_year"]}
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_citation_count(works)
+    data = plot_repository.get_works_plot_by_person(person_id, "annual_citation_count", query_params)
+    return bar_parser.parse_annual_citation_count(data)
 
 
 def plot_annual_apc_expenses(person_id: str, query_params: QueryParams) -> dict:
@@ -46,12 +69,8 @@ def plot_annual_apc_expenses(person_id: str, query_params: QueryParams) -> dict:
 
 
 def plot_annual_articles_open_access(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "project": ["year_published", "open_access"],
-        "match": {"types.type": {"$in": articles_types_list}},
-    }
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    return bar_parser.parse_annual_articles_open_access(works)
+    data = plot_repository.get_works_plot_by_person(person_id, "annual_articles_open_access", query_params)
+    return bar_parser.parse_annual_articles_open_access(data)
 
 
 def plot_annual_articles_by_top_publishers(person_id: str, query_params: QueryParams) -> dict:
@@ -79,21 +98,13 @@ def plot_most_used_title_words(person_id: str, query_params: QueryParams) -> dic
 
 
 def plot_articles_by_publisher(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "work_project": ["source.id", "source.name", "source.publisher.name"],
-        "match": {"types.type": {"$in": articles_types_list}},
-    }
-    works = work_repository.get_works_with_source_by_person(person_id, query_params, pipeline_params)
-    return pie_parser.parse_articles_by_publisher(works)
+    data = plot_repository.get_works_plot_by_person(person_id, "articles_by_publisher", query_params)
+    return pie_parser.parse_articles_by_publisher(data)
 
 
 def plot_products_by_subject(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "match": {"primary_topic.display_name": {"$exists": True, "$ne": None}},
-        "project": ["primary_topic.display_name"],
-    }
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    return pie_parser.parse_products_by_subject(works)
+    data = plot_repository.get_works_plot_by_person(person_id, "products_by_subject", query_params)
+    return pie_parser.parse_products_by_subject(data)
 
 
 def plot_products_by_database(person_id: str, query_params: QueryParams) -> dict:
@@ -102,12 +113,8 @@ def plot_products_by_database(person_id: str, query_params: QueryParams) -> dict
 
 
 def plot_articles_by_access_route(person_id: str, query_params: QueryParams) -> dict:
-    pipeline_params = {
-        "match": {"types.type": {"$in": articles_types_list}},
-        "project": ["open_access"],
-    }
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    return pie_parser.parse_products_by_access_route(works)
+    data = plot_repository.get_works_plot_by_person(person_id, "articles_by_access_route", query_params)
+    return pie_parser.parse_products_by_access_route(data)
 
 
 def plot_articles_by_scienti_category(person_id: str, query_params: QueryParams) -> dict:
@@ -152,12 +159,12 @@ def plot_articles_by_publishing_institution(person_id: str, query_params: QueryP
 
 def plot_coauthorship_by_country_map(person_id: str, query_params: QueryParams) -> dict:
     data = plot_repository.get_coauthorship_by_country_map_by_person(person_id, query_params)
-    return map_parser.parse_coauthorship_by_country_map(data)
+    return map_parser.parse_coauthorship_by_country_map(data, query_params.map_format)
 
 
 def plot_coauthorship_by_colombian_department_map(person_id: str, query_params: QueryParams) -> dict:
     data = plot_repository.get_coauthorship_by_colombian_department_map_by_person(person_id, query_params)
-    return map_parser.get_coauthorship_by_colombian_department_map(data)
+    return map_parser.get_coauthorship_by_colombian_department_map(data, query_params.map_format)
 
 
 def plot_author_coauthorship_network(person_id: str, query_params: QueryParams) -> dict:
@@ -1,5 +1,6 @@
 from quyca.domain.models.base_model import QueryParams
 from quyca.domain.parsers import person_parser
+from quyca.domain.services.base_service import get_total_results, check_cursor_not_supported
 from quyca.infrastructure.repositories import person_repository
 
 
@@ -10,6 +11,7 @@ def get_person_by_id(person_id: str, pipeline_params: dict = {}) -> dict:
 
 
 def search_persons(query_params: QueryParams) -> dict:
+    check_cursor_not_supported(query_params)
     pipeline_params = {
         "project": [
             "_id",
@@ -26,4 +28,4 @@ def search_persons(query_params: QueryParams) -> dict:
     for person in persons:
         persons_list.append(person)
     data = person_parser.parse_search_result(persons_list)
-    return {"data": data, "total_results": total_results}
+    return {"data": data, **get_total_results(total_results)}
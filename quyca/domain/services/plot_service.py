@@ -0,0 +1,67 @@
+from typing import Callable
+
+from quyca.domain.models.base_model import QueryParams
+from quyca.domain.parsers import bar_parser, pie_parser, map_parser
+from quyca.infrastructure.cache import plot_cache, MISSING, has_filters
+from quyca.infrastructure.repositories import plot_repository
+
+
+def get_plots(
+    entity: list[str],
+    query_params: QueryParams,
+    get_plot: Callable[[QueryParams], dict | None],
+    get_works_plots: Callable[[list], dict],
+) -> dict:
+    """
+    Renders every plot in query_params.plots for the entity, given as the parts of its cache key. The works plots
+    that are not cached yet share one aggregation, get_works_plots, which reads the matched works once. The other
+    plots go through get_plot one by one.
+    """
+    plots = list(dict.fromkeys(plot.strip() for plot in str(query_params.plots).split(",") if plot.strip()))
+    data: dict = {}
+    keys: dict = {}
+    for plot in plots:
+        if plot not in plot_repository.works_plot_stages:
+            data[plot] = get_plot(query_params.model_copy(update={"plot": plot}))
+            continue
+        keys[plot] = plot_cache.build_key(*entity, plot, query_params=query_params)
+        if (cached := plot_cache.get(keys[plot])) is not MISSING:
+            data[plot] = cached
+            continue
+        materialized = get_materialized_plot(entity, query_params.model_copy(update={"plot": plot}))
+        if materialized is not None:
+            data[plot] = materialized
+            plot_cache.set(keys[plot], materialized)
+    if pending_plots := [plot for plot in keys if plot not in data]:
+        buckets = get_works_plots(pending_plots)
+        for plot in pending_plots:
+            data[plot] = works_plot_parsers[plot](buckets.get(plot, []))
+            plot_cache.set(keys[plot], data[plot])
+    return {plot: data[plot] for plot in plots}
+
+
+def get_materialized_plot(entity: list[str], query_params: QueryParams) -> dict | None:
+    """
+    Plot precomputed by quyca_gen_plots.py, only for requests without filters. The maps are stored as their counts,
+    the geometry is added back here unless the request asks for the counts format.
+    """
+    plot = str(query_params.plot)
+    if has_filters(query_params.model_copy(update={"map_format": None})):
+        return None
+    materialized = plot_repository.get_materialized_plot(*entity, plot)
+    if materialized is None or plot not in map_parser.map_plots:
+        return materialized
+    counts = materialized["plot"].get("counts")
+    if counts is None:
+        return None
+    return map_parser.get_map_plot(map_parser.map_plots[plot], counts, query_params.map_format)
+
+
+works_plot_parsers = {
+    "annual_evolution_by_scienti_classification": bar_parser.parse_annual_evolution_by_scienti_classification,
+    "annual_citation_count": bar_parser.parse_annual_citation_count,
+    "annual_articles_open_access": bar_parser.parse_annual_articles_open_access,
+    "products_by_subject": pie_parser.parse_products_by_subject,
+    "articles_by_publisher": pie_parser.parse_articles_by_publisher,
+    "articles_by_access_route": pie_parser.parse_products_by_access_route,
+}
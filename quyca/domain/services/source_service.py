@@ -1,13 +1,18 @@
-from domain.models.source_model import Source
+from domain.models.source_model import Source, SourceMetadata
 from domain.models.work_model import Work
 from infrastructure.repositories import source_repository
 from quyca.domain.models.base_model import QueryParams
 from typing import Dict
 from quyca.domain.parsers import source_parser
+from quyca.domain.services.base_service import get_total_results
 
 
 def update_work_source(work: Work) -> None:
     if work.source.id:
+        source_metadata = source_repository.get_source_metadata(work.source.id)
+        if source_metadata:
+            set_indexed_source_fields(work, source_metadata)
+            return
         source = source_repository.get_source_by_id(work.source.id)
         set_serials(work, source)
         set_scimago_quartile(work, source)
@@ -25,7 +30,17 @@ def update_csv_work_source(work: Work) -> None:
         work.source_apc = None
 
     set_source_urls(work, source)
-    set_scimago_quartile(work, source)
+    source_metadata = source_repository.get_source_metadata(source.id) if source.id else None
+    if source_metadata:
+        work.scimago_quartile = source_metadata.get_scimago_quartile(work.date_published)
+    else:
+        set_scimago_quartile(work, source)
+
+
+def set_indexed_source_fields(work: Work, source_metadata: SourceMetadata) -> None:
+    if source_metadata.serials:
+        work.source.external_ids = dict(source_metadata.serials)
+    work.scimago_quartile = source_metadata.get_scimago_quartile(work.date_published)
 
 
 def set_source_urls(work: Work, source: Source) -> None:
@@ -83,7 +98,7 @@ def search_sources(query_params: QueryParams) -> Dict:
 
     data = source_parser.parse_search_result(source_list)
 
-    return {"data": data, "total_results": total_sources}
+    return {"data": data, **get_total_results(total_sources)}
 
 
 def get_sources_by_entity_pipeline_params() -> Dict:
@@ -1,26 +1,24 @@
-from application.usecases.process_staff_file import ProcessStaffFileUseCase
-from application.usecases.save_staff_file import SaveStaffFileUseCase
+from datetime import datetime, timedelta, timezone
+
+from domain.repositories.staff_job_repository_interface import IStaffJobRepository
 from infrastructure.repositories.user_repository import UserRepositoryMongo
+from infrastructure import staff_job_runner
+from quyca.config import settings
+
+MAX_FILE_SIZE = 15 * 1024 * 1024
 
 """Validates a users JWT token and returns the associated data (ror_id, institution)"""
 
 
 class StaffService:
-    def __init__(
-        self,
-        process_usecase: ProcessStaffFileUseCase,
-        save_usecase: SaveStaffFileUseCase,
-        user_repo: UserRepositoryMongo,
-    ):
-        self.process_usecase = process_usecase
-        self.save_usecase = save_usecase
+    def __init__(self, job_repo: IStaffJobRepository, user_repo: UserRepositoryMongo):
+        self.job_repo = job_repo
         self.user_repo = user_repo
 
+    """Stores the uploaded file as a job for the background runner and answers with its id"""
+
     def handle_staff_upload(self, file, claims, token: str, upload_date: str) -> tuple[dict, int]:
         email = claims.get("sub")
-        ror_id = claims.get("ror_id")
-        institution = claims.get("institution")
-        user = claims.get("rol")
 
         if not self.user_repo.is_token_valid(email, token):
             return {"success": False, "msg": "Token inválido o revocado"}, 401
@@ -28,16 +26,60 @@ class StaffService:
         if not file:
             return {"success": False, "msg": "Archivo requerido"}, 400
 
-        result = self.process_usecase.execute(file, institution, file.filename, upload_date, user, email)
+        content = file.read()
+        if len(content) > MAX_FILE_SIZE:
+            return {"success": False, "msg": "El archivo supera el tamaño máximo permitido de 15 MB"}, 413
+
+        job_id = self.job_repo.create_job(
+            {
+                "email": email,
+                "ror_id": claims.get("ror_id"),
+                "institution": claims.get("institution"),
+                "user": claims.get("rol"),
+                "filename": file.filename,
+                "upload_date": upload_date,
+                "delivery": {
+                    "email": {"status": "pending", "attempts": 0, "error": None},
+                    "drive": {"status": "pending", "attempts": 0, "error": None},
+                },
+            },
+            content,
+        )
+        staff_job_runner.submit(job_id)
+
+        return {"success": True, "job_id": job_id, "status": "pending", "msg": "Archivo recibido"}, 202
+
+    """Returns the job of the user, 202 while it is running. A job whose worker stopped is submitted again"""
+
+    def get_job_status(self, job_id: str, claims, token: str) -> tuple[dict, int]:
+        email = claims.get("sub")
+
+        if not self.user_repo.is_token_valid(email, token):
+            return {"success": False, "msg": "Token inválido o revocado"}, 401
+
+        job = self.job_repo.get_job(job_id)
+        if not job or job.get("email") != email:
+            return {"success": False, "msg": "Trabajo no encontrado"}, 404
 
-        if not result["success"]:
-            if result.get("msg", "").startswith("El archivo enviado no cumple con el formato requerido de columnas"):
-                return result, 422
-            return result, 400
+        running = job["status"] in ["pending", "processing"]
+        if running and is_abandoned(job):
+            staff_job_runner.submit(job_id)
 
-        file.stream.seek(0)
-        save_result = self.save_usecase.execute(file, ror_id, institution)
+        return {
+            "success": job["status"] != "error",
+            "job_id": job_id,
+            "status": job["status"],
+            "status_code": job.get("status_code"),
+            "result": job.get("result"),
+            "delivery": job.get("delivery"),
+            "error": job.get("error"),
+        }, (202 if running else 200)
 
-        result.update({"file_msg": save_result.get("msg")})
 
-        return result, 200
+def is_abandoned(job: dict) -> bool:
+    """A claimed job whose lease expired, or one that no worker claimed within a lease."""
+    if job.get("locked_until"):
+        expires_at = job["locked_until"]
+    else:
+        expires_at = job["created_at"] + timedelta(seconds=settings.STAFF_JOB_LEASE)
+    return expires_at.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc)
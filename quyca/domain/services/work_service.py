@@ -2,6 +2,8 @@ from typing import Generator
 
 from quyca.domain.models.base_model import QueryParams
 from quyca.domain.models.work_model import Work, Abstract
+from quyca.infrastructure.cache import filter_cache
+from quyca.infrastructure.executor import run_concurrently
 from quyca.infrastructure.repositories import work_repository
 from quyca.domain.services import source_service
 from quyca.domain.services.base_service import (
@@ -11,6 +13,8 @@ from quyca.domain.services.base_service import (
     set_authors_external_ids,
     set_external_urls,
     set_external_ids,
+    get_next_cursor,
+    get_total_results,
 )
 from quyca.domain.parsers import work_parser
 
@@ -51,54 +55,78 @@ def search_works(query_params: QueryParams) -> dict:
     works, total_results = work_repository.search_works(query_params, pipeline_params)
     works_data = get_work_by_entity_data(works)
     data = work_parser.parse_search_results(works_data)
-    return {"data": data, "total_results": total_results}
+    return get_works_response(data, total_results, works_data, query_params)
 
 
 def get_search_works_available_filters(query_params: QueryParams) -> dict:
-    available_filters = work_repository.get_search_works_available_filters(query_params)
-    return work_parser.parse_available_filters(available_filters)
+    key = filter_cache.build_key("works", "search", query_params=query_params)
+    return filter_cache.get_or_set(
+        key,
+        lambda: work_parser.parse_available_filters(work_repository.get_search_works_available_filters(query_params)),
+    )
 
 
 def get_works_by_affiliation(affiliation_id: str, query_params: QueryParams) -> dict:
     pipeline_params = get_works_by_entity_pipeline_params()
-    works = work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
-    works_data = get_work_by_entity_data(works)
+    works_data, total_results = run_concurrently(
+        lambda: get_work_by_entity_data(
+            work_repository.get_works_by_affiliation(affiliation_id, query_params, pipeline_params)
+        ),
+        lambda: work_repository.get_works_count_by_affiliation(affiliation_id, query_params),
+    )
     data = work_parser.parse_works_by_entity(works_data)
-    total_results = work_repository.get_works_count_by_affiliation(affiliation_id, query_params)
-    return {"data": data, "total_results": total_results}
+    return get_works_response(data, total_results, works_data, query_params)
 
 
 def get_works_filters_by_affiliation(affiliation_id: str, query_params: QueryParams) -> dict:
-    available_filters = work_repository.get_works_available_filters_by_affiliation(affiliation_id, query_params)
-    return work_parser.parse_available_filters(available_filters)
+    key = filter_cache.build_key("works", "affiliation", affiliation_id, query_params=query_params)
+    return filter_cache.get_or_set(
+        key,
+        lambda: work_parser.parse_available_filters(
+            work_repository.get_works_available_filters_by_affiliation(affiliation_id, query_params)
+        ),
+    )
 
 
 def get_works_by_person(person_id: str, query_params: QueryParams) -> dict:
     pipeline_params = get_works_by_entity_pipeline_params()
-    works = work_repository.get_works_by_person(person_id, query_params, pipeline_params)
-    works_data = get_work_by_entity_data(works)
+    works_data, total_results = run_concurrently(
+        lambda: get_work_by_entity_data(work_repository.get_works_by_person(person_id, query_params, pipeline_params)),
+        lambda: work_repository.get_works_count_by_person(person_id, query_params),
+    )
     data = work_parser.parse_works_by_entity(works_data)
-    total_results = work_repository.get_works_count_by_person(person_id, query_params)
-    return {"data": data, "total_results": total_results}
+    return get_works_response(data, total_results, works_data, query_params)
 
 
 def get_works_filters_by_person(person_id: str, query_params: QueryParams) -> dict:
-    available_filters = work_repository.get_works_available_filters_by_person(person_id, query_params)
-    return work_parser.parse_available_filters(available_filters)
+    key = filter_cache.build_key("works", "person", person_id, query_params=query_params)
+    return filter_cache.get_or_set(
+        key,
+        lambda: work_parser.parse_available_filters(
+            work_repository.get_works_available_filters_by_person(person_id, query_params)
+        ),
+    )
 
 
 def get_work_by_entity_data(works: Generator) -> list:
     works_data = []
     for work in works:
-        limit_authors(work)
         set_title_and_language(work)
         set_product_types(work)
         works_data.append(work)
     return works_data
 
 
+def get_works_response(data: list, total_results: int, works: list, query_params: QueryParams) -> dict:
+    response = {"data": data, **get_total_results(total_results)}
+    if query_params.cursor:
+        response["next_cursor"] = get_next_cursor(works, query_params)
+    return response
+
+
 def get_works_by_entity_pipeline_params() -> dict:
     pipeline_params = {
+        "authors_limit": 10,
         "project": [
             "_id",
             "author_count",
@@ -119,6 +147,7 @@ def get_works_by_entity_pipeline_params() -> dict:
             "external_urls",
             "ranking",
             "topics",
-        ]
+            "cursor_key",
+        ],
     }
     return pipeline_params
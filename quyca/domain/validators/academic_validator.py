@@ -1,4 +1,6 @@
-from .base_validator import BaseValidator
+import numpy as np
+
+from .base_validator import BaseValidator, StaffColumns
 from typing import List, Dict, Any, Tuple
 
 ALLOWED_ACADEMIC_LEVELS = {"técnico", "pregrado", "maestria", "doctorado", "especialización", "especialización médica"}
@@ -77,3 +79,41 @@ class AcademicValidator:
             )
 
         return errors, warnings
+
+    @staticmethod
+    def validate_columns(
+        columns: StaffColumns,
+    ) -> Tuple[List[List[Tuple[int, Dict[str, Any]]]], List[List[Tuple[int, Dict[str, Any]]]]]:
+        def invalid(field: str, allowed: set) -> np.ndarray:
+            return columns.filled(field) & ~columns.check(field, lambda text: text.str.lower().isin(allowed))
+
+        errors = [
+            columns.records(
+                invalid("nivel_académico", ALLOWED_ACADEMIC_LEVELS),
+                "nivel_académico",
+                lambda value: f"El nivel académico {value} no existe en el listado",
+            ),
+            columns.records(
+                invalid("jornada_laboral", ALLOWED_WORK_SCHEDULES),
+                "jornada_laboral",
+                lambda value: f"La jornada laboral {value} no se encontró en el listado",
+            ),
+            columns.records(
+                invalid("sexo", ALLOWED_GENDERS),
+                "sexo",
+                lambda value: f"{value} no válido solo se permite (hombre, mujer, intersexual o ninguno)",
+            ),
+        ]
+        warnings = [
+            columns.records(
+                invalid("tipo_contrato", ALLOWED_CONTRACT_TYPES),
+                "tipo_contrato",
+                lambda value: f"El tipo de contrato {value} no está en el listado",
+            ),
+            columns.records(
+                invalid("categoría_laboral", ALLOWED_JOB_CATEGORIES),
+                "categoría_laboral",
+                lambda value: f"{value} no está en el listado de categoría laboral",
+            ),
+        ]
+        return errors, warnings
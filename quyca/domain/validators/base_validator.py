@@ -1,3 +1,6 @@
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
 import pandas as pd
 
 
@@ -14,3 +17,78 @@ class BaseValidator:
         if isinstance(value, str) and value.strip() == "":
             return True
         return False
+
+
+class StaffColumns:
+    """
+    Column-wise view of a staff DataFrame for the validators. The values are the same ones df.iterrows() gives for
+    each row, the rules are applied as masks over the whole column and only the failing rows become records.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.index = df.index.tolist()
+        data = df.values
+        self.data = {column: data[:, position] for position, column in enumerate(df.columns)}
+        self._values: Dict[Any, pd.Series] = {}
+        self._texts: Dict[Any, Tuple[np.ndarray, pd.Series]] = {}
+        self._filled: Dict[Any, np.ndarray] = {}
+
+    def values(self, column: str) -> pd.Series:
+        """The values as row.to_dict() boxes them, None for a missing column like row.get()."""
+        if column not in self._values:
+            values = self.data.get(column)
+            if values is None:
+                values = [None] * len(self.index)
+            elif values.dtype == object and any(issubclass(kind, np.generic) for kind in set(map(type, values))):
+                values = list(pd.Series(values, dtype=object).to_dict().values())
+            else:
+                values = values.tolist()
+            self._values[column] = pd.Series(values, dtype=object)
+        return self._values[column]
+
+    def texts(self, column: str) -> Tuple[np.ndarray, pd.Series]:
+        """
+        The distinct str(value).strip() of the column and the position of each row's text among them. Staff files
+        repeat the same few values, so the rules only run over the distinct texts.
+        """
+        if column not in self._texts:
+            codes, uniques = pd.factorize(self.values(column).map(str))
+            self._texts[column] = (codes, pd.Series(uniques, dtype=object).str.strip())
+        return self._texts[column]
+
+    def check(self, column: str, rule: Callable[[pd.Series], pd.Series]) -> np.ndarray:
+        """Applies the rule to the texts of the column and returns its result for each row."""
+        codes, texts = self.texts(column)
+        return rule(texts).to_numpy(dtype=bool)[codes]
+
+    def filled(self, column: str) -> np.ndarray:
+        """Opposite of BaseValidator.is_empty for each value."""
+        if column not in self._filled:
+            values = self.values(column)
+            missing = values.isna().to_numpy(copy=True)
+            if missing.any():
+                missing[missing] = [value is None or isinstance(value, float) for value in values[missing]]
+            self._filled[column] = ~(missing | self.check(column, lambda text: text == ""))
+        return self._filled[column]
+
+    def records(
+        self,
+        mask: np.ndarray,
+        column: str,
+        detail: str | Callable[[Any], str],
+        valor: Callable[[Any], Any] = lambda value: value,
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Builds the (row position, record) pairs of the rows in the mask."""
+        values = self.values(column).to_numpy()
+        return [
+            (
+                position,
+                {
+                    "fila": self.index[position],
+                    "columna": column,
+                    "detalle": detail(values[position]) if callable(detail) else detail,
+                    "valor": valor(values[position]),
+                },
+            )
+            for position in np.flatnonzero(mask).tolist()
+        ]
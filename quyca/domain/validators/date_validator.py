@@ -1,7 +1,7 @@
 from datetime import datetime, date
 import pandas as pd
-from typing import Dict, Any, Optional
-from .base_validator import BaseValidator
+from typing import Dict, Any, List, Optional, Tuple
+from .base_validator import BaseValidator, StaffColumns
 
 
 class DateValidator:
@@ -24,3 +24,20 @@ class DateValidator:
                 "detalle": f"Formato inválido, debe ser DD/MM/YYYY y mandaste {value}",
                 "valor": value,
             }
+
+    @staticmethod
+    def validate_column(columns: StaffColumns, field: str) -> List[Tuple[int, Dict[str, Any]]]:
+        """The date type check only runs on the values whose text did not parse."""
+
+        def is_invalid(text: str) -> bool:
+            try:
+                datetime.strptime(text, "%d/%m/%Y")
+                return False
+            except Exception:
+                return True
+
+        mask = columns.filled(field) & columns.check(field, lambda texts: texts.map(is_invalid))
+        if mask.any():
+            values = columns.values(field)[mask]
+            mask[mask] = [not isinstance(value, (pd.Timestamp, datetime, date)) for value in values]
+        return columns.records(mask, field, lambda value: f"Formato inválido, debe ser DD/MM/YYYY y mandaste {value}")
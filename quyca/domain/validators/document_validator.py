@@ -1,9 +1,12 @@
 import re
-from typing import List, Dict, Any
-from .base_validator import BaseValidator
+
+import numpy as np
+from typing import List, Dict, Any, Tuple
+from .base_validator import BaseValidator, StaffColumns
 
 PASSPORT_RE = re.compile(r"^[A-Za-z0-9]+$")
 ALLOWED_DOCUMENT_TYPES = {"cédula de ciudadanía", "cédula de extranjería", "pasaporte"}
+NUMERIC_DOCUMENT_TYPES = ["cédula de ciudadanía", "cédula de extranjería"]
 
 
 class DocumentValidator:
@@ -34,7 +37,7 @@ class DocumentValidator:
                 id_str = str(identificacion).strip()
                 tnorm = str(tipo_documento).strip().lower()
 
-                if tnorm in {"cédula de ciudadanía", "cédula de extranjería"} and not id_str.isdigit():
+                if tnorm in NUMERIC_DOCUMENT_TYPES and not id_str.isdigit():
                     errors.append(
                         {
                             "fila": index,
@@ -54,3 +57,33 @@ class DocumentValidator:
                     )
 
         return errors
+
+    @staticmethod
+    def validate_columns(columns: StaffColumns) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        filled = columns.filled("tipo_documento")
+        checked = filled & columns.filled("identificación")
+        numeric_id = columns.check("identificación", lambda text: text.str.isdigit())
+
+        def is_type(document_types: List[str]) -> np.ndarray:
+            return columns.check("tipo_documento", lambda text: text.str.lower().isin(document_types))
+
+        type_errors = columns.records(
+            filled & ~is_type(list(ALLOWED_DOCUMENT_TYPES)),
+            "tipo_documento",
+            lambda value: f"El tipo de documento {str(value).strip().lower()} no es válido",
+        )
+        id_errors = []
+        for document_type in NUMERIC_DOCUMENT_TYPES:
+            id_errors += columns.records(
+                checked & is_type([document_type]) & ~numeric_id,
+                "identificación",
+                f"La {document_type} debe ser numérica",
+            )
+        id_errors += columns.records(
+            checked
+            & is_type(["pasaporte"])
+            & ~columns.check("identificación", lambda text: text.str.match(PASSPORT_RE)),
+            "identificación",
+            "Formato inválido para pasaporte",
+        )
+        return [type_errors, id_errors]
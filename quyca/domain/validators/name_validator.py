@@ -1,8 +1,9 @@
 import re
-from typing import List, Dict, Any
-from .base_validator import BaseValidator
+from typing import List, Dict, Any, Tuple
+from .base_validator import BaseValidator, StaffColumns
 
 NAME_RE = re.compile(r"^[A-Za-zÁÉÍÓÚÜÑáéíóúüñ' \-]+$")
+NAME_FIELDS = ["primer_apellido", "segundo_apellido", "nombres"]
 
 
 class NameValidator:
@@ -12,10 +13,21 @@ class NameValidator:
     @staticmethod
     def validate(row: dict, index: int) -> List[Dict[str, Any]]:
         errors: List[Dict[str, Any]] = []
-        for field in ["primer_apellido", "segundo_apellido", "nombres"]:
+        for field in NAME_FIELDS:
             value = row.get(field)
             if not BaseValidator.is_empty(value) and not NAME_RE.match(str(value).strip()):
                 errors.append(
                     {"fila": index, "columna": field, "detalle": f"El nombre {value} no es permitido", "valor": value}
                 )
         return errors
+
+    @staticmethod
+    def validate_columns(columns: StaffColumns) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        return [
+            columns.records(
+                columns.filled(field) & ~columns.check(field, lambda text: text.str.match(NAME_RE)),
+                field,
+                lambda value: f"El nombre {value} no es permitido",
+            )
+            for field in NAME_FIELDS
+        ]
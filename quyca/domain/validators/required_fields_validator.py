@@ -1,5 +1,5 @@
-from typing import List, Dict, Any
-from .base_validator import BaseValidator
+from typing import List, Dict, Any, Tuple
+from .base_validator import BaseValidator, StaffColumns
 
 REQUIRED_FIELDS = [
     "tipo_documento",
@@ -31,3 +31,10 @@ class RequiredFieldsValidator:
             if BaseValidator.is_empty(value):
                 errors.append({"fila": index, "columna": field, "detalle": "Campo obligatorio vacío", "valor": "Vacío"})
         return errors
+
+    @staticmethod
+    def validate_columns(columns: StaffColumns) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        return [
+            columns.records(~columns.filled(field), field, "Campo obligatorio vacío", lambda value: "Vacío")
+            for field in REQUIRED_FIELDS
+        ]
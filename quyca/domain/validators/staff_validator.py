@@ -1,4 +1,5 @@
 from typing import List, Dict, Any, Tuple
+from .base_validator import StaffColumns
 from .required_fields_validator import RequiredFieldsValidator
 from domain.models.staff_report_model import StaffReport
 from .document_validator import DocumentValidator
@@ -31,6 +32,8 @@ REQUIARED_COLUMNS = [
 
 EXTRA_ALLOWED = {"estado_de_validación", "observación"}
 
+DATE_FIELDS = ["fecha_nacimiento", "fecha_inicial_vinculación", "fecha_final_vinculación"]
+
 
 class StaffValidator:
     """Convert DataFrame index to real Excel row number (header=1, first data row=2)."""
@@ -85,7 +88,7 @@ class StaffValidator:
 
         errors.extend(NameValidator.validate(row, index))
 
-        for field in ["fecha_nacimiento", "fecha_inicial_vinculación", "fecha_final_vinculación"]:
+        for field in DATE_FIELDS:
             err = DateValidator.validate(row.get(field), field, index)
             if err:
                 errors.append(err)
@@ -98,17 +101,29 @@ class StaffValidator:
 
         return {"errores": errors, "advertencias": warnings}
 
-    """Validates the entire DataFrame, checking rows and duplicates."""
+    """Orders the records of the column checks as validate_row would for each row: by row, then by check."""
 
     @staticmethod
-    def validate_dataframe(df: pd.DataFrame) -> StaffReport:
-        errors: List[Dict[str, Any]] = []
-        warnings: List[Dict[str, Any]] = []
+    def merge_checks(checks: List[List[Tuple[int, Dict[str, Any]]]]) -> List[Dict[str, Any]]:
+        records = [(position, order, record) for order, check in enumerate(checks) for position, record in check]
+        records.sort(key=lambda item: (item[0], item[1]))
+        return [record for _, _, record in records]
 
-        for idx, row in df.iterrows():
-            r = StaffValidator.validate_row(row.to_dict(), idx)
-            errors.extend(r["errores"])
-            warnings.extend(r["advertencias"])
+    """Validates the entire DataFrame column by column, checking rows and duplicates."""
+
+    @staticmethod
+    def validate_dataframe(df: pd.DataFrame) -> StaffReport:
+        columns = StaffColumns(df)
+        academic_errors, academic_warnings = AcademicValidator.validate_columns(columns)
+        errors = StaffValidator.merge_checks(
+            RequiredFieldsValidator.validate_columns(columns)
+            + DocumentValidator.validate_columns(columns)
+            + NameValidator.validate_columns(columns)
+            + [DateValidator.validate_column(columns, field) for field in DATE_FIELDS]
+            + academic_errors
+            + UnitValidator.validate_columns(columns)
+        )
+        warnings = StaffValidator.merge_checks(academic_warnings)
 
         dedupe_cols = [c for c in df.columns if c in REQUIARED_COLUMNS]
 
@@ -1,9 +1,11 @@
 import re
-from typing import List, Dict, Any
-from .base_validator import BaseValidator
+from typing import List, Dict, Any, Tuple
+from .base_validator import BaseValidator, StaffColumns
 
 CODE_RE = re.compile(r"^[0-9_]+$")
 UNIT_RE = re.compile(r"^[A-Za-zÁÉÍÓÚÜÑáéíóúüñ0-9, \-]+$")
+CODE_FIELDS = ["código_unidad_académica", "código_subunidad_académica"]
+UNIT_FIELDS = ["unidad_académica", "subunidad_académica"]
 
 
 class UnitValidator:
@@ -13,7 +15,7 @@ class UnitValidator:
     @staticmethod
     def validate(row: dict, index: int) -> List[Dict[str, Any]]:
         errors: List[Dict[str, Any]] = []
-        for field in ["código_unidad_académica", "código_subunidad_académica"]:
+        for field in CODE_FIELDS:
             value = row.get(field)
             if not BaseValidator.is_empty(value) and not CODE_RE.match(str(value).strip()):
                 errors.append(
@@ -25,7 +27,7 @@ class UnitValidator:
                     }
                 )
 
-        for field in ["unidad_académica", "subunidad_académica"]:
+        for field in UNIT_FIELDS:
             value = row.get(field)
             if not BaseValidator.is_empty(value) and not UNIT_RE.match(str(value).strip()):
                 errors.append(
@@ -37,3 +39,23 @@ class UnitValidator:
                     }
                 )
         return errors
+
+    @staticmethod
+    def validate_columns(columns: StaffColumns) -> List[List[Tuple[int, Dict[str, Any]]]]:
+        checks = [
+            columns.records(
+                columns.filled(field) & ~columns.check(field, lambda text: text.str.match(CODE_RE)),
+                field,
+                lambda value: f"No se permite {value}, solo números y _",
+            )
+            for field in CODE_FIELDS
+        ]
+        checks += [
+            columns.records(
+                columns.filled(field) & ~columns.check(field, lambda text: text.str.match(UNIT_RE)),
+                field,
+                lambda value: f"Solo letras, números y espacios permitidos ya que {value} no es permitido",
+            )
+            for field in UNIT_FIELDS
+        ]
+        return checks
@@ -0,0 +1,159 @@
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import bson
+from sentry_sdk import capture_exception
+
+from quyca.config import settings
+from quyca.domain.models.base_model import QueryParams
+from quyca.infrastructure.mongo import impactu_database
+from quyca.infrastructure.repositories import info_repository
+
+MISSING = object()
+
+not_filter_params = {"plot", "plots", "page", "limit", "sort", "cursor"}
+
+
+class VersionedCache:
+    """
+    Cache for responses that only change when kahi loads new data.
+
+    Keys are namespaced by the last db update, so a new load makes every previous entry unreachable at once.
+    The first tier is an LRU local to the worker and the second one a Mongo collection shared by all the workers,
+    whose stale entries are removed by a TTL index. The local tier keeps the values BSON encoded, so it is bound
+    by bytes as well as by entries, and every read decodes a new copy that the caller is free to modify.
+    """
+
+    def __init__(self, namespace: str, max_size: int, max_bytes: int):
+        self.namespace = namespace
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.entries: OrderedDict[str, bytes] = OrderedDict()
+        self.size_bytes = 0
+        self.lock = threading.Lock()
+        self.stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "errors": 0}
+        self.shared_index_ready = False
+        caches[namespace] = self
+
+    def build_key(self, *parts: str, query_params: QueryParams | None = None) -> str | None:
+        if not settings.CACHE_ENABLED:
+            return None
+        try:
+            version = info_repository.get_db_version()
+        except Exception as e:
+            self.count("errors")
+            capture_exception(e)
+            return None
+        filters = get_normalized_filters(query_params) if query_params else ""
+        return ":".join([self.namespace, str(version), *parts, filters])
+
+    def get(self, key: str | None) -> Any:
+        if key is None:
+            return MISSING
+        with self.lock:
+            encoded = self.entries.get(key)
+            if encoded is not None:
+                self.entries.move_to_end(key)
+                self.stats["local_hits"] += 1
+        if encoded is not None:
+            return bson.decode(encoded)["value"]
+        try:
+            document = impactu_database["cache"].find_one({"_id": key}, {"value": 1})
+        except Exception as e:
+            self.count("errors")
+            capture_exception(e)
+            document = None
+        if document is None:
+            self.count("misses")
+            return MISSING
+        self.count("shared_hits")
+        self.set_local(key, document["value"])
+        return document["value"]
+
+    def set(self, key: str | None, value: Any) -> None:
+        if key is None or value is None:
+            return
+        self.set_local(key, value)
+        try:
+            self.ensure_shared_index()
+            impactu_database["cache"].replace_one(
+                {"_id": key},
+                {"namespace": self.namespace, "value": value, "created_at": datetime.now(timezone.utc)},
+                upsert=True,
+            )
+        except Exception as e:
+            self.count("errors")
+            capture_exception(e)
+
+    def get_or_set(self, key: str | None, compute: Callable[[], Any]) -> Any:
+        value = self.get(key)
+        if value is MISSING:
+            value = compute()
+            self.set(key, value)
+        return value
+
+    """Values larger than a quarter of the byte budget, like the maps, are only kept in the shared tier"""
+
+    def set_local(self, key: str, value: Any) -> None:
+        try:
+            encoded = bson.encode({"value": value})
+        except Exception as e:
+            self.count("errors")
+            capture_exception(e)
+            return
+        with self.lock:
+            if key in self.entries:
+                self.size_bytes -= len(self.entries.pop(key))
+            if len(encoded) > self.max_bytes // 4:
+                return
+            self.entries[key] = encoded
+            self.size_bytes += len(encoded)
+            while len(self.entries) > self.max_size or self.size_bytes > self.max_bytes:
+                self.size_bytes -= len(self.entries.popitem(last=False)[1])
+
+    def ensure_shared_index(self) -> None:
+        if self.shared_index_ready:
+            return
+        impactu_database["cache"].create_index("created_at", expireAfterSeconds=settings.CACHE_SHARED_TTL)
+        self.shared_index_ready = True
+
+    def count(self, stat: str) -> None:
+        with self.lock:
+            self.stats[stat] += 1
+
+    def get_stats(self) -> dict:
+        with self.lock:
+            return {
+                **self.stats,
+                "local_size": len(self.entries),
+                "local_max_size": self.max_size,
+                "local_bytes": self.size_bytes,
+                "local_max_bytes": self.max_bytes,
+            }
+
+
+def get_normalized_filters(query_params: QueryParams) -> str:
+    filters = {}
+    for name, value in query_params.model_dump(exclude_none=True).items():
+        if name in not_filter_params:
+            continue
+        if isinstance(value, str):
+            value = ",".join(sorted(item.strip() for item in value.split(",")))
+        filters[name] = value
+    return json.dumps(filters, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+
+
+def has_filters(query_params: QueryParams) -> bool:
+    return get_normalized_filters(query_params) != "{}"
+
+
+def get_stats() -> dict:
+    return {namespace: cache.get_stats() for namespace, cache in caches.items()}
+
+
+caches: dict[str, VersionedCache] = {}
+plot_cache = VersionedCache("plots", settings.CACHE_LOCAL_SIZE, settings.CACHE_LOCAL_BYTES)
+filter_cache = VersionedCache("filters", settings.CACHE_LOCAL_SIZE, settings.CACHE_LOCAL_BYTES)
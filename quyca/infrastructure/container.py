@@ -5,11 +5,21 @@ from infrastructure.repositories.file_repository import FileRepository
 from infrastructure.notifications.staff_notification import StaffNotification
 from application.usecases.process_staff_file import ProcessStaffFileUseCase
 from application.usecases.save_staff_file import SaveStaffFileUseCase
+from application.usecases.run_staff_job import RunStaffJobUseCase
 from domain.services.staff_report_service import StaffReportService
 from infrastructure.repositories.user_repository import UserRepositoryMongo
+from infrastructure.repositories.staff_job_repository import StaffJobRepositoryMongo
+from quyca.config import settings
 
 
 def build_staff_service():
+    job_repo = StaffJobRepositoryMongo()
+    user_repo = UserRepositoryMongo()
+
+    return job_repo, user_repo
+
+
+def build_staff_job():
     pdf_repo = PDFRepository()
     gmail_repo = GmailRepository()
     drive_repo = GoogleDriveRepository()
@@ -20,6 +30,13 @@ def build_staff_service():
 
     process_usecase = ProcessStaffFileUseCase(report_service, notification_service)
     save_usecase = SaveStaffFileUseCase(file_repo)
-    user_repo = UserRepositoryMongo()
+    job_repo = StaffJobRepositoryMongo()
 
-    return process_usecase, save_usecase, user_repo
+    return RunStaffJobUseCase(
+        process_usecase,
+        save_usecase,
+        job_repo,
+        max_attempts=settings.STAFF_JOB_MAX_ATTEMPTS,
+        retry_delay=settings.STAFF_JOB_RETRY_DELAY,
+        lease=settings.STAFF_JOB_LEASE,
+    )
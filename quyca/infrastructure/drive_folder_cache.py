@@ -0,0 +1,71 @@
+import threading
+
+from sentry_sdk import capture_exception
+
+from quyca.infrastructure.mongo import impactu_database
+
+
+class DriveFolderCache:
+    """
+    Ids of the Drive folders by parent and name, and of the shortcut targets, so a repeated upload skips the
+    lookups and goes straight to the upload.
+
+    The first tier is local to the worker and the second one the drive_folders collection shared by all the
+    workers. Drive ids never change, so entries only leave the cache when their folder is trashed or Drive answers
+    404 for it.
+    """
+
+    def __init__(self):
+        self.entries: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self.lock:
+            if key in self.entries:
+                return self.entries[key]["folder_id"]
+        try:
+            document = impactu_database["drive_folders"].find_one({"_id": key})
+        except Exception as e:
+            capture_exception(e)
+            document = None
+        if document is None:
+            return None
+        with self.lock:
+            self.entries[key] = document
+        return document["folder_id"]
+
+    def set(self, key: str, folder_id: str, parent_id: str | None = None) -> None:
+        document = {"_id": key, "folder_id": folder_id, "parent_id": parent_id}
+        with self.lock:
+            self.entries[key] = document
+        try:
+            impactu_database["drive_folders"].replace_one({"_id": key}, document, upsert=True)
+        except Exception as e:
+            capture_exception(e)
+
+    """Removes the entries of the folders and of their children"""
+
+    def invalidate(self, folder_ids: list[str]) -> None:
+        with self.lock:
+            self.entries = {
+                key: document
+                for key, document in self.entries.items()
+                if document["folder_id"] not in folder_ids and document["parent_id"] not in folder_ids
+            }
+        try:
+            impactu_database["drive_folders"].delete_many(
+                {"$or": [{"folder_id": {"$in": folder_ids}}, {"parent_id": {"$in": folder_ids}}]}
+            )
+        except Exception as e:
+            capture_exception(e)
+
+
+def get_folder_key(parent_id: str | None, folder_name: str) -> str:
+    return f"folder:{parent_id or ''}/{folder_name}"
+
+
+def get_shortcut_key(folder_id: str) -> str:
+    return f"shortcut:{folder_id}"
+
+
+drive_folder_cache = DriveFolderCache()
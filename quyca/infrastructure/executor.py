@@ -0,0 +1,103 @@
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from quyca.config import settings
+
+
+class QueryExecutor:
+    """
+    Thread pool shared by the requests of a worker to run independent repository calls at the same time.
+
+    Its size caps the Mongo operations a worker has in flight through it. Like the Mongo client, the pool is
+    created on first use and again after a fork. Calls made from a pool thread run inline, so nested fan-outs
+    can not wait on themselves for a free thread.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stats = {"submitted": 0, "completed": 0, "errors": 0, "inline": 0, "in_flight": 0, "max_in_flight": 0}
+        self.wait_time = 0.0
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._pool is None or self._pid != pid:
+            with self._lock:
+                if self._pool is None or self._pid != pid:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quyca-query")
+                    self._pid = pid
+        return self._pool
+
+    def reset_after_fork(self) -> None:
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def run_concurrently(self, *calls: Callable[[], Any]) -> list:
+        """
+        Runs the calls in the pool and returns their results in the same order. The first error is raised once
+        every call has finished.
+        """
+        if self.max_workers <= 1 or len(calls) <= 1 or getattr(self._local, "in_pool", False):
+            self.count("inline", len(calls))
+            return [call() for call in calls]
+        submitted_at = time.perf_counter()
+        futures = [self.get_pool().submit(self.run_call, call, submitted_at) for call in calls]
+        self.count("submitted", len(calls))
+        results = []
+        error = None
+        for future in futures:
+            try:
+                results.append(future.result())
+            except Exception as e:
+                error = error or e
+                results.append(None)
+        if error:
+            raise error
+        return results
+
+    def run_call(self, call: Callable[[], Any], submitted_at: float) -> Any:
+        self._local.in_pool = True
+        with self._lock:
+            self.wait_time += time.perf_counter() - submitted_at
+            self.stats["in_flight"] += 1
+            self.stats["max_in_flight"] = max(self.stats["max_in_flight"], self.stats["in_flight"])
+        try:
+            result = call()
+            self.count("completed")
+            return result
+        except Exception:
+            self.count("errors")
+            raise
+        finally:
+            self.count("in_flight", -1)
+
+    def count(self, stat: str, amount: int = 1) -> None:
+        with self._lock:
+            self.stats[stat] += amount
+
+    def get_stats(self) -> dict:
+        with self._lock:
+            submitted = self.stats["submitted"]
+            average_wait_ms = self.wait_time / submitted * 1000 if submitted else 0
+            return {**self.stats, "max_workers": self.max_workers, "average_wait_ms": round(average_wait_ms, 3)}
+
+
+def run_concurrently(*calls: Callable[[], Any]) -> list:
+    return query_executor.run_concurrently(*calls)
+
+
+def get_stats() -> dict:
+    return query_executor.get_stats()
+
+
+query_executor = QueryExecutor(settings.QUERY_EXECUTOR_MAX_WORKERS)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=query_executor.reset_after_fork)
@@ -0,0 +1,102 @@
+import os
+import pickle
+import threading
+from typing import Any
+
+import httplib2
+from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, Resource
+from googleapiclient.http import HttpRequest
+
+
+class GoogleClientManager:
+    """
+    Keeps the Google credentials and API clients of the process.
+
+    The credentials file is read once and the token is refreshed in place when it expires, so Gmail and Drive
+    share it. The clients are built on first use from the discovery documents bundled with googleapiclient,
+    without fetching them. httplib2 connections are not thread safe, so each thread sends its requests
+    through its own authorized connection. Like the Mongo client, everything is created again after a fork.
+    """
+
+    def __init__(self):
+        self._credentials: Any = None
+        self._credentials_path: str | None = None
+        self._services: dict[tuple[str, str], Resource] = {}
+        self._pid: int | None = None
+        self._lock = threading.RLock()
+        self._local = threading.local()
+
+    def get_credentials(self, credentials_path: str | None) -> Any:
+        if not credentials_path:
+            raise ValueError("GOOGLE_CREDENTIALS no está configurado")
+        with self._lock:
+            self.check_pid()
+            if self._credentials is None or self._credentials_path != credentials_path:
+                if not os.path.exists(credentials_path):
+                    raise FileNotFoundError(f"No se encontró el archivo {credentials_path}")
+                with open(credentials_path, "rb") as f:
+                    self._credentials = pickle.load(f)
+                self._credentials_path = credentials_path
+                self._services = {}
+            self.refresh_credentials()
+            return self._credentials
+
+    def refresh_credentials(self) -> None:
+        with self._lock:
+            creds = self._credentials
+            if getattr(creds, "expired", False) and getattr(creds, "refresh_token", None):
+                creds.refresh(Request())
+
+    def get_service(self, credentials_path: str | None, name: str, version: str) -> Resource:
+        credentials = self.get_credentials(credentials_path)
+        with self._lock:
+            if (name, version) not in self._services:
+                self._services[(name, version)] = build(
+                    name,
+                    version,
+                    http=AuthorizedHttp(credentials, http=httplib2.Http()),
+                    requestBuilder=self.build_request,
+                    static_discovery=True,
+                )
+            return self._services[(name, version)]
+
+    def get_http(self) -> AuthorizedHttp:
+        """The authorized connection of the current thread, for the current credentials."""
+        http = getattr(self._local, "http", None)
+        if http is None or http.credentials is not self._credentials:
+            http = AuthorizedHttp(self._credentials, http=httplib2.Http())
+            self._local.http = http
+        self.refresh_credentials()
+        return http
+
+    def build_request(self, http: Any, *args: Any, **kwargs: Any) -> HttpRequest:
+        return HttpRequest(self.get_http(), *args, **kwargs)
+
+    def check_pid(self) -> None:
+        pid = os.getpid()
+        if self._pid != pid:
+            self._credentials = None
+            self._credentials_path = None
+            self._services = {}
+            self._local = threading.local()
+            self._pid = pid
+
+    def reset_after_fork(self) -> None:
+        self._lock = threading.RLock()
+        self._pid = None
+        self.check_pid()
+
+
+def get_credentials(credentials_path: str | None) -> Any:
+    return client_manager.get_credentials(credentials_path)
+
+
+def get_service(credentials_path: str | None, name: str, version: str) -> Resource:
+    return client_manager.get_service(credentials_path, name, version)
+
+
+client_manager = GoogleClientManager()
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=client_manager.reset_after_fork)
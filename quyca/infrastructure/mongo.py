@@ -1,8 +1,95 @@
+import os
+import threading
+from typing import Any
+
 from pymongo import MongoClient
+from sentry_sdk import capture_exception
+from pymongo.collection import Collection
 from pymongo.database import Database
 
 from quyca.config import settings
 
-database: Database = MongoClient(host=str(settings.MONGO_URI))[settings.MONGO_DATABASE]
-calculations_database: Database = MongoClient(host=str(settings.MONGO_URI))[settings.MONGO_CALCULATIONS_DATABASE]
-impactu_database: Database = MongoClient(host=str(settings.MONGO_URI))[settings.MONGO_IMPACTU_DATABASE]
+
+class MongoClientManager:
+    """
+    Keeps a single pooled MongoClient per process.
+
+    The client is created on first use instead of at import time, so gunicorn workers never inherit
+    a client (and its sockets and monitor threads) opened in the master process before the fork.
+    """
+
+    def __init__(self, uri: str):
+        self.uri = uri
+        self._client: MongoClient | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def get_client(self) -> MongoClient:
+        pid = os.getpid()
+        if self._client is None or self._pid != pid:
+            with self._lock:
+                if self._client is None or self._pid != pid:
+                    self._client = MongoClient(host=self.uri, connect=False, **get_client_options())
+                    self._pid = pid
+        return self._client
+
+    def reset_after_fork(self) -> None:
+        self._client = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def warm_up(self) -> None:
+        self.get_client().admin.command("ping")
+
+
+class DatabaseHandle:
+    """Proxy to a database of the current process client, so module level handles stay importable."""
+
+    def __init__(self, manager: MongoClientManager, name: str):
+        self.manager = manager
+        self.name = name
+
+    def get_database(self) -> Database:
+        return self.manager.get_client()[self.name]
+
+    def __getitem__(self, collection_name: str) -> Collection:
+        return self.get_database()[collection_name]
+
+    def __getattr__(self, attribute: str) -> Any:
+        return getattr(self.get_database(), attribute)
+
+
+def get_client_options() -> dict:
+    options: dict = {
+        "maxPoolSize": settings.MONGO_MAX_POOL_SIZE,
+        "minPoolSize": settings.MONGO_MIN_POOL_SIZE,
+        "serverSelectionTimeoutMS": settings.MONGO_SERVER_SELECTION_TIMEOUT_MS,
+    }
+    compressors = [compressor.strip() for compressor in settings.MONGO_COMPRESSORS.split(",") if compressor.strip()]
+    if compressors:
+        options["compressors"] = compressors
+    return options
+
+
+def warm_up() -> None:
+    """
+    Opens the pool connections in a background thread, so an unreachable server does not hold the app start
+    for the whole server selection timeout.
+    """
+
+    def ping() -> None:
+        try:
+            client_manager.warm_up()
+        except Exception as e:
+            capture_exception(e)
+
+    threading.Thread(target=ping, name="quyca-mongo-warm-up", daemon=True).start()
+
+
+client_manager = MongoClientManager(str(settings.MONGO_URI))
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=client_manager.reset_after_fork)
+
+database = DatabaseHandle(client_manager, settings.MONGO_DATABASE)
+calculations_database = DatabaseHandle(client_manager, settings.MONGO_CALCULATIONS_DATABASE)
+impactu_database = DatabaseHandle(client_manager, settings.MONGO_IMPACTU_DATABASE)
@@ -4,9 +4,9 @@ from typing import Generator, Tuple
 from domain.models.base_model import QueryParams
 from domain.constants.institutions import institutions_list
 from infrastructure.generators import affiliation_generator
-from domain.models.affiliation_model import Affiliation
+from domain.models.affiliation_model import Affiliation, Relation
 from infrastructure.repositories import base_repository
-from infrastructure.mongo import database
+from quyca.infrastructure.mongo import database
 from infrastructure.repositories.base_repository import set_project
 from domain.exceptions.not_entity_exception import NotEntityException
 
@@ -20,6 +20,16 @@ def get_affiliation_by_id(affiliation_id: str) -> Affiliation:
     return Affiliation(**affiliation_data)
 
 
+def get_affiliations_external_urls(affiliation_ids: list) -> dict:
+    affiliations = database["affiliations"].find({"_id": {"$in": affiliation_ids}}, {"external_urls": 1})
+    return {
+        affiliation["_id"]: Relation(
+            id=affiliation["_id"], external_urls=affiliation.get("external_urls")
+        ).external_urls
+        for affiliation in affiliations
+    }
+
+
 def get_affiliations_by_institution(institution_id: str, relation_type: str) -> Generator:
     pipeline = [
         {
@@ -84,6 +94,8 @@ def search_affiliations(
                 "types.type": {"$in": types},
             }
         },
+    ]
+    relations_stages = [
         {
             "$lookup": {
                 "from": "affiliations",
@@ -94,12 +106,14 @@ def search_affiliations(
             }
         },
     ]
-    base_repository.set_search_end_stages(pipeline, query_params, pipeline_params)
+    if base_repository.is_facet_search(query_params):
+        base_repository.set_search_facet_stages(pipeline, query_params, pipeline_params, relations_stages)
+        affiliations, total_results = base_repository.get_search_facet_results(
+            database["affiliations"].aggregate(pipeline)
+        )
+        return affiliation_generator.get(affiliations), total_results
+    count_pipeline = pipeline + [{"$count": "total_results"}]
+    base_repository.set_search_end_stages(pipeline, query_params, pipeline_params, relations_stages)
     affiliations = database["affiliations"].aggregate(pipeline)
-    count_pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-    count_pipeline += [
-        {"$match": {"types.type": {"$in": types}}},
-        {"$count": "total_results"},
-    ]
     total_results = next(database["affiliations"].aggregate(count_pipeline), {"total_results": 0})["total_results"]
     return affiliation_generator.get(affiliations), total_results
@@ -1,11 +1,38 @@
 from typing import Any, Generator
 
+from bson import ObjectId
+
 from quyca.infrastructure.generators import work_generator
 from quyca.domain.models.base_model import QueryParams
 from quyca.infrastructure.repositories import base_repository, work_repository
 from quyca.infrastructure.mongo import database
 
 
+api_expert_project = {
+    "_id": 1,
+    "titles": 1,
+    "year_published": 1,
+    "doi": 1,
+    "authors": {
+        "id": 1,
+        "full_name": 1,
+        "sex": 1,
+        "first_names": 1,
+        "last_names": 1,
+        "external_ids": 1,
+        "ranking": 1,
+        "affiliations": 1,
+    },
+    "source": {
+        "id": 1,
+        "name": 1,
+        "types": 1,
+        "external_ids": 1,
+        "updated": 1,
+    },
+}
+
+
 def get_works_by_affiliation_for_api_expert(
     affiliation_id: str,
     query_params: QueryParams,
@@ -47,38 +74,42 @@ def get_works_for_api_expert(pipeline: list, pipeline_params: dict, query_params
         base_repository.set_pagination(pipeline, query_params)
 
     work_repository.set_product_filters(pipeline, query_params)
-    pipeline += [
-        {
-            "$project": {
-                "_id": 1,
-                "titles": 1,
-                "year_published": 1,
-                "doi": 1,
-                "authors": {
-                    "id": 1,
-                    "full_name": 1,
-                    "sex": 1,
-                    "first_names": 1,
-                    "last_names": 1,
-                    "external_ids": 1,
-                    "ranking": 1,
-                    "affiliations": 1,
-                },
-                "source": {
-                    "id": 1,
-                    "name": 1,
-                    "types": 1,
-                    "external_ids": 1,
-                    "updated": 1,
-                },
-            },
-        },
-    ]
+    pipeline += [{"$project": api_expert_project}]
     base_repository.set_project(pipeline, pipeline_params.get("project"))
     cursor = database["works"].aggregate(pipeline)
     return work_generator.get(cursor)
 
 
+def get_works_for_export(after_id: ObjectId | None, upper_id: ObjectId | None, batch_size: int) -> Generator:
+    """
+    Reads the works with after_id < _id <= upper_id in _id order through a single cursor, for the bulk export.
+    """
+    id_range = {}
+    if after_id:
+        id_range["$gt"] = after_id
+    if upper_id:
+        id_range["$lte"] = upper_id
+    pipeline = [{"$match": {"_id": id_range}}] if id_range else []
+    pipeline += [{"$sort": {"_id": 1}}, {"$project": api_expert_project}]
+    cursor = database["works"].aggregate(pipeline, batchSize=batch_size)
+    return work_generator.get(cursor)
+
+
+def get_works_id_bounds(partitions: int, sample_size: int = 100) -> list:
+    """
+    Splits the works _id range in partitions of about the same size, from a sample of the ids. Returns the upper
+    bound of each partition, the last one is None.
+    """
+    if partitions <= 1:
+        return [None]
+    sample = database["works"].aggregate([{"$sample": {"size": partitions * sample_size}}, {"$project": {"_id": 1}}])
+    ids = sorted(work["_id"] for work in sample)
+    if not ids:
+        return [None]
+    bounds = sorted({ids[len(ids) * index // partitions] for index in range(1, partitions)})
+    return bounds + [None]
+
+
 def count_works_for_api_expert(query_params: QueryParams) -> int:
     return count_works(query_params)
 
@@ -1,27 +1,168 @@
+import base64
+import binascii
+import json
+from typing import Any, Tuple
+
+from bson import ObjectId
+from pymongo.command_cursor import CommandCursor
+
+from quyca.config import settings
 from quyca.domain.models.base_model import QueryParams
 
+FIRST_PAGE_CURSOR = "*"
+
+sort_fields = {
+    "citations": "citations_count_openalex",
+    "alphabetical": "title",
+    "products": "products_count",
+    "year": "sort_year",
+}
 
-def set_search_end_stages(pipeline: list, query_params: QueryParams, pipeline_params: dict | None = None) -> list:
+
+def set_search_end_stages(
+    pipeline: list,
+    query_params: QueryParams,
+    pipeline_params: dict | None = None,
+    page_stages: list | None = None,
+) -> list:
+    """
+    Sorts and paginates the search. The page_stages, like the $lookup that enrich the results, run after the
+    pagination, so they only touch the documents of the page.
+    """
     if pipeline_params is None:
         pipeline_params = {}
     set_sort(query_params.sort, pipeline)
-    set_project(pipeline, pipeline_params.get("project"))
     set_pagination(pipeline, query_params)
+    pipeline += page_stages or []
+    set_authors_slice(pipeline, pipeline_params.get("authors_limit"))
+    set_project(pipeline, pipeline_params.get("project"))
+    return pipeline
+
+
+def set_search_facet_stages(
+    pipeline: list,
+    query_params: QueryParams,
+    pipeline_params: dict | None = None,
+    results_stages: list | None = None,
+) -> list:
+    """
+    Computes the search page and its total in the same aggregation, so the $text match runs once per search.
+    The results_stages only run for the documents of the page. When SEARCH_COUNT_LIMIT is set, the count stops there.
+    Only for the searches where is_facet_search holds.
+    """
+    results_pipeline: list = []
+    set_search_end_stages(results_pipeline, query_params, pipeline_params, results_stages)
+    count_pipeline: list = [{"$limit": settings.SEARCH_COUNT_LIMIT}] if settings.SEARCH_COUNT_LIMIT else []
+    count_pipeline.append({"$count": "total_results"})
+    pipeline.append({"$facet": {"results": results_pipeline, "total_results": count_pipeline}})
     return pipeline
 
 
+def is_facet_search(query_params: QueryParams) -> bool:
+    """
+    The $facet returns a single document, bound to 16 MB, so the keyword searches whose page is larger than
+    SEARCH_FACET_MAX_LIMIT get the page and the count in two queries instead.
+    """
+    return bool(query_params.keywords) and (query_params.limit or 0) <= settings.SEARCH_FACET_MAX_LIMIT
+
+
+def get_search_facet_results(cursor: CommandCursor) -> Tuple[list, int]:
+    facet = next(cursor, {})
+    total_results = facet.get("total_results") or [{"total_results": 0}]
+    return facet.get("results", []), total_results[0]["total_results"]
+
+
+def is_count_capped(total_results: int) -> bool:
+    return bool(settings.SEARCH_COUNT_LIMIT) and total_results >= settings.SEARCH_COUNT_LIMIT
+
+
 def set_pagination(pipeline: list, query_params: QueryParams) -> None:
+    if query_params.cursor:
+        set_cursor_pagination(pipeline, query_params)
+        return
     if (page := query_params.page) and (limit := query_params.limit):
         skip = (page - 1) * limit
         pipeline += [{"$skip": skip}, {"$limit": limit}]
 
 
+def set_cursor_pagination(pipeline: list, query_params: QueryParams) -> None:
+    """
+    Keyset pagination: instead of skipping the previous pages, the cursor carries the sort key and the _id of the
+    last document already sent, and the page resumes right after it with a range match. It must be called after
+    set_sort, Mongo moves the range match before the sort stage so the cost does not grow with the page depth.
+    """
+    sort_field, direction = get_sort_field(query_params.sort)
+    if not query_params.sort:
+        pipeline.append({"$sort": {"_id": 1}})
+    if query_params.cursor != FIRST_PAGE_CURSOR:
+        sort_value, last_id = decode_cursor(query_params.cursor)  # type: ignore
+        pipeline.append({"$match": get_cursor_match(sort_field, direction, sort_value, last_id)})
+    pipeline.append({"$limit": query_params.limit})
+    if sort_field != "_id":
+        pipeline.append({"$addFields": {"cursor_key": f"${sort_field}"}})
+
+
+def get_cursor_match(sort_field: str, direction: int, sort_value: Any, last_id: Any) -> dict:
+    if sort_field == "_id":
+        return {"_id": {"$gt": last_id}}
+    same_value = {sort_field: sort_value, "_id": {"$gt": last_id}}
+    if sort_value is None:
+        if direction == -1:
+            return same_value
+        return {"$or": [same_value, {sort_field: {"$ne": None}}]}
+    next_values = {sort_field: {"$lt" if direction == -1 else "$gt": sort_value}}
+    if direction == -1:
+        return {"$or": [next_values, same_value, {sort_field: None}]}
+    return {"$or": [next_values, same_value]}
+
+
+def encode_cursor(sort_value: Any, last_id: Any) -> str:
+    token = json.dumps([sort_value, str(last_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(token.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    try:
+        sort_value, last_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, ValueError, TypeError):
+        raise ValueError(f"Invalid cursor '{cursor}'")
+    return sort_value, ObjectId(last_id) if ObjectId.is_valid(last_id) else last_id
+
+
 def set_match(pipeline: list, match: dict | None) -> None:
     if not match:
         return
     pipeline += [{"$match": match}]
 
 
+def set_authors_slice(pipeline: list, limit: int | None, keep_author: dict | None = None) -> None:
+    """
+    Cuts the authors of the page documents to the first limit ones, so the long author lists are not sent nor
+    validated. The authors that match the keep_author condition (over $$author) are kept after the slice.
+    The full count is left in author_count.
+    """
+    if not limit:
+        return
+    authors = {"$ifNull": ["$authors", []]}
+    sliced_authors: dict = {"$slice": [authors, limit]}
+    if keep_author:
+        sliced_authors = {
+            "$concatArrays": [
+                sliced_authors,
+                {
+                    "$filter": {
+                        "input": {"$slice": [authors, limit, {"$max": [{"$size": authors}, 1]}]},
+                        "as": "author",
+                        "cond": keep_author,
+                    }
+                },
+            ]
+        }
+    pipeline.append(
+        {"$addFields": {"authors": sliced_authors, "author_count": {"$ifNull": ["$author_count", {"$size": authors}]}}}
+    )
+
+
 def set_project(pipeline: list, project: list | dict | None) -> None:
     if not project:
         return
@@ -29,14 +170,19 @@ def set_project(pipeline: list, project: list | dict | None) -> None:
     pipeline.append({"$project": {"_id": 1, **{p: 1 for p in project}}})
 
 
-def set_sort(sort: str | None, pipeline: list) -> None:
+def get_sort_field(sort: str | None) -> Tuple[str, int]:
     if not sort:
-        return
+        return "_id", 1
     sort_field, direction_str = sort.split("_")
     direction = -1 if direction_str == "desc" else 1
-    if sort_field == "citations":
-        sort_field = "citations_count_openalex"
-    elif sort_field == "alphabetical":
+    return sort_fields.get(sort_field, sort_field), direction
+
+
+def set_sort(sort: str | None, pipeline: list) -> None:
+    if not sort:
+        return
+    sort_field, direction = get_sort_field(sort)
+    if sort_field == "title":
         pipeline += [
             {
                 "$addFields": {
@@ -111,10 +257,7 @@ def set_sort(sort: str | None, pipeline: list) -> None:
             {"$addFields": {"title": "$first_title.title"}},
             {"$unset": ["titles_order", "first_title"]},
         ]
-        sort_field = "title"
-    elif sort_field == "products":
-        sort_field = "products_count"
-    elif sort_field == "year":
+    elif sort_field == "sort_year":
         pipeline += [
             {
                 "$addFields": {
@@ -133,5 +276,4 @@ def set_sort(sort: str | None, pipeline: list) -> None:
                 }
             },
         ]
-        sort_field = "sort_year"
     pipeline += [{"$sort": {sort_field: direction, "_id": 1}}]
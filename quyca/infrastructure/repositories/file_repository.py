@@ -3,6 +3,8 @@ import shutil
 from datetime import datetime
 from zoneinfo import ZoneInfo
 from flask import current_app
+from googleapiclient.errors import HttpError
+from quyca.domain.exceptions.trashed_folder_exception import TrashedFolderException
 from infrastructure.repositories.google_drive_repository import GoogleDriveRepository
 
 
@@ -11,9 +13,9 @@ class FileRepository:
         self.drive_repo = drive_repo
 
     """Saves a file locally, uploads it to Drive in the proper folder, then deletes it from 
-    the temporary server"""
+    the temporary server. Without fallback a Drive error is raised instead of keeping the file locally"""
 
-    def save_file(self, file, ror_id: str, institution: str, file_type: str):
+    def save_file(self, file, ror_id: str, institution: str, file_type: str, fallback: bool = True):
         timestamp = datetime.now(ZoneInfo("America/Bogota")).strftime("%d_%m_%Y_%H:%M")
         filename = f"staff_{ror_id}_{timestamp}.xlsx"
 
@@ -21,16 +23,15 @@ class FileRepository:
         file.save(temp_path)
 
         try:
-            root_folder = self.drive_repo.get_or_create_folder(file_type)
-            user_folder_name = f"{ror_id}_{institution}"
-            user_folder = self.drive_repo.get_or_create_folder(user_folder_name, parent_id=root_folder)
-
-            self.drive_repo.upload_file(temp_path, filename, user_folder)
+            self.upload_to_drive(temp_path, filename, [file_type, f"{ror_id}_{institution}"])
 
             os.remove(temp_path)
             return {"success": True, "msg": f"Archivo {filename} guardado correctamente."}
 
         except Exception:
+            if not fallback:
+                os.remove(temp_path)
+                raise
             try:
                 local_base = current_app.config.get("LOCAL_STORAGE_PATH")
                 if not local_base:
@@ -48,3 +49,26 @@ class FileRepository:
                     "msg": f"Error al guardar el archivo tanto en Drive como en local. Detalle: {fallback_err}",
                     "location": None,
                 }
+
+    """Uploads the file into the nested folders. Their ids may come from the folder cache, so when Drive answers
+    404 the innermost folder reached is forgotten and the upload tried again, up to once per level. When the
+    upload lands in the trash, any of the folders may be the trashed one, so all of them are forgotten"""
+
+    def upload_to_drive(self, temp_path: str, filename: str, folder_names: list[str]) -> None:
+        for attempt in range(len(folder_names) + 1):
+            folder_ids: list[str] = []
+            try:
+                folder_id = None
+                for folder_name in folder_names:
+                    folder_id = self.drive_repo.get_or_create_folder(folder_name, parent_id=folder_id)
+                    folder_ids.append(folder_id)
+                self.drive_repo.upload_file(temp_path, filename, folder_id)
+                return
+            except HttpError as e:
+                if attempt == len(folder_names) or e.resp.status != 404 or not folder_ids:
+                    raise
+                self.drive_repo.invalidate_folders(folder_ids[-1:])
+            except TrashedFolderException:
+                if attempt == len(folder_names):
+                    raise
+                self.drive_repo.invalidate_folders(folder_ids)
@@ -1,14 +1,11 @@
-import os
-import pickle
 import base64
 from email import encoders
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email.mime.multipart import MIMEMultipart
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from google.auth.transport.requests import Request
 from flask import current_app
+from quyca.infrastructure import google_clients
 
 
 class GmailRepository:
@@ -16,22 +13,13 @@ class GmailRepository:
 
     def __init__(self):
         credentials_path = current_app.config.get("GOOGLE_CREDENTIALS")
-        if not credentials_path:
-            raise ValueError("GOOGLE_CREDENTIALS no está configurado")
-        if not os.path.exists(credentials_path):
-            raise FileNotFoundError(f"No se encontró el archivo {credentials_path}")
-
-        with open(credentials_path, "rb") as f:
-            creds = pickle.load(f)
-
-        if getattr(creds, "expired", False) and getattr(creds, "refresh_token", None):
-            creds.refresh(Request())
+        creds = google_clients.get_credentials(credentials_path)
 
         scopes = set(getattr(creds, "scopes", []) or [])
         if not scopes or not set(self.SCOPES).issubset(scopes):
             raise ValueError(f"El token no tiene permisos necesarios: {self.SCOPES}")
 
-        self.service = build("gmail", "v1", credentials=creds)
+        self.service = google_clients.get_service(credentials_path, "gmail", "v1")
 
     def send_email(self, to_email: str, subject: str, body_html: str, attachments: list[dict]) -> dict:
         message = MIMEMultipart()
@@ -1,11 +1,10 @@
-import os
-import pickle
 from typing import Optional
 from flask import current_app
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
-from google.auth.transport.requests import Request
+from quyca.domain.exceptions.trashed_folder_exception import TrashedFolderException
+from quyca.infrastructure import google_clients
+from quyca.infrastructure.drive_folder_cache import drive_folder_cache, get_folder_key, get_shortcut_key
 
 
 class GoogleDriveRepository:
@@ -13,25 +12,19 @@ class GoogleDriveRepository:
 
     def __init__(self):
         credentials_path = current_app.config.get("GOOGLE_CREDENTIALS")
-        if not credentials_path:
-            raise ValueError("GOOGLE_CREDENTIALS no está configurado")
-        if not os.path.exists(credentials_path):
-            raise FileNotFoundError(f"No se encontró el archivo {credentials_path }")
-
-        with open(credentials_path, "rb") as f:
-            creds = pickle.load(f)
-
-        if getattr(creds, "expired", False) and getattr(creds, "refresh_token", None):
-            creds.refresh(Request())
+        creds = google_clients.get_credentials(credentials_path)
 
         if not getattr(creds, "valid", False) or not set(self.SCOPES).issubset(set(getattr(creds, "scopes", []) or [])):
             raise ValueError("El token no tiene los permisos necesarios. Regenera el token con el scope de Drive.")
 
-        self.service = build("drive", "v3", credentials=creds)
+        self.service = google_clients.get_service(credentials_path, "drive", "v3")
 
     "Resolves the Drive folder ID (handles shortcuts)"
 
     def resolve_folder_id(self, folder_id: str) -> str:
+        resolved_id = drive_folder_cache.get(get_shortcut_key(folder_id))
+        if resolved_id:
+            return resolved_id
         try:
             folder = (
                 self.service.files()
@@ -40,16 +33,23 @@ class GoogleDriveRepository:
             )
 
             if folder.get("mimeType") == "application/vnd.google-apps.shortcut":
-                return folder["shortcutDetails"]["targetId"]
-            return folder_id
+                resolved_id = folder["shortcutDetails"]["targetId"]
+            else:
+                resolved_id = folder_id
+            drive_folder_cache.set(get_shortcut_key(folder_id), resolved_id, parent_id=folder_id)
+            return resolved_id
         except HttpError as e:
             raise ValueError(f"No se pudo acceder al folder_id { folder_id }: {e}")
 
-    "Gets or creates a folder in Drive by name and parent"
+    "Gets or creates a folder in Drive by name and parent, the ids found are kept in the folder cache"
 
     def get_or_create_folder(self, folder_name: str, parent_id: Optional[str] = None) -> str:
         if parent_id is None:
             parent_id = current_app.config["GOOGLE_PARENT_ID"]
+        key = get_folder_key(parent_id, folder_name)
+        folder_id = drive_folder_cache.get(key)
+        if folder_id:
+            return folder_id
         if parent_id:
             parent_id = self.resolve_folder_id(parent_id)
             query = f"name = '{folder_name}' and mimeType='application/vnd.google-apps.folder' and trashed=false and '{parent_id}' in parents"
@@ -71,7 +71,7 @@ class GoogleDriveRepository:
 
         folders = results.get("files", [])
         if folders:
-            return folders[0]["id"]
+            return self.remember_folder(key, folders[0]["id"], parent_id)
 
         folder_metadata = {
             "name": folder_name,
@@ -79,9 +79,22 @@ class GoogleDriveRepository:
             "parents": [parent_id] if parent_id else [],
         }
         folder = self.service.files().create(body=folder_metadata, fields="id", supportsAllDrives=True).execute()
-        return folder["id"]
+        return self.remember_folder(key, folder["id"], parent_id)
+
+    "Caches the folder found for the key, it is a folder and not a shortcut so it resolves to itself"
+
+    def remember_folder(self, key: str, folder_id: str, parent_id: Optional[str]) -> str:
+        drive_folder_cache.set(key, folder_id, parent_id=parent_id)
+        drive_folder_cache.set(get_shortcut_key(folder_id), folder_id, parent_id=folder_id)
+        return folder_id
+
+    "Forgets the cached ids of the folders and of their children, once one of them is gone or trashed"
+
+    def invalidate_folders(self, folder_ids: list[str]) -> None:
+        drive_folder_cache.invalidate(folder_ids)
 
-    "Uploads a file to Google Drive inside a specific folder"
+    """Uploads a file to Google Drive inside a specific folder. A folder in the trash still takes uploads, and
+    Drive marks what it holds as trashed, so such an upload is deleted and reported with TrashedFolderException"""
 
     def upload_file(self, filepath: str, filename: str, folder_id: str) -> str:
         folder_id = self.resolve_folder_id(folder_id)
@@ -89,8 +102,11 @@ class GoogleDriveRepository:
         media = MediaFileUpload(filepath, resumable=True)
         file = (
             self.service.files()
-            .create(body=file_metadata, media_body=media, fields="id, webViewLink", supportsAllDrives=True)
+            .create(body=file_metadata, media_body=media, fields="id, webViewLink, trashed", supportsAllDrives=True)
             .execute()
         )
+        if file.get("trashed"):
+            self.service.files().delete(fileId=file["id"], supportsAllDrives=True).execute()
+            raise TrashedFolderException(f"La carpeta {folder_id} de Google Drive está en la papelera")
 
         return file.get("webViewLink")
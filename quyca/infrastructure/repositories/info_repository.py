@@ -1,12 +1,26 @@
+import time
+
+from quyca.config import settings
 from quyca.domain.constants.institutions import institutions_list
 from quyca.infrastructure.mongo import database
 
+db_version: dict = {"time": 0, "expires_at": 0.0}
+
 
 def get_last_db_update() -> int:
     doc = database["log"].find_one(sort=[("time", -1)], projection={"time": 1})
     return doc["time"] if doc else 0
 
 
+def get_db_version() -> int:
+    """Last db update, read again from the log collection at most once every CACHE_VERSION_TTL seconds."""
+    now = time.monotonic()
+    if now >= db_version["expires_at"]:
+        db_version["time"] = get_last_db_update()
+        db_version["expires_at"] = now + settings.CACHE_VERSION_TTL
+    return db_version["time"]
+
+
 def get_entity_count(entity: str, affiliation_type: str | None = None) -> int:
     if affiliation_type:
         if affiliation_type == "institution":
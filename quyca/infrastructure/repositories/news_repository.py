@@ -1,4 +1,4 @@
-from infrastructure.mongo import database as db
+from quyca.infrastructure.mongo import database as db
 from infrastructure.generators import news_generator
 from infrastructure.repositories import base_repository
 from typing import Generator, Optional, Set, Iterable, Any
@@ -71,11 +71,25 @@ def get_persons_by_affiliation(affiliation_id: str) -> Generator:
     return person_generator.get(cursor)
 
 
+def get_persons_external_ids(person_ids: list) -> dict:
+    """Resolves the external ids of many persons with one query, keyed by every id they can be referenced with."""
+    old_ids = [ObjectId(person_id) for person_id in person_ids if ObjectId.is_valid(person_id)]
+    match = {"$or": [{"_id": {"$in": person_ids}}] + ([{"_id_old": {"$in": old_ids}}] if old_ids else [])}
+    external_ids_by_id = {}
+    external_ids_by_old_id = {}
+    for person in database["person"].find(match, {"full_name": 1, "external_ids": 1, "_id_old": 1}):
+        external_ids = Person(**person).external_ids
+        external_ids_by_id[person["_id"]] = external_ids
+        if person.get("_id_old"):
+            external_ids_by_old_id[str(person["_id_old"])] = external_ids
+    return {**external_ids_by_old_id, **external_ids_by_id}
+
+
 def search_persons(query_params: QueryParams, pipeline_params: dict | None = None) -> Tuple[Generator, int]:
     if pipeline_params is None:
         pipeline_params = {}
     pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-    pipeline += [
+    affiliations_stages = [
         {
             "$addFields": {
                 "filtered_affiliations": {
@@ -107,11 +121,12 @@ def search_persons(query_params: QueryParams, pipeline_params: dict | None = Non
             }
         },
     ]
-    base_repository.set_search_end_stages(pipeline, query_params, pipeline_params)
+    if base_repository.is_facet_search(query_params):
+        base_repository.set_search_facet_stages(pipeline, query_params, pipeline_params, affiliations_stages)
+        persons, total_results = base_repository.get_search_facet_results(database["person"].aggregate(pipeline))
+        return person_generator.get(persons), total_results
+    count_pipeline = pipeline + [{"$count": "total_results"}]
+    base_repository.set_search_end_stages(pipeline, query_params, pipeline_params, affiliations_stages)
     persons = database["person"].aggregate(pipeline)
-    count_pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-    count_pipeline += [
-        {"$count": "total_results"},
-    ]
     total_results = next(database["person"].aggregate(count_pipeline), {"total_results": 0})["total_results"]
     return person_generator.get(persons), total_results
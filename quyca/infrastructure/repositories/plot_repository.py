@@ -1,12 +1,116 @@
+from datetime import datetime, timezone
 from typing import Generator, Tuple
 
+from pymongo import ReplaceOne
 from pymongo.command_cursor import CommandCursor
 
+from quyca.domain.constants.articles_types import articles_types_list
 from quyca.domain.models.base_model import QueryParams
 from quyca.infrastructure.generators import work_generator
 from quyca.infrastructure.mongo import database, calculations_database
 from quyca.infrastructure.repositories import work_repository
 from quyca.infrastructure.repositories import affiliation_repository
+from quyca.infrastructure.repositories import info_repository
+
+
+works_plot_stages: dict[str, list] = {
+    "annual_evolution_by_scienti_classification": [
+        {"$match": {"year_published": {"$nin": [None, 0, ""]}}},
+        {"$project": {"_id": 0, "year_published": 1, "types.source": 1, "types.level": 1, "types.type": 1}},
+        {"$unwind": "$types"},
+        {"$match": {"types.source": "scienti", "types.level": 2}},
+        {"$group": {"_id": {"year": "$year_published", "type": "$types.type"}, "count": {"$sum": 1}}},
+    ],
+    "annual_citation_count": [
+        {
+            "$project": {
+                "_id": 0,
+                "citations_by_year": {
+                    "$cond": {
+                        "if": {"$gt": [{"$size": {"$ifNull": ["$citations_by_year", []]}}, 0]},
+                        "then": "$citations_by_year",
+                        "else": [{"no_info": 1}],
+                    }
+                },
+            }
+        },
+        {"$unwind": "$citations_by_year"},
+        {
+            "$group": {
+                "_id": {"year": "$citations_by_year.year", "no_info": "$citations_by_year.no_info"},
+                "count": {"$sum": {"$ifNull": ["$citations_by_year.cited_by_count", "$citations_by_year.no_info"]}},
+            }
+        },
+    ],
+    "annual_articles_open_access": [
+        {"$match": {"types.type": {"$in": articles_types_list}}},
+        {
+            "$group": {
+                "_id": {"year": "$year_published", "is_open_access": "$open_access.is_open_access"},
+                "count": {"$sum": 1},
+            }
+        },
+    ],
+    "products_by_subject": [
+        {"$match": {"primary_topic.display_name": {"$exists": True, "$ne": None}}},
+        {"$group": {"_id": "$primary_topic.display_name", "count": {"$sum": 1}}},
+    ],
+    "articles_by_publisher": [
+        {"$match": {"types.type": {"$in": articles_types_list}}},
+        {"$group": {"_id": "$source.publisher.name", "count": {"$sum": 1}}},
+    ],
+    "articles_by_access_route": [
+        {"$match": {"types.type": {"$in": articles_types_list}}},
+        {"$group": {"_id": "$open_access.open_access_status", "count": {"$sum": 1}}},
+    ],
+}
+
+
+works_plot_fields: dict[str, list] = {
+    "annual_evolution_by_scienti_classification": ["year_published", "types"],
+    "annual_citation_count": ["citations_by_year"],
+    "annual_articles_open_access": ["types", "year_published", "open_access"],
+    "products_by_subject": ["primary_topic.display_name"],
+    "articles_by_publisher": ["types", "source.publisher.name"],
+    "articles_by_access_route": ["types", "open_access"],
+}
+
+
+def get_works_plots_by_affiliation(affiliation_id: str, plots: list, query_params: QueryParams) -> dict:
+    pipeline = [{"$match": {"authors.affiliations.id": affiliation_id}}]
+    work_repository.set_product_filters(pipeline, query_params)
+    set_works_plots_facet(pipeline, plots)
+    return next(database["works"].aggregate(pipeline), {})
+
+
+def get_works_plots_by_person(person_id: str, plots: list, query_params: QueryParams) -> dict:
+    pipeline = [{"$match": {"authors.id": person_id}}]
+    work_repository.set_product_filters(pipeline, query_params)
+    set_works_plots_facet(pipeline, plots)
+    return next(database["works"].aggregate(pipeline), {})
+
+
+def set_works_plots_facet(pipeline: list, plots: list) -> None:
+    """Reads the matched works once, keeping only the union of the fields the plots need, and buckets every plot."""
+    fields = {field for plot in plots for field in works_plot_fields[plot]}
+    pipeline += [
+        {"$project": {"_id": 0, **{field: 1 for field in sorted(fields)}}},
+        {"$facet": {plot: works_plot_stages[plot] for plot in plots}},
+    ]
+
+
+def get_works_plot_by_affiliation(affiliation_id: str, plot: str, query_params: QueryParams) -> CommandCursor:
+    pipeline = [{"$match": {"authors.affiliations.id": affiliation_id}}]
+    work_repository.set_product_filters(pipeline, query_params)
+    pipeline += works_plot_stages[plot]
+    return database["works"].aggregate(pipeline)
+
+
+def get_works_plot_by_person(person_id: str, plot: str, query_params: QueryParams) -> CommandCursor:
+    pipeline = [{"$match": {"authors.id": person_id}}]
+    work_repository.set_product_filters(pipeline, query_params)
+    pipeline += works_plot_stages[plot]
+    return database["works"].aggregate(pipeline)
 
 
 def get_affiliations_scienti_works_count_by_institution(
@@ -482,176 +586,66 @@ def get_works_rankings_by_person(person_id: str, query_params: QueryParams) -> T
     return work_generator.get(works), total_results
 
 
-def get_products_by_database_by_affiliation(affiliation_id: str) -> dict:
-    base_match = {"authors.affiliations.id": affiliation_id}
-    valid_sources = ["minciencias", "openalex", "scholar", "scienti"]
+products_by_database_regions: dict[str, list] = {
+    "minciencias": ["minciencias"],
+    "openalex": ["openalex"],
+    "scholar": ["scholar"],
+    "scienti": ["scienti"],
+    "scienti_minciencias": ["scienti", "minciencias"],
+    "scienti_openalex": ["scienti", "openalex"],
+    "scienti_scholar": ["scienti", "scholar"],
+    "minciencias_openalex": ["minciencias", "openalex"],
+    "minciencias_scholar": ["minciencias", "scholar"],
+    "openalex_scholar": ["openalex", "scholar"],
+    "scienti_minciencias_openalex": ["scienti", "minciencias", "openalex"],
+    "scienti_minciencias_scholar": ["scienti", "minciencias", "scholar"],
+    "scienti_openalex_scholar": ["scienti", "openalex", "scholar"],
+    "minciencias_openalex_scholar": ["minciencias", "openalex", "scholar"],
+    "minciencias_openalex_scholar_scienti": ["minciencias", "openalex", "scholar", "scienti"],
+}
 
-    def count_sources(sources):
-        return database["works"].count_documents(
-            {**base_match, "$expr": {"$setEquals": [{"$setIntersection": ["$updated.source", valid_sources]}, sources]}}
-        )
 
+def get_products_by_database_by_affiliation(affiliation_id: str) -> dict:
+    """Each region counts the works whose sources are exactly the region sources."""
+    sources_count = get_works_count_by_sources({"authors.affiliations.id": affiliation_id})
     return {
-        "minciencias": count_sources(["minciencias"]),
-        "openalex": count_sources(["openalex"]),
-        "scholar": count_sources(["scholar"]),
-        "scienti": count_sources(["scienti"]),
-        "scienti_minciencias": count_sources(["scienti", "minciencias"]),
-        "scienti_openalex": count_sources(["scienti", "openalex"]),
-        "scienti_scholar": count_sources(["scienti", "scholar"]),
-        "minciencias_openalex": count_sources(["minciencias", "openalex"]),
-        "minciencias_scholar": count_sources(["minciencias", "scholar"]),
-        "openalex_scholar": count_sources(["openalex", "scholar"]),
-        "scienti_minciencias_openalex": count_sources(["scienti", "minciencias", "openalex"]),
-        "scienti_minciencias_scholar": count_sources(["scienti", "minciencias", "scholar"]),
-        "scienti_openalex_scholar": count_sources(["scienti", "openalex", "scholar"]),
-        "minciencias_openalex_scholar": count_sources(["minciencias", "openalex", "scholar"]),
-        "minciencias_openalex_scholar_scienti": count_sources(["minciencias", "openalex", "scholar", "scienti"]),
+        region: sources_count.get(frozenset(sources), 0) for region, sources in products_by_database_regions.items()
     }
 
 
 def get_products_by_database_by_person(person_id: str) -> dict:
+    """Each region counts the works that have, at least, all the region sources."""
+    sources_count = get_works_count_by_sources({"authors.id": person_id})
     return {
-        "minciencias": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                ]
-            }
-        ),
-        "openalex": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "openalex"},
-                ]
-            }
-        ),
-        "scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "scholar"},
-                ]
-            }
-        ),
-        "scienti": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "scienti_minciencias": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "scienti_openalex": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "scienti_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "scholar"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "minciencias_openalex": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "openalex"},
-                ]
-            }
-        ),
-        "minciencias_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "scholar"},
-                ]
-            }
-        ),
-        "openalex_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scholar"},
-                ]
-            }
-        ),
-        "scienti_minciencias_openalex": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "scienti_minciencias_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "scholar"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "scienti_openalex_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scholar"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
-        "minciencias_openalex_scholar": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scholar"},
-                ]
-            }
-        ),
-        "minciencias_openalex_scholar_scienti": database["works"].count_documents(
-            {
-                "$and": [
-                    {"authors.id": person_id},
-                    {"updated.source": "minciencias"},
-                    {"updated.source": "openalex"},
-                    {"updated.source": "scholar"},
-                    {"updated.source": "scienti"},
-                ]
-            }
-        ),
+        region: sum(count for work_sources, count in sources_count.items() if work_sources.issuperset(sources))
+        for region, sources in products_by_database_regions.items()
     }
 
 
+def get_works_count_by_sources(match: dict) -> dict:
+    valid_sources = ["minciencias", "openalex", "scholar", "scienti"]
+    pipeline = [
+        {"$match": match},
+        {
+            "$project": {
+                "_id": 0,
+                "sources": {
+                    "$sortArray": {
+                        "input": {"$setIntersection": [{"$ifNull": ["$updated.source", []]}, valid_sources]},
+                        "sortBy": 1,
+                    }
+                },
+            }
+        },
+        {"$group": {"_id": "$sources", "count": {"$sum": 1}}},
+    ]
+    sources_count: dict = {}
+    for item in database["works"].aggregate(pipeline):
+        work_sources = frozenset(item["_id"] or [])
+        sources_count[work_sources] = sources_count.get(work_sources, 0) + item["count"]
+    return sources_count
+
+
 def set_plot_product_filters(pipeline: list, query_params: QueryParams) -> None:
     set_plot_product_type_filters(pipeline, query_params.product_types)
     set_plot_year_filters(pipeline, query_params.years)
@@ -732,3 +726,30 @@ def set_plot_authors_ranking_filters(pipeline: list, authors_ranking: str | None
     for ranking in authors_ranking.split(","):
         match_filters.append({"works.authors": {"$elemMatch": {"ranking": ranking}}})
     pipeline += [{"$match": {"$or": match_filters}}]
+
+
+def get_materialized_plot(*parts: str) -> dict | None:
+    """Plot precomputed by quyca_gen_plots.py, only if it was computed from the current db update."""
+    document = calculations_database["plots"].find_one(
+        {"_id": ":".join(parts), "db_update": info_repository.get_db_version()}, {"value": 1}
+    )
+    return document["value"] if document else None
+
+
+def save_materialized_plots(plots: dict, db_update: int) -> None:
+    if not plots:
+        return
+    updated_at = datetime.now(timezone.utc)
+    calculations_database["plots"].bulk_write(
+        [
+            ReplaceOne(
+                {"_id": plot_id}, {"db_update": db_update, "value": value, "updated_at": updated_at}, upsert=True
+            )
+            for plot_id, value in plots.items()
+        ],
+        ordered=False,
+    )
+
+
+def delete_stale_materialized_plots(db_update: int) -> int:
+    return calculations_database["plots"].delete_many({"db_update": {"$ne": db_update}}).deleted_count
@@ -1,13 +1,21 @@
+import threading
 from typing import Dict, Generator, List, Tuple
 from bson import ObjectId
+from sentry_sdk import capture_exception
 
-from infrastructure.mongo import database
+from quyca.infrastructure.mongo import database
 from infrastructure.repositories import base_repository
 from infrastructure.generators import source_generator
-from domain.models.source_model import Source
+from domain.models.source_model import Source, SourceMetadata
 from domain.exceptions.not_entity_exception import NotEntityException
-from quyca.domain.models.base_model import QueryParams
+from quyca.domain.models.base_model import QueryParams, ExternalId
 from quyca.domain.constants.clean_source import source_type_mapping
+from quyca.infrastructure.repositories import info_repository
+
+SCIMAGO_QUARTILE_SOURCE = "scimago Best Quartile"
+
+source_index: dict = {"version": None, "sources": {}}
+source_index_lock = threading.Lock()
 
 
 def get_source_by_id(source_id: str) -> Source:
@@ -17,6 +25,70 @@ def get_source_by_id(source_id: str) -> Source:
     return Source(**source_data)
 
 
+def get_source_metadata(source_id: str | ObjectId) -> SourceMetadata | None:
+    """Returns the indexed metadata of a source, or None when it is not indexed or the index could not be loaded."""
+    try:
+        version = info_repository.get_db_version()
+        if source_index["version"] != version:
+            with source_index_lock:
+                if source_index["version"] != version:
+                    source_index["sources"] = load_source_index()
+                    source_index["version"] = version
+    except Exception as e:
+        capture_exception(e)
+        return None
+    return source_index["sources"].get(str(source_id))
+
+
+def load_source_index() -> dict:
+    pipeline = [
+        {
+            "$project": {
+                "external_ids.source": 1,
+                "external_ids.id": 1,
+                "ranking": {
+                    "$filter": {
+                        "input": {"$ifNull": ["$ranking", []]},
+                        "cond": {"$eq": ["$$this.source", SCIMAGO_QUARTILE_SOURCE]},
+                    }
+                },
+            }
+        },
+    ]
+    sources = {}
+    for source in database["sources"].aggregate(pipeline):
+        external_ids = [ExternalId(**external_id) for external_id in source.get("external_ids") or []]
+        serials = {external_id.source: external_id.id for external_id in external_ids}
+        quartile_starts, quartiles = get_quartile_segments(source.get("ranking") or [])
+        sources[str(source["_id"])] = SourceMetadata(serials, quartile_starts, quartiles)
+    return sources
+
+
+def get_quartile_segments(rankings: list) -> Tuple[list, list]:
+    """
+    Splits the scimago ranges of a source at every boundary and resolves each piece to the quartile of the first
+    ranking covering it, the same one a linear scan of the ranking list would pick.
+    """
+    ranges = [
+        (ranking["from_date"], ranking["to_date"], str(ranking["rank"]))
+        for ranking in rankings
+        if ranking.get("rank")
+        and ranking.get("rank") != "-"
+        and isinstance(ranking.get("from_date"), int)
+        and isinstance(ranking.get("to_date"), int)
+    ]
+    boundaries = sorted({from_date for from_date, _, _ in ranges} | {to_date + 1 for _, to_date, _ in ranges})
+    quartile_starts: list = []
+    quartiles: list = []
+    for boundary in boundaries:
+        quartile = next((rank for from_date, to_date, rank in ranges if from_date <= boundary <= to_date), None)
+        if quartiles and quartiles[-1] == quartile:
+            continue
+        quartile_starts.append(boundary)
+        quartiles.append(quartile)
+    return quartile_starts, quartiles
+
+
 def search_sources(query_params: QueryParams, pipeline_params: Dict) -> Tuple[Generator, int]:
     """
     Parameters:
@@ -33,13 +105,14 @@ def search_sources(query_params: QueryParams, pipeline_params: Dict) -> Tuple[Ge
     """
     pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
     set_source_filters(pipeline, query_params)
+    if base_repository.is_facet_search(query_params):
+        base_repository.set_search_facet_stages(pipeline, query_params, pipeline_params)
+        sources, total_results = base_repository.get_search_facet_results(database["sources"].aggregate(pipeline))
+        return source_generator.get(sources), total_results
+    count_pipeline = pipeline + [{"$count": "total_results"}]
     base_repository.set_search_end_stages(pipeline, query_params, pipeline_params)
     sources = database["sources"].aggregate(pipeline)
 
-    count_pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-    set_source_filters(count_pipeline, query_params)
-
-    count_pipeline += [{"$count": "total_results"}]
     total_results = next(database["sources"].aggregate(count_pipeline), {"total_results": 0})["total_results"]
     return source_generator.get(sources), total_results
 
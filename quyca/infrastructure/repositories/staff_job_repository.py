@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+
+from quyca.config import settings
+from quyca.infrastructure.mongo import impactu_database
+from domain.repositories.staff_job_repository_interface import IStaffJobRepository
+
+
+class StaffJobRepositoryMongo(IStaffJobRepository):
+    """
+    Staff upload jobs in the staff_jobs collection, so any worker can answer the status of a job and take over
+    the ones whose worker stopped before finishing them.
+
+    The uploaded file, up to 15 MB, is kept apart in staff_job_files under the id of its job, so the job document
+    stays far from the 16 MB limit once the result and its PDF are written.
+    """
+
+    index_ready = False
+
+    def __init__(self):
+        self.collection = impactu_database["staff_jobs"]
+        self.files = impactu_database["staff_job_files"]
+
+    def create_job(self, job: Dict[str, Any], file: bytes) -> str:
+        self.ensure_index()
+        now = datetime.now(timezone.utc)
+        job = {
+            **job,
+            "status": "pending",
+            "result": None,
+            "status_code": None,
+            "error": None,
+            "locked_until": None,
+            "created_at": now,
+            "updated_at": now,
+        }
+        job_id = self.collection.insert_one(job).inserted_id
+        self.files.insert_one({"_id": job_id, "file": file, "created_at": now})
+        return str(job_id)
+
+    def get_job(self, job_id: str) -> Dict[str, Any] | None:
+        if not ObjectId.is_valid(job_id):
+            return None
+        return self.collection.find_one({"_id": ObjectId(job_id)})
+
+    """Takes the job if it is not finished and no other worker holds it, for lease seconds"""
+
+    def claim_job(self, job_id: str, lease: int) -> Dict[str, Any] | None:
+        now = datetime.now(timezone.utc)
+        return self.collection.find_one_and_update(
+            {
+                "_id": ObjectId(job_id),
+                "status": {"$in": ["pending", "processing"]},
+                "$or": [{"locked_until": None}, {"locked_until": {"$lt": now}}],
+            },
+            {"$set": {"status": "processing", "locked_until": now + timedelta(seconds=lease), "updated_at": now}},
+            return_document=ReturnDocument.AFTER,
+        )
+
+    """Keeps the job for lease more seconds, called by its worker between steps"""
+
+    def renew_lease(self, job_id: str, lease: int) -> None:
+        now = datetime.now(timezone.utc)
+        self.collection.update_one(
+            {"_id": ObjectId(job_id), "status": "processing"},
+            {"$set": {"locked_until": now + timedelta(seconds=lease), "updated_at": now}},
+        )
+
+    def update_job(self, job_id: str, values: Dict[str, Any], unset: list[str] | None = None) -> None:
+        update: Dict[str, Any] = {"$set": {**values, "updated_at": datetime.now(timezone.utc)}}
+        if unset:
+            update["$unset"] = {field: "" for field in unset}
+        self.collection.update_one({"_id": ObjectId(job_id)}, update)
+
+    def get_file(self, job_id: str) -> bytes | None:
+        document = self.files.find_one({"_id": ObjectId(job_id)})
+        return document["file"] if document else None
+
+    def delete_file(self, job_id: str) -> None:
+        self.files.delete_one({"_id": ObjectId(job_id)})
+
+    def ensure_index(self) -> None:
+        if StaffJobRepositoryMongo.index_ready:
+            return
+        self.collection.create_index("created_at", expireAfterSeconds=settings.STAFF_JOB_TTL)
+        self.files.create_index("created_at", expireAfterSeconds=settings.STAFF_JOB_TTL)
+        StaffJobRepositoryMongo.index_ready = True
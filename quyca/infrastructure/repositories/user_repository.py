@@ -1,5 +1,5 @@
 from domain.models.user_model import User
-from infrastructure.mongo import impactu_database
+from quyca.infrastructure.mongo import impactu_database
 from domain.exceptions.not_entity_exception import NotEntityException
 from domain.repositories.user_repository_interface import IUserRepository
 
@@ -1,4 +1,3 @@
-from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Generator, Tuple
 
 from bson import ObjectId
@@ -37,6 +36,11 @@ def get_works_by_affiliation(
     if sort := query_params.sort:
         base_repository.set_sort(sort, pipeline)
     base_repository.set_pagination(pipeline, query_params)
+    base_repository.set_authors_slice(
+        pipeline,
+        pipeline_params.get("authors_limit"),
+        {"$in": [affiliation_id, {"$ifNull": ["$$author.affiliations.id", []]}]},
+    )
     base_repository.set_project(pipeline, pipeline_params.get("project"))
     cursor = database["works"].aggregate(pipeline)
     return work_generator.get(cursor)
@@ -81,6 +85,9 @@ def get_works_by_person(person_id: str, query_params: QueryParams, pipeline_para
     if sort := query_params.sort:
         base_repository.set_sort(sort, pipeline)
     base_repository.set_pagination(pipeline, query_params)
+    base_repository.set_authors_slice(
+        pipeline, pipeline_params.get("authors_limit"), {"$eq": ["$$author.id", person_id]}
+    )
     base_repository.set_project(pipeline, pipeline_params.get("project"))
     cursor = database["works"].aggregate(pipeline)
     return work_generator.get(cursor)
@@ -113,21 +120,21 @@ def search_works(query_params: QueryParams, pipeline_params: dict | None = None)
     if query_params.keywords:
         pipeline.append({"$match": {"$text": {"$search": query_params.keywords}}})
     set_product_filters(pipeline, query_params)
+    if base_repository.is_facet_search(query_params):
+        base_repository.set_search_facet_stages(pipeline, query_params, pipeline_params)
+        works, total_results = base_repository.get_search_facet_results(database["works"].aggregate(pipeline))
+        return work_generator.get(works), total_results
+    count_pipeline: list[dict[str, Any]] = pipeline + [{"$count": "total_results"}]
     base_repository.set_search_end_stages(pipeline, query_params, pipeline_params)
     works = database["works"].aggregate(pipeline)
 
     query_dict = query_params.model_dump(exclude_none=True)
-    base_params = {"page", "limit", "sort"}
-    is_full_scan = set(query_dict.keys()) == base_params
+    base_params = {"limit", "sort"}
+    is_full_scan = set(query_dict.keys()) - {"page", "cursor"} == base_params
 
     if is_full_scan:
         total_results = database["works"].estimated_document_count()
     else:
-        count_pipeline: list[dict[str, Any]] = (
-            [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-        )
-        set_product_filters(count_pipeline, query_params)
-        count_pipeline.append({"$count": "total_results"})
         total_results = next(database["works"].aggregate(count_pipeline), {"total_results": 0}).get("total_results", 0)
 
     return work_generator.get(works), total_results
@@ -147,36 +154,33 @@ def get_works_available_filters_by_affiliation(affiliation_id: str, query_params
 
 def get_search_works_available_filters(query_params: QueryParams, pipeline_params: dict | None = None) -> dict:
     pipeline = [{"$match": {"$text": {"$search": query_params.keywords}}}] if query_params.keywords else []
-    set_product_filters(pipeline, query_params)
     return get_works_available_filters(pipeline, query_params)
 
 
 def get_works_available_filters(pipeline: list, query_params: QueryParams) -> dict:
+    """
+    Computes every available filter in one aggregation: the works are matched once and each filter is a $facet
+    branch over them. When query_params.counts is set, the values also carry the number of works that have them.
+    """
     set_product_filters(pipeline, query_params)
-    available_filters = {}
-    collection = database["works"]
-
-    pipelines = {
-        "product_types": pipeline.copy()
-        + [
+    counts = bool(query_params.counts)
+    facets = {
+        "product_types": [
             {"$project": {"types": 1}},
             {"$project": {"types.provenance": 0}},
             {"$unwind": "$types"},
-            {"$group": {"_id": "$types.source", "types": {"$addToSet": "$types"}}},
+            *get_grouped_values_stages("$types.source", "$types", "types", counts),
         ],
-        "years": pipeline.copy()
-        + [
+        "years": [
             {"$project": {"year_published": 1}},
             {"$match": {"year_published": {"$type": "number"}}},
             {"$group": {"_id": None, "min_year": {"$min": "$year_published"}, "max_year": {"$max": "$year_published"}}},
             {"$project": {"_id": 0, "min_year": 1, "max_year": 1}},
         ],
-        "status": pipeline.copy()
-        + [
-            {"$group": {"_id": "$open_access.open_access_status"}},
+        "status": [
+            {"$group": {"_id": "$open_access.open_access_status", **({"count": {"$sum": 1}} if counts else {})}},
         ],
-        "subjects": pipeline.copy()
-        + [
+        "subjects": [
             {
                 "$project": {
                     "subjects.source": 1,
@@ -187,38 +191,33 @@ def get_works_available_filters(pipeline: list, query_params: QueryParams) -> di
             },
             {"$unwind": "$subjects"},
             {"$unwind": "$subjects.subjects"},
-            {
-                "$group": {
-                    "_id": "$subjects.source",
-                    "subjects": {
-                        "$addToSet": {
-                            "id": "$subjects.subjects.id",
-                            "name": "$subjects.subjects.name",
-                            "level": "$subjects.subjects.level",
-                        }
-                    },
-                }
-            },
+            *get_grouped_values_stages(
+                "$subjects.source",
+                {
+                    "id": "$subjects.subjects.id",
+                    "name": "$subjects.subjects.name",
+                    "level": "$subjects.subjects.level",
+                },
+                "subjects",
+                counts,
+            ),
         ],
-        "countries": pipeline.copy()
-        + [
-            {"$match": {"authors.affiliations.addresses.country_code": {"$ne": None}}},
+        "countries": [
+            {"$match": {"authors.affiliations.addresses": {"$elemMatch": {"country_code": {"$ne": None}}}}},
             {"$project": {"authors.affiliations.addresses.country_code": 1}},
             {"$unwind": "$authors"},
             {"$unwind": "$authors.affiliations"},
             {"$unwind": "$authors.affiliations.addresses"},
-            {"$group": {"_id": "$authors.affiliations.addresses.country_code"}},
+            *get_distinct_values_stages("$authors.affiliations.addresses.country_code", counts),
         ],
-        "authors_ranking": pipeline.copy()
-        + [
+        "authors_ranking": [
             {"$project": {"authors.ranking.source": 1, "authors.ranking.rank": 1}},
             {"$unwind": "$authors"},
             {"$unwind": "$authors.ranking"},
             {"$match": {"authors.ranking.source": "minciencias"}},
-            {"$group": {"_id": "$authors.ranking"}},
+            *get_distinct_values_stages("$authors.ranking", counts),
         ],
-        "groups_ranking": pipeline.copy()
-        + [
+        "groups_ranking": [
             {"$project": {"groups.ranking.rank": 1, "groups.ranking.source": 1}},
             {"$unwind": "$groups"},
             {"$project": {"rank_val": "$groups.ranking.rank", "source_val": "$groups.ranking.source"}},
@@ -234,10 +233,9 @@ def get_works_available_filters(pipeline: list, query_params: QueryParams) -> di
                     }
                 }
             },
-            {"$group": {"_id": "$rank_val"}},
+            *get_distinct_values_stages("$rank_val", counts),
         ],
-        "topics": pipeline.copy()
-        + [
+        "topics": [
             {"$match": {"primary_topic": {"$ne": {}}}},
             {"$project": {"primary_topic.id": 1, "primary_topic.display_name": 1}},
             {
@@ -250,21 +248,38 @@ def get_works_available_filters(pipeline: list, query_params: QueryParams) -> di
             {"$sort": {"count": -1}},
         ],
     }
+    pipeline.append({"$facet": facets})
+    available_filters = next(database["works"].aggregate(pipeline), {})
+    available_filters["years"] = next(iter(available_filters.get("years") or []), {"min_year": None, "max_year": None})
+    return available_filters
 
-    def run_pipeline(key: str, pipe: list):
-        if key == "years":
-            cursor = collection.aggregate(pipe)
-            return key, next(cursor, {"min_year": None, "max_year": None})
-        else:
-            return key, list(collection.aggregate(pipe))
 
-    with ThreadPoolExecutor(max_workers=8) as executor:
-        futures = [executor.submit(run_pipeline, k, v) for k, v in pipelines.items()]
-        for future in as_completed(futures):
-            key, result = future.result()
-            available_filters[key] = result
+def get_distinct_values_stages(value: Any, counts: bool) -> list:
+    """
+    Groups the unwound values. With counts, each work is counted once per value, even if several of its authors
+    share it.
+    """
+    if not counts:
+        return [{"$group": {"_id": value}}]
+    return [
+        {"$group": {"_id": {"work": "$_id", "value": value}}},
+        {"$group": {"_id": "$_id.value", "count": {"$sum": 1}}},
+    ]
+
 
-    return available_filters
+def get_grouped_values_stages(key: str, value: Any, name: str, counts: bool) -> list:
+    if not counts:
+        return [{"$group": {"_id": key, name: {"$addToSet": value}}}]
+    return [
+        {"$group": {"_id": {"work": "$_id", "key": key, "value": value}}},
+        {"$group": {"_id": {"key": "$_id.key", "value": "$_id.value"}, "count": {"$sum": 1}}},
+        {
+            "$group": {
+                "_id": "$_id.key",
+                name: {"$push": {"$mergeObjects": ["$_id.value", {"count": "$count"}]}},
+            }
+        },
+    ]
 
 
 def set_product_filters(pipeline: list, query_params: QueryParams) -> None:
@@ -0,0 +1,60 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from flask import Flask, current_app
+from sentry_sdk import capture_exception
+
+from quyca.config import settings
+from infrastructure.container import build_staff_job
+from infrastructure.repositories.staff_job_repository import StaffJobRepositoryMongo
+
+
+class StaffJobRunner:
+    """
+    Background threads of a worker that run the staff upload jobs, so the request only stores the file and answers
+    with the job id. Like the query executor, the pool is created on first use and again after a fork.
+    """
+
+    def __init__(self, max_workers: int):
+        self.max_workers = max_workers
+        self._pool: ThreadPoolExecutor | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def get_pool(self) -> ThreadPoolExecutor:
+        pid = os.getpid()
+        if self._pool is None or self._pid != pid:
+            with self._lock:
+                if self._pool is None or self._pid != pid:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="quyca-staff")
+                    self._pid = pid
+        return self._pool
+
+    def reset_after_fork(self) -> None:
+        self._pool = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, job_id: str) -> None:
+        self.get_pool().submit(self.run, current_app._get_current_object(), job_id)
+
+    @staticmethod
+    def run(app: Flask, job_id: str) -> None:
+        with app.app_context():
+            try:
+                build_staff_job().execute(job_id)
+            except Exception as e:
+                capture_exception(e)
+                job_repo = StaffJobRepositoryMongo()
+                job_repo.update_job(job_id, {"status": "error", "error": str(e)}, unset=["locked_until"])
+                job_repo.delete_file(job_id)
+
+
+def submit(job_id: str) -> None:
+    staff_job_runner.submit(job_id)
+
+
+staff_job_runner = StaffJobRunner(settings.STAFF_JOB_WORKERS)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=staff_job_runner.reset_after_fork)
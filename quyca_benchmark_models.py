@@ -0,0 +1,69 @@
+from os import environ
+from sys import exit
+import warnings
+import argparse
+
+warnings.filterwarnings("ignore", message="Pydantic serializer warnings:")
+warnings.filterwarnings("ignore")
+import cProfile
+import pstats
+import time
+
+if "QUYCA_CONFIG_FILE" in environ:
+    print("Using configuration file:", environ["QUYCA_CONFIG_FILE"])
+else:
+    print("No configuration file set, please export QUYCA_CONFIG_FILE with the path to your config file.")
+    exit(1)
+
+from quyca.domain.models.work_model import Work
+from quyca.domain.models.person_model import Person
+from quyca.domain.models.affiliation_model import Affiliation
+from quyca.domain.models.source_model import Source
+from quyca.domain.models.patent_model import Patent
+from quyca.domain.models.project_model import Project
+from quyca.infrastructure.mongo import database
+
+collections = {
+    "works": Work,
+    "person": Person,
+    "affiliations": Affiliation,
+    "sources": Source,
+    "patents": Patent,
+    "projects": Project,
+}
+
+
+def benchmark(collection: str, size: int, rounds: int, profile: bool) -> None:
+    model = collections[collection]
+    documents = list(database[collection].aggregate([{"$sample": {"size": size}}]))
+    if not documents:
+        print(f"{collection}: no documents")
+        return
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for document in documents:
+            model(**document)
+    elapsed = (time.perf_counter() - start) / (rounds * len(documents)) * 1_000_000
+    print(f"{collection}: {len(documents)} documents, {elapsed:.1f} µs/doc building {model.__name__}")
+    if profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+        for document in documents:
+            model(**document)
+        profiler.disable()
+        pstats.Stats(profiler).sort_stats("tottime").print_stats(10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Mide el costo por documento de construir los modelos de pydantic.")
+    parser.add_argument("--collections", default=",".join(collections), help="Colecciones separadas por coma")
+    parser.add_argument("--size", type=int, default=500, help="Documentos de muestra por colección")
+    parser.add_argument("--rounds", type=int, default=3, help="Repeticiones de la medición")
+    parser.add_argument("--profile", action="store_true", help="Muestra las funciones de Python más costosas")
+    args = parser.parse_args()
+    for collection in [collection.strip() for collection in args.collections.split(",")]:
+        benchmark(collection, args.size, args.rounds, args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,7 @@
+import gzip
 import json
-from pymongo import MongoClient
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from os import environ, path
 from sys import exit
 import warnings
@@ -12,56 +14,137 @@ import time
 if "QUYCA_CONFIG_FILE" in environ:
     print("Using configuration file:", environ["QUYCA_CONFIG_FILE"])
 else:
-    print("No configuration file set, please export QUYCA_CONFIG_FILE with th e path to your config file.")
+    print("No configuration file set, please export QUYCA_CONFIG_FILE with the path to your config file.")
     exit(1)
 
-from quyca.domain.services.api_expert_service import search_works
-from quyca.domain.models.base_model import QueryParams
+from bson import ObjectId
 
-qp = QueryParams()
-qp.page = 1
-qp.limit = 250
-qp.sort = None
+from quyca.domain.services.api_expert_service import get_works_for_export
+from quyca.infrastructure.repositories import api_expert_repository
+
+
+def get_partition_path(output_file: str, index: int, partitions: int) -> str:
+    if partitions == 1:
+        return output_file
+    directory, file_name = path.split(output_file)
+    name, _, extension = file_name.partition(".")
+    return path.join(directory, f"{name}-{index:03d}" + (f".{extension}" if extension else ""))
+
+
+def read_json(file_path: str) -> dict | None:
+    if not path.exists(file_path):
+        return None
+    with open(file_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def write_json(file_path: str, data: dict) -> None:
+    temporary_path = file_path + ".tmp"
+    with open(temporary_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(temporary_path, file_path)
+
+
+def write_batch(f, lines: list, compress: bool) -> None:
+    """
+    Each batch is written as a complete gzip member, so the file can be cut at any checkpoint and appended again.
+    """
+    data = "".join(lines).encode("utf-8")
+    f.write(gzip.compress(data) if compress else data)
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def export_partition(
+    index: int, partitions: int, output_file: str, lower_id: str | None, upper_id: str | None, batch_size: int
+) -> int:
+    """
+    Exports the works with lower_id < _id <= upper_id. The checkpoint keeps the last exported _id and the size of
+    the file at that point, a resumed run cuts the file there and continues after that _id.
+    """
+    partition_path = get_partition_path(output_file, index, partitions)
+    checkpoint_path = partition_path + ".checkpoint"
+    checkpoint = read_json(checkpoint_path) or {"after_id": lower_id, "offset": 0, "count": 0, "done": False}
+    if checkpoint["done"]:
+        return checkpoint["count"]
+    compress = output_file.endswith(".gz")
+    start = time.time()
+    with open(partition_path, "ab") as f:
+        f.truncate(checkpoint["offset"])
+        lines = []
+        after_id = ObjectId(checkpoint["after_id"]) if checkpoint["after_id"] else None
+        for work in get_works_for_export(after_id, ObjectId(upper_id) if upper_id else None, batch_size):
+            lines.append(json.dumps(work, ensure_ascii=False) + "\n")
+            if len(lines) == batch_size:
+                write_batch(f, lines, compress)
+                checkpoint.update(after_id=work["id"], offset=f.tell(), count=checkpoint["count"] + len(lines))
+                write_json(checkpoint_path, checkpoint)
+                lines = []
+                print(f"Partition {index}: {checkpoint['count']} works — Time: {time.time() - start:.2f}s")
+        if lines:
+            write_batch(f, lines, compress)
+            checkpoint.update(offset=f.tell(), count=checkpoint["count"] + len(lines))
+    checkpoint["done"] = True
+    write_json(checkpoint_path, checkpoint)
+    return checkpoint["count"]
 
 
 def main() -> None:
-    parser = argparse.ArgumentParser(description="Exportar works de MongoDB a un archivo JSON.")
-    parser.add_argument("output_file", help="Nombre del archivo de salida (ej. impactu.json)")
-    parser.add_argument("database_name", help="Nombre de la base de datos MongoDB (ej. kahi_dev)")
+    parser = argparse.ArgumentParser(
+        description="Exporta los works de MongoDB en formato NDJSON, comprimido con gzip si el archivo termina en .gz."
+    )
+    parser.add_argument("output_file", help="Nombre del archivo de salida (ej. impactu.ndjson o impactu.ndjson.gz)")
+    parser.add_argument(
+        "--workers", type=int, default=1, help="Procesos en paralelo, cada uno exporta un rango de _id a su archivo"
+    )
+    parser.add_argument("--batch-size", type=int, default=1000, help="Works entre cada checkpoint")
+    parser.add_argument("--resume", action="store_true", help="Continúa una exportación interrumpida")
     args = parser.parse_args()
 
-    MongoClient()[args.database_name]["works"].count_documents({})
-
     start_total = time.time()
-    if path.exists(args.output_file):
-        confirm = (
-            input(f"The file '{args.output_file}' already exists. Do you want to overwrite it? [y/N]: ").strip().lower()
-        )
-        if confirm != "y":
-            print("Operation canceled.")
-            exit(0)
-    with open(args.output_file, "w", encoding="utf-8") as f:
-        f.truncate(0)  # Borra el contenido del archivo
-        f.seek(0)
-        f.write("[\n")
-        first = True
-        qp.page = 1
-        works = search_works(qp)
-        while works["data"]:
-            start_iter = time.time()
-            for item in works["data"]:
-                if not first:
-                    f.write(",\n")
-                json.dump(item, f, ensure_ascii=False)
-                first = False
-            qp.page += 1
-            works = search_works(qp)
-            end_iter = time.time()
-            elapsed_iter = end_iter - start_iter
-            elapsed_total = end_iter - start_total
-            print(f"Time for page {qp.page-1}: {elapsed_iter:.2f}s — Total time: {elapsed_total:.2f}s")
-
-        f.write("\n]")
+    manifest_path = args.output_file + ".manifest.json"
+    manifest = read_json(manifest_path) if args.resume else None
+    if args.resume and not manifest:
+        print(f"There is no export to resume for '{args.output_file}'.")
+        exit(1)
+    if not manifest:
+        if path.exists(manifest_path) or path.exists(args.output_file):
+            confirm = (
+                input(f"The file '{args.output_file}' already exists. Do you want to overwrite it? [y/N]: ")
+                .strip()
+                .lower()
+            )
+            if confirm != "y":
+                print("Operation canceled.")
+                exit(0)
+        bounds = api_expert_repository.get_works_id_bounds(args.workers)
+        manifest = {"upper_ids": [str(bound) if bound else None for bound in bounds]}
+        for index in range(len(bounds)):
+            partition_path = get_partition_path(args.output_file, index, len(bounds))
+            for file_path in [partition_path, partition_path + ".checkpoint"]:
+                if path.exists(file_path):
+                    os.remove(file_path)
+        write_json(manifest_path, manifest)
+
+    upper_ids = manifest["upper_ids"]
+    partitions = len(upper_ids)
+    total = 0
+    with ProcessPoolExecutor(max_workers=min(args.workers, partitions)) as executor:
+        futures = [
+            executor.submit(
+                export_partition,
+                index,
+                partitions,
+                args.output_file,
+                upper_ids[index - 1] if index else None,
+                upper_id,
+                args.batch_size,
+            )
+            for index, upper_id in enumerate(upper_ids)
+        ]
+        for future in as_completed(futures):
+            total += future.result()
+    print(f"Exported {total} works in {partitions} file(s) — Total time: {time.time() - start_total:.2f}s")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,202 @@
+from os import environ
+from sys import exit
+from typing import Callable
+import warnings
+import argparse
+import logging
+
+warnings.filterwarnings("ignore", message="Pydantic serializer warnings:")
+warnings.filterwarnings("ignore")
+import time
+
+if "QUYCA_CONFIG_FILE" in environ:
+    print("Using configuration file:", environ["QUYCA_CONFIG_FILE"])
+else:
+    print("No configuration file set, please export QUYCA_CONFIG_FILE with the path to your config file.")
+    exit(1)
+
+from quyca.domain.constants.institutions import institutions_list
+from quyca.domain.models.base_model import QueryParams
+from quyca.domain.parsers import map_parser
+from quyca.domain.services import affiliation_plot_service, person_plot_service, plot_service
+from quyca.infrastructure.mongo import database
+from quyca.infrastructure.repositories import info_repository, plot_repository
+
+logger = logging.getLogger("quyca_gen_plots")
+
+affiliation_plots = [
+    "annual_evolution_by_scienti_classification",
+    "annual_citation_count",
+    "annual_apc_expenses",
+    "annual_articles_open_access",
+    "annual_articles_by_top_publishers",
+    "most_used_title_words",
+    "articles_by_publisher",
+    "products_by_subject",
+    "products_by_database",
+    "articles_by_access_route",
+    "active_authors_by_sex",
+    "active_authors_by_age_range",
+    "articles_by_scienti_category",
+    "articles_by_scimago_quartile",
+    "articles_by_publishing_institution",
+    "coauthorship_by_country_map",
+    "coauthorship_by_colombian_department_map",
+    "institutional_coauthorship_network",
+]
+
+relation_plots = {
+    "faculty": ["faculties_by_product_type", "citations_by_faculty", "apc_expenses_by_faculty", "h_index_by_faculty"],
+    "department": [
+        "departments_by_product_type",
+        "citations_by_department",
+        "apc_expenses_by_department",
+        "h_index_by_department",
+    ],
+    "group": [
+        "research_groups_by_product_type",
+        "citations_by_research_group",
+        "apc_expenses_by_group",
+        "h_index_by_research_group",
+    ],
+}
+
+affiliation_relations = {
+    "institution": ["faculty", "department", "group"],
+    "faculty": ["department", "group"],
+    "department": ["group"],
+    "group": [],
+}
+
+person_plots = [
+    "annual_evolution_by_scienti_classification",
+    "annual_citation_count",
+    "annual_apc_expenses",
+    "annual_articles_open_access",
+    "annual_articles_by_top_publishers",
+    "most_used_title_words",
+    "articles_by_publisher",
+    "products_by_subject",
+    "products_by_database",
+    "articles_by_access_route",
+    "articles_by_scienti_category",
+    "articles_by_scimago_quartile",
+    "articles_by_publishing_institution",
+    "coauthorship_by_country_map",
+    "coauthorship_by_colombian_department_map",
+    "author_coauthorship_network",
+]
+
+
+def get_affiliation_ids(affiliation_type: str) -> list:
+    types = institutions_list if affiliation_type == "institution" else [affiliation_type]
+    return [
+        affiliation["_id"] for affiliation in database["affiliations"].find({"types.type": {"$in": types}}, {"_id": 1})
+    ]
+
+
+def get_affiliation_plots(affiliation_id: str, affiliation_type: str, plots: list) -> dict:
+    return get_plots(
+        ["affiliation", affiliation_type, affiliation_id],
+        plots,
+        lambda works_plots: plot_repository.get_works_plots_by_affiliation(
+            affiliation_id, works_plots, QueryParams(plots=",".join(works_plots))
+        ),
+        lambda query_params: affiliation_plot_service.get_affiliation_plot_data(
+            affiliation_id, affiliation_type, query_params
+        ),
+    )
+
+
+def get_person_plots(person_id: str, plots: list) -> dict:
+    return get_plots(
+        ["person", person_id],
+        plots,
+        lambda works_plots: plot_repository.get_works_plots_by_person(
+            person_id, works_plots, QueryParams(plots=",".join(works_plots))
+        ),
+        lambda query_params: person_plot_service.get_person_plot_data(person_id, query_params),
+    )
+
+
+def get_plots(entity: list, plots: list, get_works_plots: Callable, get_plot_data: Callable) -> dict:
+    """
+    Computes the plots of an entity, keyed by their id in calculations.plots. A plot that fails is logged and
+    left out, the rest of the entity is still stored. The maps are computed in the counts format, their geometry
+    is the same for every entity and is added back when they are read.
+    """
+    entity_id = ":".join(entity)
+    works_plots = [plot for plot in plots if plot in plot_repository.works_plot_stages]
+    buckets = None
+    if works_plots:
+        try:
+            buckets = get_works_plots(works_plots)
+        except Exception:
+            logger.exception("Error computing the works plots of %s", entity_id)
+    data = {}
+    for plot in plots:
+        try:
+            if plot not in works_plots:
+                map_format = "counts" if plot in map_parser.map_plots else None
+                data[plot] = get_plot_data(QueryParams(plot=plot, map_format=map_format))
+            elif buckets is not None:
+                data[plot] = plot_service.works_plot_parsers[plot](buckets.get(plot, []))
+        except Exception:
+            logger.exception("Error computing the plot %s of %s", plot, entity_id)
+    return {f"{entity_id}:{plot}": value for plot, value in data.items()}
+
+
+def materialize(entity_type: str, entity_ids: list, selected_plots: list | None, db_update: int) -> None:
+    if entity_type == "person":
+        plots = person_plots
+    else:
+        plots = affiliation_plots + [
+            plot for relation in affiliation_relations[entity_type] for plot in relation_plots[relation]
+        ]
+    if selected_plots:
+        plots = [plot for plot in plots if plot in selected_plots]
+    start = time.time()
+    for index, entity_id in enumerate(entity_ids, start=1):
+        if entity_type == "person":
+            data = get_person_plots(entity_id, plots)
+        else:
+            data = get_affiliation_plots(entity_id, entity_type, plots)
+        try:
+            plot_repository.save_materialized_plots(
+                {plot_id: value for plot_id, value in data.items() if value is not None}, db_update
+            )
+        except Exception:
+            logger.exception("Error saving the plots of %s %s", entity_type, entity_id)
+        if index % 100 == 0 or index == len(entity_ids):
+            logger.info("%s: %d/%d — Total time: %.2fs", entity_type, index, len(entity_ids), time.time() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precalcula los gráficos sin filtros de cada entidad en calculations.")
+    parser.add_argument(
+        "--entities",
+        default="institution,faculty,department,group,person",
+        help="Tipos de entidad separados por coma (ej. institution,person)",
+    )
+    parser.add_argument("--plots", default=None, help="Gráficos separados por coma, por defecto todos")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    db_update = info_repository.get_last_db_update()
+    selected_plots = [plot.strip() for plot in args.plots.split(",")] if args.plots else None
+    logger.info("Materializing plots for db update %s", db_update)
+    for entity_type in [entity.strip() for entity in args.entities.split(",")]:
+        if entity_type == "person":
+            entity_ids = [person["_id"] for person in database["person"].find({}, {"_id": 1})]
+        elif entity_type in affiliation_relations:
+            entity_ids = get_affiliation_ids(entity_type)
+        else:
+            logger.error("Unknown entity type: %s", entity_type)
+            continue
+        materialize(entity_type, entity_ids, selected_plots, db_update)
+    if not args.plots and args.entities == parser.get_default("entities"):
+        logger.info("Deleted stale plots: %d", plot_repository.delete_stale_materialized_plots(db_update))
+
+
+if __name__ == "__main__":
+    main()
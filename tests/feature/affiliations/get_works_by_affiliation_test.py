@@ -87,3 +87,18 @@ def test_get_works_by_group_with_filters(client):
         f"/app/affiliation/group/{random_group_id}/research/products?product_type=scholar_article,scienti_Publicado en revista especializada"
     )
     assert response.status_code == 200
+
+
+def test_get_works_by_institution_with_cursor(client):
+    random_institution_id = (
+        database["affiliations"]
+        .aggregate([{"$match": {"types.type": "education"}}, {"$sample": {"size": 1}}])
+        .next()["_id"]
+    )
+    url = f"/app/affiliation/institution/{random_institution_id}/research/products?max=10&sort=citations_desc"
+    response = client.get(f"{url}&cursor=*")
+    assert response.status_code == 200
+    next_cursor = response.get_json()["next_cursor"]
+    if next_cursor:
+        response = client.get(f"{url}&cursor={next_cursor}")
+        assert response.status_code == 200
@@ -0,0 +1,24 @@
+from quyca.infrastructure.mongo import database
+
+
+def test_it_can_plot_many_plots_by_institution(client):
+    random_institution_id = (
+        database["affiliations"]
+        .aggregate([{"$match": {"types.type": "education"}}, {"$sample": {"size": 1}}])
+        .next()["_id"]
+    )
+    plots = "annual_citation_count,products_by_subject,articles_by_access_route,products_by_database"
+    response = client.get(f"/app/affiliation/institution/{random_institution_id}/research/products?plots={plots}")
+    assert response.status_code == 200
+    assert set(response.get_json().keys()) == set(plots.split(","))
+
+
+def test_it_can_plot_many_plots_by_group(client):
+    random_group_id = (
+        database["affiliations"]
+        .aggregate([{"$match": {"types.type": "group"}}, {"$sample": {"size": 1}}])
+        .next()["_id"]
+    )
+    plots = "annual_evolution_by_scienti_classification,annual_articles_open_access,articles_by_publisher"
+    response = client.get(f"/app/affiliation/group/{random_group_id}/research/products?plots={plots}")
+    assert response.status_code == 200
@@ -47,3 +47,23 @@ def test_it_can_plot_coauthorship_by_colombian_department_map_by_group(client):
         f"/app/affiliation/group/{random_group_id}/research/products?plot=coauthorship_by_colombian_department_map"
     )
     assert response.status_code == 200
+
+
+def test_it_can_plot_coauthorship_by_colombian_department_map_counts(client):
+    random_institution_id = (
+        database["affiliations"]
+        .aggregate([{"$match": {"types.type": "education"}}, {"$sample": {"size": 1}}])
+        .next()["_id"]
+    )
+    response = client.get(
+        f"/app/affiliation/institution/{random_institution_id}/research/products?plot=coauthorship_by_colombian_department_map&map_format=counts"
+    )
+    assert response.status_code == 200
+    plot = response.get_json()["plot"]
+    assert "features" not in plot
+    geometry_response = client.get(plot["geometry_url"])
+    assert geometry_response.status_code == 200
+    feature_ids = {feature["id"] for feature in geometry_response.get_json()["features"]}
+    assert set(plot["counts"]).issubset(feature_ids)
+    cached_response = client.get(plot["geometry_url"], headers={"If-None-Match": geometry_response.headers["ETag"]})
+    assert cached_response.status_code == 304
@@ -36,3 +36,8 @@ def test_search_departments_without_keywords(client):
 def test_search_groups_without_keywords(client):
     response = client.get(f"/app/search/affiliations/group?max=10&page=1&sort=products_desc")
     assert response.status_code == 200
+
+
+def test_search_affiliations_rejects_cursor(client):
+    response = client.get(f"/app/search/affiliations/institution?keywords=antioquia&max=10&cursor=*")
+    assert response.status_code == 400
@@ -13,3 +13,13 @@ def test_get_works_by_person_with_filters(client):
         f"/app/person/{random_person_id}/research/products?product_type=scholar_article,scienti_Publicado en revista especializada"
     )
     assert response.status_code == 200
+
+
+def test_get_works_by_person_keeps_person_in_authors(client):
+    work = database["works"].aggregate([{"$match": {"authors.10.id": {"$nin": [None, ""]}}}, {"$sample": {"size": 1}}])
+    person_id = work.next()["authors"][10]["id"]
+    response = client.get(f"/app/person/{person_id}/research/products?max=10&page=1")
+    assert response.status_code == 200
+    for work in response.json["data"]:
+        assert person_id in [author.get("id") for author in work["authors"]]
+        assert len(work["authors"]) <= work["authors_count"]
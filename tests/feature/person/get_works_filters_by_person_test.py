@@ -5,3 +5,11 @@ def test_get_works_by_person(client):
     random_person_id = database["person"].aggregate([{"$sample": {"size": 1}}]).next()["_id"]
     response = client.get(f"/app/person/{random_person_id}/research/products/filters")
     assert response.status_code == 200
+
+
+def test_get_works_filters_by_person_with_counts(client):
+    random_person_id = database["person"].aggregate([{"$sample": {"size": 1}}]).next()["_id"]
+    response = client.get(f"/app/person/{random_person_id}/research/products/filters?counts=true")
+    assert response.status_code == 200
+    for country in response.json.get("countries", []):
+        assert country["count"] > 0
@@ -0,0 +1,11 @@
+from quyca.infrastructure.mongo import database
+
+random_person_id = database["person"].aggregate([{"$sample": {"size": 1}}]).next()["_id"]
+
+
+def test_it_can_plot_many_plots_by_person(client):
+    plots = "annual_citation_count,annual_articles_open_access,products_by_subject,most_used_title_words"
+    response = client.get(f"/app/person/{random_person_id}/research/products?plots={plots}")
+
+    assert response.status_code == 200
+    assert set(response.get_json().keys()) == set(plots.split(","))
@@ -0,0 +1,48 @@
+import pickle
+import threading
+
+import flask
+from google.oauth2.credentials import Credentials
+
+"""
+The Gmail and Drive repositories reuse the clients of the process, and each thread sends its requests through
+its own connection.
+"""
+
+
+def test_google_clients_are_shared(tmp_path):
+    from quyca.infrastructure import google_clients
+    from quyca.infrastructure.repositories.gmail_repository import GmailRepository
+    from quyca.infrastructure.repositories.google_drive_repository import GoogleDriveRepository
+
+    credentials_path = tmp_path / "token.pickle"
+    credentials = Credentials(
+        token="token",
+        scopes=["https://www.googleapis.com/auth/gmail.send", "https://www.googleapis.com/auth/drive"],
+    )
+    with open(credentials_path, "wb") as f:
+        pickle.dump(credentials, f)
+
+    app = flask.Flask(__name__)
+    app.config["GOOGLE_CREDENTIALS"] = str(credentials_path)
+
+    with app.app_context():
+        drive_repo = GoogleDriveRepository()
+        assert GoogleDriveRepository().service is drive_repo.service
+        assert GmailRepository().service.users is not None
+
+        connections = []
+
+        def build_request():
+            connections.append(drive_repo.service.files().list(q="trashed=false").http)
+
+        threads = [threading.Thread(target=build_request) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        build_request()
+        build_request()
+
+    assert connections[0] is not connections[1]
+    assert connections[2] is connections[3] is google_clients.client_manager.get_http()
@@ -174,3 +174,234 @@ def test_file_repository_fallback_local(tmp_path):
 
     files = list(tmp_path.rglob("*"))
     assert any("staff" in str(f) for f in files)
+
+
+def test_staff_upload_returns_job(client):
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with patch("quyca.application.routes.app.staff_app_router.StaffService.handle_staff_upload") as mock_service:
+        mock_service.return_value = (
+            {"success": True, "job_id": "6710c2f5e4b0a1a2b3c4d5e6", "status": "pending", "msg": "Archivo recibido"},
+            202,
+        )
+
+        data = {"file": (io.BytesIO(b"excel-content"), "staff.xlsx")}
+        response = client.post("/app/submit/staff", headers=headers, data=data, content_type="multipart/form-data")
+
+        assert response.status_code == 202
+        assert response.json["job_id"] == "6710c2f5e4b0a1a2b3c4d5e6"
+
+
+def test_staff_job_status(client):
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with patch("quyca.application.routes.app.staff_app_router.StaffService.get_job_status") as mock_service:
+        mock_service.return_value = (
+            {
+                "success": True,
+                "job_id": "6710c2f5e4b0a1a2b3c4d5e6",
+                "status": "done",
+                "status_code": 200,
+                "result": {"success": True, "errores": 0, "duplicados": 0, "pdf_base64": "JVBERi0xLjQKJ..."},
+            },
+            200,
+        )
+
+        response = client.get("/app/submit/staff/6710c2f5e4b0a1a2b3c4d5e6", headers=headers)
+
+        assert response.status_code == 200
+        assert response.json["result"]["pdf_base64"] == "JVBERi0xLjQKJ..."
+
+
+def test_staff_job_status_not_found(client):
+    token = get_auth_token(client)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = client.get("/app/submit/staff/invalid-job-id", headers=headers)
+
+    assert response.status_code == 404
+    assert response.json["success"] is False
+
+
+def test_run_staff_job_retries_delivery():
+    from quyca.application.usecases.run_staff_job import RunStaffJobUseCase
+
+    files = {"1": b"excel-content"}
+    leases = []
+    jobs = {
+        "1": {
+            "filename": "staff.xlsx",
+            "institution": "TestInstitution",
+            "ror_id": "123",
+            "upload_date": "01/01/2025 10:00",
+            "user": "admin",
+            "email": "test@test.com",
+            "delivery": {
+                "email": {"status": "pending", "attempts": 0, "error": None},
+                "drive": {"status": "pending", "attempts": 0, "error": None},
+            },
+        }
+    }
+
+    class DummyJobRepo:
+        def claim_job(self, job_id, lease):
+            return jobs[job_id]
+
+        def renew_lease(self, job_id, lease):
+            leases.append(lease)
+
+        def update_job(self, job_id, values, unset=None):
+            jobs[job_id].update({key: value for key, value in values.items() if "." not in key})
+            for field in unset or []:
+                jobs[job_id].pop(field, None)
+
+        def get_file(self, job_id):
+            return files.get(job_id)
+
+        def delete_file(self, job_id):
+            files.pop(job_id, None)
+
+    class DummyNotification:
+        attempts = 0
+
+        def send_report(self, *args):
+            self.attempts += 1
+            return {"success": self.attempts > 1, "error": "Gmail unavailable"}
+
+    class DummyProcess:
+        notification_service = DummyNotification()
+
+        def build_report(self, *args):
+            return {"success": True, "errores": 0, "duplicados": 0, "pdf_base64": "JVBERi0xLjQKJ..."}, object(), []
+
+    class DummySave:
+        def execute(self, file, ror_id, institution, fallback=True):
+            return {"success": True, "msg": "Archivo guardado correctamente."}
+
+    RunStaffJobUseCase(DummyProcess(), DummySave(), DummyJobRepo(), max_attempts=3, retry_delay=0).execute("1")
+
+    job = jobs["1"]
+    assert job["status"] == "done"
+    assert "1" not in files
+    assert len(leases) == 3
+    assert job["result"]["pdf_base64"] == "JVBERi0xLjQKJ..."
+    assert job["delivery"]["email"] == {"status": "done", "attempts": 2, "error": None}
+    assert job["delivery"]["drive"]["status"] == "done"
+
+
+def test_file_repository_forgets_missing_folder(tmp_path):
+    import flask
+    import httplib2
+    from googleapiclient.errors import HttpError
+    from quyca.infrastructure.repositories.file_repository import FileRepository
+
+    class DummyDriveRepo:
+        folders = {"staff": "root", "123_TestInstitution": "deleted"}
+        invalidated = []
+
+        def get_or_create_folder(self, folder_name, parent_id=None):
+            return self.folders[folder_name]
+
+        def upload_file(self, filepath, filename, folder_id):
+            if folder_id == "deleted":
+                raise HttpError(httplib2.Response({"status": 404}), b"File not found")
+            return "https://drive.google.com/file"
+
+        def invalidate_folders(self, folder_ids):
+            self.invalidated.extend(folder_ids)
+            self.folders["123_TestInstitution"] = "created"
+
+    class DummyFile:
+        def save(self, path):
+            with open(path, "wb") as f:
+                f.write(b"test content")
+
+    drive_repo = DummyDriveRepo()
+    app = flask.Flask(__name__)
+    app.config["LOCAL_STORAGE_PATH"] = str(tmp_path)
+
+    with app.app_context():
+        result = FileRepository(drive_repo).save_file(DummyFile(), "123", "TestInstitution", "staff")
+
+    assert result["success"] is True
+    assert "almacenamiento local" not in result["msg"]
+    assert drive_repo.invalidated == ["deleted"]
+
+
+def test_file_repository_forgets_trashed_folders(tmp_path):
+    import flask
+    from quyca.domain.exceptions.trashed_folder_exception import TrashedFolderException
+    from quyca.infrastructure.repositories.file_repository import FileRepository
+
+    class DummyDriveRepo:
+        folders = {"staff": "trashed_root", "123_TestInstitution": "trashed_child"}
+        invalidated = []
+
+        def get_or_create_folder(self, folder_name, parent_id=None):
+            return self.folders[folder_name]
+
+        def upload_file(self, filepath, filename, folder_id):
+            if folder_id.startswith("trashed"):
+                raise TrashedFolderException("trashed")
+            return "https://drive.google.com/file"
+
+        def invalidate_folders(self, folder_ids):
+            self.invalidated.extend(folder_ids)
+            self.folders = {"staff": "root", "123_TestInstitution": "created"}
+
+    class DummyFile:
+        def save(self, path):
+            with open(path, "wb") as f:
+                f.write(b"test content")
+
+    drive_repo = DummyDriveRepo()
+    app = flask.Flask(__name__)
+    app.config["LOCAL_STORAGE_PATH"] = str(tmp_path)
+
+    with app.app_context():
+        result = FileRepository(drive_repo).save_file(DummyFile(), "123", "TestInstitution", "staff")
+
+    assert result["success"] is True
+    assert "almacenamiento local" not in result["msg"]
+    assert drive_repo.invalidated == ["trashed_root", "trashed_child"]
+
+
+def test_drive_repository_deletes_upload_to_trashed_folder(tmp_path):
+    import pytest
+    from quyca.domain.exceptions.trashed_folder_exception import TrashedFolderException
+    from quyca.infrastructure.repositories.google_drive_repository import GoogleDriveRepository
+
+    deleted = []
+
+    class DummyRequest:
+        def __init__(self, response):
+            self.response = response
+
+        def execute(self):
+            return self.response
+
+    class DummyFiles:
+        def create(self, body, media_body, fields, supportsAllDrives):
+            assert "trashed" in fields
+            return DummyRequest({"id": "file", "webViewLink": "https://drive.google.com/file", "trashed": True})
+
+        def delete(self, fileId, supportsAllDrives):
+            deleted.append(fileId)
+            return DummyRequest({})
+
+    class DummyService:
+        def files(self):
+            return DummyFiles()
+
+    drive_repo = GoogleDriveRepository.__new__(GoogleDriveRepository)
+    drive_repo.service = DummyService()
+    drive_repo.resolve_folder_id = lambda folder_id: folder_id
+    filepath = tmp_path / "staff.xlsx"
+    filepath.write_bytes(b"test content")
+
+    with pytest.raises(TrashedFolderException):
+        drive_repo.upload_file(str(filepath), "staff.xlsx", "folder")
+
+    assert deleted == ["file"]
@@ -0,0 +1,42 @@
+import pandas as pd
+
+from quyca.domain.validators.staff_validator import StaffValidator
+
+"""
+The column by column validation must give the same records, in the same order, as validating each row.
+"""
+
+
+def test_validate_dataframe_matches_validate_row():
+    df = pd.DataFrame(
+        {
+            "tipo_documento": ["Cédula de ciudadanía", "pasaporte", "otro", None],
+            "identificación": ["12a", "AB 12", 123, "456"],
+            "primer_apellido": ["Pérez", "G0mez", "", "López"],
+            "segundo_apellido": [None, "Ruiz", "O'Neil", "x1"],
+            "nombres": ["Ana", "Luis", "María José", float("nan")],
+            "nivel_académico": ["Doctorado", "bachiller", " pregrado ", None],
+            "tipo_contrato": ["Vinculado", "otro", "cátedra", "otro"],
+            "jornada_laboral": ["Tiempo completo", "noche", None, "medio tiempo"],
+            "categoría_laboral": ["Titular", "jefe", "auxiliar", None],
+            "sexo": ["Mujer", "otro", "", "hombre"],
+            "fecha_nacimiento": [pd.Timestamp("1980-01-01"), "1980-01-01", "01/02/1980", "31/02/1980"],
+            "fecha_inicial_vinculación": ["01/02/2010", None, "2010", "1/2/2010"],
+            "fecha_final_vinculación": [None, None, None, None],
+            "código_unidad_académica": ["123", "12-3", 45, None],
+            "unidad_académica": ["Facultad de Ingeniería", "Fac@", "Artes, Música", None],
+            "código_subunidad_académica": ["12_3", None, "x", "7"],
+            "subunidad_académica": ["Sistemas", None, "Química 2", "Física!"],
+        }
+    )
+    errors, warnings = [], []
+    for idx, row in df.iterrows():
+        result = StaffValidator.validate_row(row.to_dict(), idx)
+        errors.extend(result["errores"])
+        warnings.extend(result["advertencias"])
+
+    report = StaffValidator.validate_dataframe(df)
+
+    assert repr(report.errores) == repr(errors)
+    assert repr(report.advertencias) == repr(warnings)
+    assert report.total_errores == len(errors) > 0
@@ -1,3 +1,6 @@
+from urllib.parse import urlencode
+
+
 def test_search_works(client) -> None:
     response = client.get(f"/app/search/works?keywords=quantum&max=10&page=10&sort=citations_desc")
     assert response.status_code == 200
@@ -20,3 +23,21 @@ def test_search_works_without_keywords_with_filters(client) -> None:
         f"/app/search/works?max=10&page=10&product_type=scholar_article,scienti_Publicado en revista especializada"
     )
     assert response.status_code == 200
+
+
+def test_search_works_with_cursor(client) -> None:
+    params = {"keywords": "quantum", "max": 10, "sort": "year_desc"}
+    response = client.get("/app/search/works?" + urlencode({**params, "cursor": "*"}))
+    assert response.status_code == 200
+    next_cursor = response.get_json()["next_cursor"]
+    if next_cursor is None:
+        assert len(response.get_json()["data"]) < 10
+        return
+    response = client.get("/app/search/works?" + urlencode({**params, "cursor": next_cursor}))
+    assert response.status_code == 200
+
+
+def test_search_works_with_max_over_facet_limit(client) -> None:
+    response = client.get(f"/app/search/works?keywords=quantum&max=250&page=1")
+    assert response.status_code == 200
+    assert len(response.get_json()["data"]) <= 250